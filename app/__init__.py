@@ -109,16 +109,21 @@ def create_app(config_class=Config):
         if endpoint in _2FA_EXEMPT_ENDPOINTS or endpoint.startswith("static"):
             return
         # Check totp_enabled from DB
+        # Uses the request-scoped session (released in _remove_db_session)
         from app.database import SessionLocal
         from app.models import User
-        db = SessionLocal()
-        try:
-            user = db.query(User).filter(User.id == user_id).first()
-            if user and not user.totp_enabled:
-                flash("Pour la sécurité de votre compte, l'activation de l'A2F est obligatoire.", "warning")
-                return redirect(url_for("main.account"))
-        finally:
-            db.close()
+        user = SessionLocal().query(User).filter(User.id == user_id).first()
+        if user and not user.totp_enabled:
+            flash("Pour la sécurité de votre compte, l'activation de l'A2F est obligatoire.", "warning")
+            return redirect(url_for("main.account"))
+
+    # ── Request-scoped DB session ────────────────────────────────────────────
+    # SessionLocal is a scoped_session: every SessionLocal() call within one
+    # request returns the same session, released once here.
+    @app.teardown_appcontext
+    def _remove_db_session(exc):
+        from app.database import SessionLocal
+        SessionLocal.remove()
 
     # ── Security headers ─────────────────────────────────────────────────────
     @app.after_request
@@ -141,6 +146,10 @@ def create_app(config_class=Config):
         )
         return response
 
+    # Keep SQLite planner statistics fresh as tables grow
+    from app.database import start_optimize_timer
+    start_optimize_timer()
+
     # Import and register routes
     from app import routes
     app.register_blueprint(routes.bp)
@@ -154,12 +163,9 @@ def create_app(config_class=Config):
             from app.database import SessionLocal
             from app.models import User
             db = SessionLocal()
-            try:
-                admin_count = db.query(User).filter(
-                    User.role == "admin", User.is_active == True
-                ).count()
-            finally:
-                db.close()
+            admin_count = db.query(User).filter(
+                User.role == "admin", User.is_active == True
+            ).count()
             if admin_count == 0:
                 import sys
                 print(
@@ -46,15 +46,12 @@ def _check_authenticated_and_active():
         from app.database import SessionLocal
         from app.models import User
         db = SessionLocal()
-        try:
-            user = db.query(User).filter(User.id == user_id).first()
-            if not user or not user.is_active:
-                session.clear()
-                if request.is_json or request.headers.get("Accept") == "application/json":
-                    return jsonify({"error": "Account disabled"}), 403
-                return redirect(url_for("main.login"))
-        finally:
-            db.close()
+        user = db.query(User).filter(User.id == user_id).first()
+        if not user or not user.is_active:
+            session.clear()
+            if request.is_json or request.headers.get("Accept") == "application/json":
+                return jsonify({"error": "Account disabled"}), 403
+            return redirect(url_for("main.login"))
     return None
 
 
@@ -133,6 +130,4 @@ def check_credentials(username, password):
             return user.role, user.id, user.domain_id
     except Exception:
         pass
-    finally:
-        db.close()
     return None, None, None
@@ -4,6 +4,7 @@ Handles SQLite database initialization and provides session factory.
 """
 
 import os
+import threading
 from pathlib import Path
 from sqlalchemy import create_engine, event, text, inspect
 from sqlalchemy.orm import sessionmaker, scoped_session
@@ -24,12 +25,28 @@ engine = create_engine(
 )
 
 
+# Per-connection SQLite tuning. synchronous=NORMAL is durable under WAL and
+# avoids an fsync on every commit; the rest keep temp tables and hot pages in RAM.
+_SQLITE_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "mmap_size=268435456",   # 256 MB
+    "cache_size=-65536",     # 64 MB (negative = KiB)
+    "busy_timeout=30000",
+)
+_IS_MEMORY_DB = ":memory:" in Config.SQLALCHEMY_DATABASE_URI
+
+
 # Enable WAL mode and busy timeout for concurrent read/write support
 @event.listens_for(engine, "connect")
 def _set_sqlite_pragmas(dbapi_conn, connection_record):
     cursor = dbapi_conn.cursor()
-    cursor.execute("PRAGMA journal_mode=WAL")
-    cursor.execute("PRAGMA busy_timeout=30000")
+    for pragma in _SQLITE_PRAGMAS:
+        # WAL and mmap are meaningless for in-memory databases
+        if _IS_MEMORY_DB and pragma.startswith(("journal_mode", "mmap_size")):
+            continue
+        cursor.execute(f"PRAGMA {pragma}")
     cursor.close()
 
 
@@ -55,10 +72,48 @@ def init_db():
     # Auto-migrate: add missing columns to existing tables
     _migrate_columns()
 
+    # Refresh query-planner statistics after schema changes
+    optimize_db()
+
     print("[OK] Database initialized successfully!")
     print(f"[OK] Tables created: {', '.join(Base.metadata.tables.keys())}")
 
 
+# Interval between background PRAGMA optimize runs (seconds)
+OPTIMIZE_INTERVAL = 900
+_optimize_timer = None
+
+
+def optimize_db():
+    """Run SQLite's PRAGMA optimize to refresh planner statistics."""
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("PRAGMA optimize"))
+    except Exception as exc:
+        print(f"[WARN] PRAGMA optimize failed: {exc}")
+
+
+def start_optimize_timer(interval: int = OPTIMIZE_INTERVAL):
+    """
+    Schedule PRAGMA optimize every `interval` seconds on a daemon timer chain.
+    Safe to call more than once per process; only the first call starts a timer.
+    """
+    global _optimize_timer
+    if _optimize_timer is not None:
+        return
+
+    def _tick():
+        global _optimize_timer
+        optimize_db()
+        _optimize_timer = threading.Timer(interval, _tick)
+        _optimize_timer.daemon = True
+        _optimize_timer.start()
+
+    _optimize_timer = threading.Timer(interval, _tick)
+    _optimize_timer.daemon = True
+    _optimize_timer.start()
+
+
 def _migrate_columns():
     """Add missing columns to existing tables and backfill data."""
     insp = inspect(engine)
@@ -112,6 +167,32 @@ def _migrate_columns():
         except Exception:
             pass  # Index may already exist
 
+    # Add index on offers.found_date for the paginated dashboard's default sort
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_offers_found_date ON offers(found_date)"
+        ))
+
+    # Add index on offers.external_id for the scraper's duplicate lookups
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_offers_external_id ON offers(external_id)"
+        ))
+
+    # Add indexes on tracking columns used by dashboard/stats counts
+    if "tracking" in insp.get_table_names():
+        with engine.begin() as conn:
+            for ddl in (
+                "CREATE INDEX IF NOT EXISTS ix_tracking_status ON tracking(status)",
+                "CREATE INDEX IF NOT EXISTS ix_tracking_cv_sent ON tracking(cv_sent)",
+                "CREATE INDEX IF NOT EXISTS ix_tracking_follow_up_done ON tracking(follow_up_done)",
+                "CREATE INDEX IF NOT EXISTS ix_tracking_status_cv ON tracking(status, cv_sent)",
+                "CREATE INDEX IF NOT EXISTS ix_tracking_cv_sent_true ON tracking(id) WHERE cv_sent = 1",
+                "CREATE INDEX IF NOT EXISTS ix_tracking_follow_up_true ON tracking(id) WHERE follow_up_done = 1",
+                "CREATE INDEX IF NOT EXISTS ix_tracking_interview ON tracking(id) WHERE status = 'Interview'",
+            ):
+                conn.execute(text(ddl))
+
     # Migrate users table
     if "users" in insp.get_table_names():
         user_cols = [c["name"] for c in insp.get_columns("users")]
@@ -285,6 +366,18 @@ def _migrate_columns():
                 ))
             print("[MIGRATE] Done.")
 
+        # Partial indexes backing the per-user dashboard counters
+        with engine.begin() as conn:
+            for ddl in (
+                "CREATE INDEX IF NOT EXISTS ix_user_offers_cv_sent_true "
+                "ON user_offers(user_id) WHERE cv_sent = 1",
+                "CREATE INDEX IF NOT EXISTS ix_user_offers_follow_up_true "
+                "ON user_offers(user_id) WHERE follow_up_done = 1",
+                "CREATE INDEX IF NOT EXISTS ix_user_offers_interview "
+                "ON user_offers(user_id) WHERE status = 'Interview'",
+            ):
+                conn.execute(text(ddl))
+
     # Fix company names that are actually descriptions (> 50 chars of prose)
     with engine.begin() as conn:
         result = conn.execute(text(
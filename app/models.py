@@ -5,7 +5,7 @@ Defines the structure for offers and tracking tables.
 
 from datetime import datetime, timezone
 from sqlalchemy import (
-    Column, Integer, String, Text, Float, Boolean, DateTime, ForeignKey, UniqueConstraint
+    Column, Integer, String, Text, Float, Boolean, DateTime, ForeignKey, Index, UniqueConstraint
 )
 from sqlalchemy.orm import declarative_base, relationship
 
@@ -30,12 +30,12 @@ class Offer(Base):
 
     # Source tracking
     source = Column(String(50), nullable=False)  # france_travail, wttj, indeed, etc.
-    external_id = Column(String(255), nullable=True)  # ID from source for deduplication
+    external_id = Column(String(255), nullable=True, index=True)  # ID from source for deduplication
     offer_type = Column(String(20), nullable=False, default="job")  # job or recruiter
 
     # Dates
     posted_date = Column(DateTime, nullable=True)  # When posted by company
-    found_date = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))  # When scraped
+    found_date = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc), index=True)  # When scraped
 
     # Scoring
     relevance_score = Column(Float, nullable=True, default=0.0)
@@ -75,12 +75,13 @@ class Tracking(Base):
     status = Column(
         String(50),
         nullable=False,
-        default="New"
+        default="New",
+        index=True,
     )  # New, Applied, Followed up, Interview, Accepted, Rejected, No response
 
     # Checkboxes
-    cv_sent = Column(Boolean, nullable=False, default=False)
-    follow_up_done = Column(Boolean, nullable=False, default=False)
+    cv_sent = Column(Boolean, nullable=False, default=False, index=True)
+    follow_up_done = Column(Boolean, nullable=False, default=False, index=True)
 
     # Date fields
     date_sent = Column(DateTime, nullable=True)  # When CV was sent
@@ -96,6 +97,15 @@ class Tracking(Base):
     # Relationship
     offer = relationship("Offer", back_populates="tracking")
 
+    # Dashboard/stats counts filter on these columns. The partial indexes only
+    # hold the (usually few) rows each header counter actually counts.
+    __table_args__ = (
+        Index("ix_tracking_status_cv", "status", "cv_sent"),
+        Index("ix_tracking_cv_sent_true", "id", sqlite_where=cv_sent == True),
+        Index("ix_tracking_follow_up_true", "id", sqlite_where=follow_up_done == True),
+        Index("ix_tracking_interview", "id", sqlite_where=status == "Interview"),
+    )
+
     def __repr__(self):
         return f"<Tracking(id={self.id}, offer_id={self.offer_id}, status='{self.status}')>"
 
@@ -206,7 +216,13 @@ class UserOffer(Base):
     user = relationship("User", back_populates="user_offers")
     offer = relationship("Offer", back_populates="user_offers")
 
-    __table_args__ = (UniqueConstraint("user_id", "offer_id"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "offer_id"),
+        # Partial indexes backing the per-user dashboard counters
+        Index("ix_user_offers_cv_sent_true", "user_id", sqlite_where=cv_sent == True),
+        Index("ix_user_offers_follow_up_true", "user_id", sqlite_where=follow_up_done == True),
+        Index("ix_user_offers_interview", "user_id", sqlite_where=status == "Interview"),
+    )
 
     def __repr__(self):
         return f"<UserOffer(user_id={self.user_id}, offer_id={self.offer_id}, status='{self.status}')>"
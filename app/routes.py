@@ -8,6 +8,7 @@ import json
 import logging
 import math
 import os
+import re
 import secrets
 import time
 import threading
@@ -54,9 +55,10 @@ try:
 except ImportError:
     _HAS_FCNTL = False
 
-from flask import Blueprint, render_template, request, jsonify, session, redirect, url_for, send_file, flash
-from sqlalchemy import func, or_, text
-from sqlalchemy.orm import joinedload
+from flask import Blueprint, render_template, stream_template, request, jsonify, session, redirect, url_for, send_file, flash
+from sqlalchemy import Integer, case, cast, func, literal, null, or_, select, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import defer, joinedload
 
 from werkzeug.utils import secure_filename
 
@@ -73,6 +75,10 @@ bp = Blueprint('main', __name__)
 # Track application start time for /health uptime
 _APP_START_TIME = datetime.utcnow()
 
+# Target companies are fixed at startup: normalize once and match with one regex
+_TARGETS_NORM = tuple(normalize_text(c) for c in TARGET_COMPANIES)
+_TARGETS_RE = re.compile("|".join(re.escape(t) for t in _TARGETS_NORM) or r"(?!)")
+
 # ── Password policy ───────────────────────────────────────────────────────────
 
 def _validate_password(password: str) -> list[str]:
@@ -326,15 +332,12 @@ def login():
             # Check if 2FA is required for this DB user
             if user_id is not None:
                 db = SessionLocal()
-                try:
-                    _u = db.query(User).filter(User.id == user_id).first()
-                    if _u and _u.totp_enabled:
-                        session.clear()
-                        session["_2fa_uid"] = user_id
-                        session["_2fa_next"] = next_url
-                        return redirect(url_for("main.login_2fa"))
-                finally:
-                    db.close()
+                _u = db.query(User).filter(User.id == user_id).first()
+                if _u and _u.totp_enabled:
+                    session.clear()
+                    session["_2fa_uid"] = user_id
+                    session["_2fa_next"] = next_url
+                    return redirect(url_for("main.login_2fa"))
             # No 2FA — complete login immediately
             if user_id is not None:
                 _touch_last_login(user_id)
@@ -365,30 +368,27 @@ def login_2fa():
         import pyotp
         code = request.form.get("totp_code", "").strip().replace(" ", "")
         db = SessionLocal()
-        try:
-            user = db.query(User).filter(User.id == uid).first()
-            if user and user.totp_enabled and user.totp_secret:
-                totp = pyotp.TOTP(_decrypt_totp_secret(user.totp_secret))
-                if totp.verify(code, valid_window=0):
-                    next_url = session.pop("_2fa_next", None) or url_for("main.dashboard")
-                    uid_val       = user.id
-                    username_val  = user.username
-                    role_val      = user.role
-                    domain_id_val = user.domain_id
-                    _sec_log("2FA_SUCCESS", username_val)
-                    _touch_last_login(uid_val)
-                    session.clear()
-                    session["username"]  = username_val
-                    session["role"]      = role_val
-                    session["user_id"]   = uid_val
-                    session["domain_id"] = domain_id_val
-                    return redirect(next_url)
-                _sec_log("2FA_FAIL", user.username)
-                error = "Code A2F invalide. Vérifiez votre application et réessayez."
-            else:
-                return redirect(url_for("main.login"))
-        finally:
-            db.close()
+        user = db.query(User).filter(User.id == uid).first()
+        if user and user.totp_enabled and user.totp_secret:
+            totp = pyotp.TOTP(_decrypt_totp_secret(user.totp_secret))
+            if totp.verify(code, valid_window=0):
+                next_url = session.pop("_2fa_next", None) or url_for("main.dashboard")
+                uid_val       = user.id
+                username_val  = user.username
+                role_val      = user.role
+                domain_id_val = user.domain_id
+                _sec_log("2FA_SUCCESS", username_val)
+                _touch_last_login(uid_val)
+                session.clear()
+                session["username"]  = username_val
+                session["role"]      = role_val
+                session["user_id"]   = uid_val
+                session["domain_id"] = domain_id_val
+                return redirect(next_url)
+            _sec_log("2FA_FAIL", user.username)
+            error = "Code A2F invalide. Vérifiez votre application et réessayez."
+        else:
+            return redirect(url_for("main.login"))
 
     return render_template("login_2fa.html", error=error)
 
@@ -412,98 +412,95 @@ def register():
         return redirect(url_for("main.dashboard"))
 
     db = SessionLocal()
-    try:
-        domains = db.query(Domain).order_by(Domain.name).all()
-        errors = []
+    domains = db.query(Domain).order_by(Domain.name).all()
+    errors = []
 
-        if request.method == 'POST':
-            import re as _re
-            username = request.form.get("username", "").strip()
-            email = request.form.get("email", "").strip().lower()
-            password = request.form.get("password", "")
-            confirm = request.form.get("confirm_password", "")
-            domain_id_raw = request.form.get("domain_id", "").strip()
-            security_question = request.form.get("security_question", "").strip()
-            security_answer = request.form.get("security_answer", "").strip()
-
-            if not username:
-                errors.append("Nom d'utilisateur requis.")
-            elif len(username) > 64:
-                errors.append("Nom d'utilisateur trop long (max 64 caractères).")
-            elif not all(c.isalnum() or c in "-_." for c in username):
-                errors.append("L'identifiant ne peut contenir que des lettres, chiffres, tirets, points et underscores.")
-            if not email:
-                errors.append("Adresse email requise.")
-            elif not _re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', email):
-                errors.append("Adresse email invalide.")
-            elif len(email) > 255:
-                errors.append("Adresse email trop longue.")
-            if not password:
-                errors.append("Mot de passe requis.")
-            else:
-                errors.extend(_validate_password(password))
-            if password and password != confirm:
-                errors.append("Les mots de passe ne correspondent pas.")
-            if not domain_id_raw:
-                errors.append("Veuillez choisir un domaine.")
+    if request.method == 'POST':
+        import re as _re
+        username = request.form.get("username", "").strip()
+        email = request.form.get("email", "").strip().lower()
+        password = request.form.get("password", "")
+        confirm = request.form.get("confirm_password", "")
+        domain_id_raw = request.form.get("domain_id", "").strip()
+        security_question = request.form.get("security_question", "").strip()
+        security_answer = request.form.get("security_answer", "").strip()
+
+        if not username:
+            errors.append("Nom d'utilisateur requis.")
+        elif len(username) > 64:
+            errors.append("Nom d'utilisateur trop long (max 64 caractères).")
+        elif not all(c.isalnum() or c in "-_." for c in username):
+            errors.append("L'identifiant ne peut contenir que des lettres, chiffres, tirets, points et underscores.")
+        if not email:
+            errors.append("Adresse email requise.")
+        elif not _re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', email):
+            errors.append("Adresse email invalide.")
+        elif len(email) > 255:
+            errors.append("Adresse email trop longue.")
+        if not password:
+            errors.append("Mot de passe requis.")
+        else:
+            errors.extend(_validate_password(password))
+        if password and password != confirm:
+            errors.append("Les mots de passe ne correspondent pas.")
+        if not domain_id_raw:
+            errors.append("Veuillez choisir un domaine.")
+        else:
+            try:
+                domain_id_raw = int(domain_id_raw)
+            except ValueError:
+                errors.append("Domaine invalide.")
+                domain_id_raw = None
+        if not security_question or security_question not in SECURITY_QUESTIONS:
+            errors.append("Veuillez choisir une question de sécurité.")
+        if not security_answer:
+            errors.append("La réponse à la question de sécurité est requise.")
+        if not request.form.get("accept_terms"):
+            errors.append("Vous devez accepter les CGU et la Politique de confidentialité pour créer un compte.")
+
+        if not errors:
+            existing = db.query(User).filter(User.username == username).first()
+            if existing:
+                errors.append("Ce nom d'utilisateur est déjà pris.")
             else:
-                try:
-                    domain_id_raw = int(domain_id_raw)
-                except ValueError:
-                    errors.append("Domaine invalide.")
-                    domain_id_raw = None
-            if not security_question or security_question not in SECURITY_QUESTIONS:
-                errors.append("Veuillez choisir une question de sécurité.")
-            if not security_answer:
-                errors.append("La réponse à la question de sécurité est requise.")
-            if not request.form.get("accept_terms"):
-                errors.append("Vous devez accepter les CGU et la Politique de confidentialité pour créer un compte.")
+                existing_email = db.query(User).filter(User.email == email).first()
+                if existing_email:
+                    errors.append("Cette adresse email est déjà utilisée.")
 
-            if not errors:
-                existing = db.query(User).filter(User.username == username).first()
-                if existing:
-                    errors.append("Ce nom d'utilisateur est déjà pris.")
-                else:
-                    existing_email = db.query(User).filter(User.email == email).first()
-                    if existing_email:
-                        errors.append("Cette adresse email est déjà utilisée.")
-
-            if not errors:
-                    from app import bcrypt
-                    pw_hash = bcrypt.generate_password_hash(password).decode("utf-8")
-                    answer_hash = bcrypt.generate_password_hash(security_answer.lower()).decode("utf-8")
-                    new_user = User(
-                        username=username,
-                        password_hash=pw_hash,
-                        role="user",
-                        domain_id=domain_id_raw,
-                        email=email,
-                        is_active=False,
-                        email_confirmed=False,
-                        security_question=security_question,
-                        security_answer_hash=answer_hash,
-                    )
-                    db.add(new_user)
-                    db.flush()
-                    # Generate email confirmation token
-                    token = secrets.token_urlsafe(32)
-                    confirmation = EmailConfirmation(
-                        user_id=new_user.id,
-                        token=token,
-                    )
-                    db.add(confirmation)
-                    db.commit()
-                    # Send confirmation email
-                    confirm_url = url_for("main.confirm_email", token=token,
-                                          _external=True, _scheme='https')
-                    _send_confirmation_email(email, username, confirm_url)
-                    _sec_log("REGISTER", username, f"email={email}")
-                    return redirect(url_for("main.register_pending", uid=new_user.id))
-
-        return render_template("register.html", domains=domains, errors=errors,
-                               security_questions=SECURITY_QUESTIONS)
-    finally:
-        db.close()
+        if not errors:
+                from app import bcrypt
+                pw_hash = bcrypt.generate_password_hash(password).decode("utf-8")
+                answer_hash = bcrypt.generate_password_hash(security_answer.lower()).decode("utf-8")
+                new_user = User(
+                    username=username,
+                    password_hash=pw_hash,
+                    role="user",
+                    domain_id=domain_id_raw,
+                    email=email,
+                    is_active=False,
+                    email_confirmed=False,
+                    security_question=security_question,
+                    security_answer_hash=answer_hash,
+                )
+                db.add(new_user)
+                db.flush()
+                # Generate email confirmation token
+                token = secrets.token_urlsafe(32)
+                confirmation = EmailConfirmation(
+                    user_id=new_user.id,
+                    token=token,
+                )
+                db.add(confirmation)
+                db.commit()
+                # Send confirmation email
+                confirm_url = url_for("main.confirm_email", token=token,
+                                      _external=True, _scheme='https')
+                _send_confirmation_email(email, username, confirm_url)
+                _sec_log("REGISTER", username, f"email={email}")
+                return redirect(url_for("main.register_pending", uid=new_user.id))
+
+    return render_template("register.html", domains=domains, errors=errors,
+                           security_questions=SECURITY_QUESTIONS)
 
 
 @bp.route('/register/pending')
@@ -519,34 +516,31 @@ def register_pending():
 def confirm_email(token):
     """Confirm a user's email address via the token sent at registration."""
     db = SessionLocal()
-    try:
-        confirmation = db.query(EmailConfirmation).filter(
-            EmailConfirmation.token == token,
-            EmailConfirmation.used == False,
-        ).first()
-        if not confirmation:
-            return render_template("confirm_email.html",
-                                   error="Lien invalide ou déjà utilisé.")
-        # Check 24h expiry
-        from datetime import timezone as _tz
-        age = datetime.now(_tz.utc) - confirmation.created_at.replace(tzinfo=_tz.utc)
-        if age > timedelta(hours=24):
-            confirmation.used = True
-            db.commit()
-            return render_template("confirm_email.html",
-                                   error="Ce lien a expiré (validité 24 heures). Veuillez vous réinscrire.")
-        user = db.query(User).filter(User.id == confirmation.user_id).first()
-        if not user:
-            return render_template("confirm_email.html",
-                                   error="Compte introuvable.")
-        user.is_active = True
-        user.email_confirmed = True
+    confirmation = db.query(EmailConfirmation).filter(
+        EmailConfirmation.token == token,
+        EmailConfirmation.used == False,
+    ).first()
+    if not confirmation:
+        return render_template("confirm_email.html",
+                               error="Lien invalide ou déjà utilisé.")
+    # Check 24h expiry
+    from datetime import timezone as _tz
+    age = datetime.now(_tz.utc) - confirmation.created_at.replace(tzinfo=_tz.utc)
+    if age > timedelta(hours=24):
         confirmation.used = True
         db.commit()
-        _sec_log("EMAIL_CONFIRMED", user.username)
-        return redirect(url_for("main.login") + "?ok=email_confirmed")
-    finally:
-        db.close()
+        return render_template("confirm_email.html",
+                               error="Ce lien a expiré (validité 24 heures). Veuillez vous réinscrire.")
+    user = db.query(User).filter(User.id == confirmation.user_id).first()
+    if not user:
+        return render_template("confirm_email.html",
+                               error="Compte introuvable.")
+    user.is_active = True
+    user.email_confirmed = True
+    confirmation.used = True
+    db.commit()
+    _sec_log("EMAIL_CONFIRMED", user.username)
+    return redirect(url_for("main.login") + "?ok=email_confirmed")
 
 
 @bp.route('/api/resend-confirmation', methods=['POST'])
@@ -560,29 +554,26 @@ def resend_confirmation():
     if not uid:
         return jsonify({"error": "Paramètre manquant"}), 400
     db = SessionLocal()
-    try:
-        user = db.query(User).filter(User.id == uid).first()
-        if not user or user.email_confirmed or user.is_active:
-            # Don't reveal whether user exists
-            return jsonify({"ok": True, "message": "Si le compte existe, un email a été envoyé."})
-        if not user.email:
-            return jsonify({"error": "Aucune adresse email associée à ce compte."}), 400
-        # Invalidate old tokens
-        db.query(EmailConfirmation).filter(
-            EmailConfirmation.user_id == uid,
-            EmailConfirmation.used == False,
-        ).update({"used": True})
-        # Create new token
-        token = secrets.token_urlsafe(32)
-        confirmation = EmailConfirmation(user_id=uid, token=token)
-        db.add(confirmation)
-        db.commit()
-        confirm_url = url_for("main.confirm_email", token=token,
-                              _external=True, _scheme='https')
-        _send_confirmation_email(user.email, user.username, confirm_url)
-        return jsonify({"ok": True, "message": "Email de confirmation renvoyé."})
-    finally:
-        db.close()
+    user = db.query(User).filter(User.id == uid).first()
+    if not user or user.email_confirmed or user.is_active:
+        # Don't reveal whether user exists
+        return jsonify({"ok": True, "message": "Si le compte existe, un email a été envoyé."})
+    if not user.email:
+        return jsonify({"error": "Aucune adresse email associée à ce compte."}), 400
+    # Invalidate old tokens
+    db.query(EmailConfirmation).filter(
+        EmailConfirmation.user_id == uid,
+        EmailConfirmation.used == False,
+    ).update({"used": True})
+    # Create new token
+    token = secrets.token_urlsafe(32)
+    confirmation = EmailConfirmation(user_id=uid, token=token)
+    db.add(confirmation)
+    db.commit()
+    confirm_url = url_for("main.confirm_email", token=token,
+                          _external=True, _scheme='https')
+    _send_confirmation_email(user.email, user.username, confirm_url)
+    return jsonify({"ok": True, "message": "Email de confirmation renvoyé."})
 
 
 VALID_STATUSES = [
@@ -748,8 +739,8 @@ def _extract_text_from_bytes(raw: bytes, ext: str) -> str | None:
     """Extract plain text from raw file bytes.  Returns None on failure."""
     try:
         if ext == '.pdf':
-            import PyPDF2
-            reader = PyPDF2.PdfReader(io.BytesIO(raw))
+            import pypdf
+            reader = pypdf.PdfReader(io.BytesIO(raw))
             text = "\n".join(p.extract_text() or "" for p in reader.pages)
             return text.strip() or None
         elif ext == '.docx':
@@ -790,8 +781,8 @@ def _extract_doc_text(path: Path) -> str | None:
     ext = path.suffix.lower()
     try:
         if ext == '.pdf':
-            import PyPDF2
-            reader = PyPDF2.PdfReader(str(path))
+            import pypdf
+            reader = pypdf.PdfReader(str(path))
             text = "\n".join(p.extract_text() or "" for p in reader.pages)
             return text.strip() or None
         elif ext == '.docx':
@@ -875,20 +866,17 @@ def landing():
     if session.get("username"):
         return redirect(url_for("main.dashboard"))
     db = SessionLocal()
-    try:
-        total_offers = db.query(func.count(Offer.id)).scalar() or 0
-        sources_count = db.query(func.count(func.distinct(Offer.source))).scalar() or 0
-        domains = db.query(Domain).order_by(Domain.name).all()
-        domains_count = len(domains)
-        return render_template(
-            'landing.html',
-            total_offers=total_offers,
-            sources_count=sources_count,
-            domains_count=domains_count,
-            domains=domains,
-        )
-    finally:
-        db.close()
+    total_offers = db.query(func.count(Offer.id)).scalar() or 0
+    sources_count = db.query(func.count(func.distinct(Offer.source))).scalar() or 0
+    domains = db.query(Domain).order_by(Domain.name).all()
+    domains_count = len(domains)
+    return render_template(
+        'landing.html',
+        total_offers=total_offers,
+        sources_count=sources_count,
+        domains_count=domains_count,
+        domains=domains,
+    )
 
 
 @bp.route('/dashboard')
@@ -902,338 +890,379 @@ def dashboard():
     db = SessionLocal()
     user_id = session.get("user_id")
     domain_id = session.get("domain_id")
-    try:
-        # ── Parse pagination ───────────────────────────────────────────
-        page = max(1, request.args.get('page', 1, type=int))
-        per_page = min(100, max(10, request.args.get('per_page', 50, type=int)))
-
-        # ── Parse filters ──────────────────────────────────────────────
-        f_status = request.args.get('status', '').strip()
-        f_source = request.args.get('source', '').strip()
-        f_domain_filter = request.args.get('domain', '').strip()
-        f_company = request.args.get('company', '').strip()
-        f_location = request.args.get('location', '').strip()
-        f_contract = request.args.get('contract', '').strip()
-        f_search = request.args.get('search', '').strip()
-        f_show_all = request.args.get('show_all', '') == '1'
-        f_show_recruiters = request.args.get('show_recruiters', '') == '1'
-        f_favorites = request.args.get('favorites', '') == '1'
-        f_cv_sent = request.args.get('cv_sent', '') == '1'
-        f_show_dismissed = request.args.get('show_dismissed', '') == '1'
-        f_sort = request.args.get('sort', '').strip()
-        f_order = request.args.get('order', '').strip()
-        sort_explicit = bool(f_sort)
-
-        # Validate
-        if f_status and f_status not in VALID_STATUSES:
-            f_status = ''
-        if f_sort and f_sort not in ('title', 'company', 'location', 'source', 'date', 'score', 'cv_score', 'found_date'):
-            f_sort = ''  # resolved below after we know if CV scores exist
-        if f_order not in ('asc', 'desc'):
-            f_order = 'desc'
-
-        # ── Base query with tracking join ──────────────────────────────
-        query = db.query(Offer)
-        if domain_id:
-            query = query.filter(Offer.domain_id == domain_id)
+    # ── Parse pagination ───────────────────────────────────────────
+    page = max(1, request.args.get('page', 1, type=int))
+    per_page = min(100, max(10, request.args.get('per_page', 50, type=int)))
+
+    # ── Parse filters ──────────────────────────────────────────────
+    f_status = request.args.get('status', '').strip()
+    f_source = request.args.get('source', '').strip()
+    f_domain_filter = request.args.get('domain', '').strip()
+    f_company = request.args.get('company', '').strip()
+    f_location = request.args.get('location', '').strip()
+    f_contract = request.args.get('contract', '').strip()
+    f_search = request.args.get('search', '').strip()
+    f_show_all = request.args.get('show_all', '') == '1'
+    f_show_recruiters = request.args.get('show_recruiters', '') == '1'
+    f_favorites = request.args.get('favorites', '') == '1'
+    f_cv_sent = request.args.get('cv_sent', '') == '1'
+    f_show_dismissed = request.args.get('show_dismissed', '') == '1'
+    f_sort = request.args.get('sort', '').strip()
+    f_order = request.args.get('order', '').strip()
+    sort_explicit = bool(f_sort)
+
+    # Validate
+    if f_status and f_status not in VALID_STATUSES:
+        f_status = ''
+    if f_sort and f_sort not in ('title', 'company', 'location', 'source', 'date', 'score', 'cv_score', 'found_date'):
+        f_sort = ''  # resolved below after we know if CV scores exist
+    if f_order not in ('asc', 'desc'):
+        f_order = 'desc'
+
+    # ── Base query with tracking join ──────────────────────────────
+    query = db.query(Offer)
+    if domain_id:
+        query = query.filter(Offer.domain_id == domain_id)
 
-        if user_id is not None:
-            query = query.outerjoin(
-                UserOffer,
-                (UserOffer.offer_id == Offer.id) & (UserOffer.user_id == user_id)
-            )
-        else:
-            query = query.outerjoin(Tracking)
+    if user_id is not None:
+        query = query.outerjoin(
+            UserOffer,
+            (UserOffer.offer_id == Offer.id) & (UserOffer.user_id == user_id)
+        )
+    else:
+        query = query.outerjoin(Tracking)
 
-        # ── Compute target IDs (lightweight query) ─────────────────────
-        targets_norm = [normalize_text(c) for c in TARGET_COMPANIES]
-        company_q = db.query(Offer.id, Offer.company)
-        if domain_id:
-            company_q = company_q.filter(Offer.domain_id == domain_id)
-        target_ids = set()
-        for oid, comp in company_q:
-            co = normalize_text(comp or "")
-            for t in targets_norm:
-                if t in co:
-                    target_ids.add(oid)
-                    break
-
-        # ── Hide inactive offers ──────────────────────────────────────
-        query = query.filter(Offer.is_active == True)
-
-        # ── Apply filters ──────────────────────────────────────────────
-        if not f_show_recruiters:
-            query = query.filter(Offer.offer_type != 'recruiter')
-
-        if not f_show_all:
-            if target_ids:
-                query = query.filter(Offer.id.in_(target_ids))
-            else:
-                query = query.filter(Offer.id == -1)
+    # ── Domain-wide aggregates (targets, stats, sources; TTL-cached) ──
+    aggregates = _dashboard_aggregates(db, user_id, domain_id)
+    target_companies = aggregates['target_companies']
 
-        if f_source:
-            query = query.filter(Offer.source == f_source)
+    # ── Hide inactive offers ──────────────────────────────────────
+    query = query.filter(Offer.is_active == True)
 
-        if f_domain_filter:
-            try:
-                query = query.filter(Offer.domain_id == int(f_domain_filter))
-            except ValueError:
-                pass
+    # ── Apply filters ──────────────────────────────────────────────
+    if not f_show_recruiters:
+        query = query.filter(Offer.offer_type != 'recruiter')
 
-        if f_company:
-            query = query.filter(Offer.company.ilike(f'%{f_company}%'))
-
-        if f_location:
-            query = query.filter(Offer.location.ilike(f'%{f_location}%'))
-
-        if f_contract:
-            if f_contract == 'CDI':
-                query = query.filter(Offer.contract_type.ilike('%cdi%'))
-            elif f_contract == 'CDD':
-                query = query.filter(Offer.contract_type.ilike('%cdd%'))
-            elif f_contract == 'Alternance':
-                query = query.filter(
-                    or_(Offer.contract_type.ilike('%altern%'),
-                        Offer.contract_type.ilike('%apprenti%'))
-                )
-            elif f_contract == 'Stage':
-                query = query.filter(Offer.contract_type.ilike('%stage%'))
-            elif f_contract == 'Autre':
-                query = query.filter(
-                    Offer.contract_type.isnot(None),
-                    ~Offer.contract_type.ilike('%cdi%'),
-                    ~Offer.contract_type.ilike('%cdd%'),
-                    ~Offer.contract_type.ilike('%altern%'),
-                    ~Offer.contract_type.ilike('%apprenti%'),
-                    ~Offer.contract_type.ilike('%stage%'),
-                )
+    if not f_show_all:
+        if target_companies:
+            query = query.filter(Offer.company.in_(target_companies))
+        else:
+            query = query.filter(Offer.id == -1)
 
-        if f_search:
-            pattern = f'%{f_search}%'
-            query = query.filter(
-                or_(Offer.title.ilike(pattern),
-                    Offer.company.ilike(pattern),
-                    Offer.location.ilike(pattern))
-            )
+    if f_source:
+        query = query.filter(Offer.source == f_source)
 
-        if f_status:
-            if user_id is not None:
-                if f_status == 'New':
-                    query = query.filter(or_(UserOffer.status == 'New', UserOffer.status.is_(None)))
-                else:
-                    query = query.filter(UserOffer.status == f_status)
-            else:
-                if f_status == 'New':
-                    query = query.filter(or_(Tracking.status == 'New', Tracking.status.is_(None)))
-                else:
-                    query = query.filter(Tracking.status == f_status)
+    if f_domain_filter:
+        try:
+            query = query.filter(Offer.domain_id == int(f_domain_filter))
+        except ValueError:
+            pass
 
-        if f_favorites and user_id is not None:
-            query = query.filter(UserOffer.is_favorite == True)
+    if f_company:
+        query = query.filter(Offer.company.ilike(f'%{f_company}%'))
 
-        if f_cv_sent:
-            if user_id is not None:
-                query = query.filter(UserOffer.cv_sent == True)
-            else:
-                query = query.filter(Tracking.cv_sent == True)
+    if f_location:
+        query = query.filter(Offer.location.ilike(f'%{f_location}%'))
 
-        # ── Hide dismissed offers by default ───────────────────────────
-        if not f_show_dismissed and user_id is not None:
+    if f_contract:
+        if f_contract == 'CDI':
+            query = query.filter(Offer.contract_type.ilike('%cdi%'))
+        elif f_contract == 'CDD':
+            query = query.filter(Offer.contract_type.ilike('%cdd%'))
+        elif f_contract == 'Alternance':
             query = query.filter(
-                or_(UserOffer.status.is_(None), UserOffer.status != 'Dismissed')
+                or_(Offer.contract_type.ilike('%altern%'),
+                    Offer.contract_type.ilike('%apprenti%'))
+            )
+        elif f_contract == 'Stage':
+            query = query.filter(Offer.contract_type.ilike('%stage%'))
+        elif f_contract == 'Autre':
+            query = query.filter(
+                Offer.contract_type.isnot(None),
+                ~Offer.contract_type.ilike('%cdi%'),
+                ~Offer.contract_type.ilike('%cdd%'),
+                ~Offer.contract_type.ilike('%altern%'),
+                ~Offer.contract_type.ilike('%apprenti%'),
+                ~Offer.contract_type.ilike('%stage%'),
             )
 
-        # ── Count + pagination ─────────────────────────────────────────
-        total_offers = query.count()
-        total_pages = max(1, math.ceil(total_offers / per_page))
-        if page > total_pages:
-            page = total_pages
-
-        # ── Resolve default sort (when no explicit sort param) ──────────
-        if not sort_explicit:
-            # Default: cv_match_score desc if user has any scores
-            has_scores = False
-            if user_id is not None:
-                has_scores = db.query(UserOffer.id).filter(
-                    UserOffer.user_id == user_id,
-                    UserOffer.cv_match_score.isnot(None),
-                ).limit(1).first() is not None
-            else:
-                score_q = db.query(Offer.id).filter(
-                    Offer.cv_match_score.isnot(None),
-                )
-                if domain_id:
-                    score_q = score_q.filter(Offer.domain_id == domain_id)
-                has_scores = score_q.limit(1).first() is not None
+    if f_search:
+        pattern = f'%{f_search}%'
+        query = query.filter(
+            or_(Offer.title.ilike(pattern),
+                Offer.company.ilike(pattern),
+                Offer.location.ilike(pattern))
+        )
 
-            if has_scores:
-                f_sort = 'cv_score'
+    if f_status:
+        if user_id is not None:
+            if f_status == 'New':
+                query = query.filter(or_(UserOffer.status == 'New', UserOffer.status.is_(None)))
             else:
-                f_sort = 'found_date'
-            f_order = 'desc'
-
-        # ── Sort ───────────────────────────────────────────────────────
-        sort_map = {
-            'title': Offer.title,
-            'company': Offer.company,
-            'location': Offer.location,
-            'source': Offer.source,
-            'date': Offer.posted_date,
-            'score': Offer.relevance_score,
-            'found_date': Offer.found_date,
-        }
-        if f_sort == 'cv_score':
-            sort_col = UserOffer.cv_match_score if user_id is not None else Offer.cv_match_score
-        else:
-            sort_col = sort_map.get(f_sort, Offer.relevance_score)
-
-        if f_order == 'desc':
-            query = query.order_by(sort_col.desc(), Offer.id.desc())
+                query = query.filter(UserOffer.status == f_status)
         else:
-            query = query.order_by(sort_col.asc(), Offer.id.asc())
+            if f_status == 'New':
+                query = query.filter(or_(Tracking.status == 'New', Tracking.status.is_(None)))
+            else:
+                query = query.filter(Tracking.status == f_status)
 
-        # ── Fetch page ─────────────────────────────────────────────────
-        offset = (page - 1) * per_page
-        offers = query.offset(offset).limit(per_page).all()
+    if f_favorites and user_id is not None:
+        query = query.filter(UserOffer.is_favorite == True)
 
-        # ── Build user_offers_map for current page ─────────────────────
-        offer_ids = [o.id for o in offers]
-        if user_id is None:
-            if offer_ids:
-                tracked = db.query(Offer).options(
-                    joinedload(Offer.tracking)
-                ).filter(Offer.id.in_(offer_ids)).all()
-                offers_dict = {o.id: o for o in tracked}
-                offers = [offers_dict[oid] for oid in offer_ids if oid in offers_dict]
-            user_offers_map = {o.id: o.tracking for o in offers if o.tracking}
+    if f_cv_sent:
+        if user_id is not None:
+            query = query.filter(UserOffer.cv_sent == True)
         else:
-            if offer_ids:
-                user_offer_rows = db.query(UserOffer).filter(
-                    UserOffer.user_id == user_id,
-                    UserOffer.offer_id.in_(offer_ids),
-                ).all()
-            else:
-                user_offer_rows = []
-            user_offers_map = {uo.offer_id: uo for uo in user_offer_rows}
+            query = query.filter(Tracking.cv_sent == True)
 
-        # ── Stats (domain-wide, not affected by filters) ───────────────
-        total_domain_count = db.query(func.count(Offer.id)).filter(Offer.is_active == True)
-        if domain_id:
-            total_domain_count = total_domain_count.filter(Offer.domain_id == domain_id)
-        total_domain_count = total_domain_count.scalar()
+    # ── Hide dismissed offers by default ───────────────────────────
+    if not f_show_dismissed and user_id is not None:
+        query = query.filter(
+            or_(UserOffer.status.is_(None), UserOffer.status != 'Dismissed')
+        )
+
+    # ── Count + pagination ─────────────────────────────────────────
+    total_offers = query.count()
+    total_pages = max(1, math.ceil(total_offers / per_page))
+    if page > total_pages:
+        page = total_pages
 
+    # ── Resolve default sort (when no explicit sort param) ──────────
+    if not sort_explicit:
+        # Default: cv_match_score desc if user has any scores
+        has_scores = False
         if user_id is not None:
-            stats_q = db.query(UserOffer).filter(UserOffer.user_id == user_id)
-            if domain_id:
-                stats_q = stats_q.join(Offer).filter(Offer.domain_id == domain_id)
-            cv_sent_count = stats_q.filter(UserOffer.cv_sent == True).count()
-            follow_up_count = stats_q.filter(UserOffer.follow_up_done == True).count()
-            interview_count = stats_q.filter(UserOffer.status == 'Interview').count()
+            has_scores = db.query(UserOffer.id).filter(
+                UserOffer.user_id == user_id,
+                UserOffer.cv_match_score.isnot(None),
+            ).limit(1).first() is not None
         else:
-            stats_q = db.query(Tracking)
+            score_q = db.query(Offer.id).filter(
+                Offer.cv_match_score.isnot(None),
+            )
             if domain_id:
-                stats_q = stats_q.join(Offer).filter(Offer.domain_id == domain_id)
-            cv_sent_count = stats_q.filter(Tracking.cv_sent == True).count()
-            follow_up_count = stats_q.filter(Tracking.follow_up_done == True).count()
-            interview_count = stats_q.filter(Tracking.status == 'Interview').count()
+                score_q = score_q.filter(Offer.domain_id == domain_id)
+            has_scores = score_q.limit(1).first() is not None
 
-        stats = {
-            'total_offers': total_domain_count,
-            'cv_sent': cv_sent_count,
-            'follow_ups': follow_up_count,
-            'interviews': interview_count,
-        }
+        if has_scores:
+            f_sort = 'cv_score'
+        else:
+            f_sort = 'found_date'
+        f_order = 'desc'
+
+    # ── Sort ───────────────────────────────────────────────────────
+    sort_map = {
+        'title': Offer.title,
+        'company': Offer.company,
+        'location': Offer.location,
+        'source': Offer.source,
+        'date': Offer.posted_date,
+        'score': Offer.relevance_score,
+        'found_date': Offer.found_date,
+    }
+    if f_sort == 'cv_score':
+        sort_col = UserOffer.cv_match_score if user_id is not None else Offer.cv_match_score
+    else:
+        sort_col = sort_map.get(f_sort, Offer.relevance_score)
 
-        # ── Sources for dropdown (domain-scoped, unfiltered) ───────────
-        sources_q = db.query(Offer.source).distinct()
-        if domain_id:
-            sources_q = sources_q.filter(Offer.domain_id == domain_id)
-        sources = sorted([r[0] for r in sources_q.all()])
+    if f_order == 'desc':
+        query = query.order_by(sort_col.desc(), Offer.id.desc())
+    else:
+        query = query.order_by(sort_col.asc(), Offer.id.asc())
+
+    # ── Fetch page (the table never shows descriptions) ────────────
+    offset = (page - 1) * per_page
+    offers = query.options(defer(Offer.description)).offset(offset).limit(per_page).all()
+    target_ids = {o.id for o in offers if o.company in target_companies}
+
+    # ── Build user_offers_map for current page ─────────────────────
+    offer_ids = [o.id for o in offers]
+    if user_id is None:
+        if offer_ids:
+            tracked = db.query(Offer).options(
+                joinedload(Offer.tracking), defer(Offer.description)
+            ).filter(Offer.id.in_(offer_ids)).all()
+            offers_dict = {o.id: o for o in tracked}
+            offers = [offers_dict[oid] for oid in offer_ids if oid in offers_dict]
+        user_offers_map = {o.id: o.tracking for o in offers if o.tracking}
+    else:
+        if offer_ids:
+            user_offer_rows = db.query(UserOffer).filter(
+                UserOffer.user_id == user_id,
+                UserOffer.offer_id.in_(offer_ids),
+            ).all()
+        else:
+            user_offer_rows = []
+        user_offers_map = {uo.offer_id: uo for uo in user_offer_rows}
 
-        has_cv = _has_cv_file(user_id)
-        cutoff_new = datetime.utcnow() - timedelta(hours=24)
+    has_cv = _has_cv_file(user_id)
+    cutoff_new = datetime.utcnow() - timedelta(hours=24)
 
-        admin_domains = []
-        if not domain_id:
-            admin_domains = db.query(Domain).order_by(Domain.name).all()
+    admin_domains = []
+    if not domain_id:
+        admin_domains = db.query(Domain).order_by(Domain.name).all()
 
-        user_quota = _get_user_quota(user_id)
+    user_quota = _get_user_quota(user_id)
 
-        # ── Show welcome guide for new users ───────────────────────────
-        show_guide = False
-        if user_id is not None:
-            _u = db.query(User).filter(User.id == user_id).first()
-            if _u and not _u.has_seen_guide:
-                show_guide = True
-
-        # ── Filters dict for template ──────────────────────────────────
-        filters = {
-            'status': f_status,
-            'source': f_source,
-            'domain': f_domain_filter,
-            'company': f_company,
-            'location': f_location,
-            'contract': f_contract,
-            'search': f_search,
-            'show_all': f_show_all,
-            'show_recruiters': f_show_recruiters,
-            'favorites': f_favorites,
-            'cv_sent': f_cv_sent,
-            'show_dismissed': f_show_dismissed,
-            'sort': f_sort,
-            'order': f_order,
-        }
-
-        # Query string for pagination links (all params except page)
-        pagination_params = urlencode({k: v for k, v in {
-            'per_page': str(per_page) if per_page != 50 else '',
-            'status': f_status,
-            'source': f_source,
-            'domain': f_domain_filter,
-            'company': f_company,
-            'location': f_location,
-            'contract': f_contract,
-            'search': f_search,
-            'show_all': '1' if f_show_all else '',
-            'show_recruiters': '1' if f_show_recruiters else '',
-            'favorites': '1' if f_favorites else '',
-            'cv_sent': '1' if f_cv_sent else '',
-            'show_dismissed': '1' if f_show_dismissed else '',
-            'sort': f_sort if sort_explicit else '',
-            'order': f_order if sort_explicit else '',
-        }.items() if v})
-
-        page_range = _make_page_range(page, total_pages)
-        start_item = (page - 1) * per_page + 1 if total_offers > 0 else 0
-        end_item = min(page * per_page, total_offers)
-
-        return render_template(
-            'dashboard.html',
-            offers=offers,
-            user_offers_map=user_offers_map,
-            stats=stats,
-            sources=sources,
-            statuses=VALID_STATUSES,
-            target_ids=target_ids,
-            has_cv=has_cv,
-            cutoff_new=cutoff_new,
-            role=get_current_role(),
-            username=session.get("username"),
-            admin_domains=admin_domains,
-            user_quota=user_quota,
-            page=page,
-            per_page=per_page,
-            total_pages=total_pages,
-            total_offers=total_offers,
-            filters=filters,
-            pagination_params=pagination_params,
-            page_range=page_range,
-            start_item=start_item,
-            end_item=end_item,
-            show_guide=show_guide,
-        )
-    finally:
-        db.close()
+    # ── Show welcome guide for new users ───────────────────────────
+    show_guide = False
+    if user_id is not None:
+        _u = db.query(User).filter(User.id == user_id).first()
+        if _u and not _u.has_seen_guide:
+            show_guide = True
+
+    # ── Filters dict for template ──────────────────────────────────
+    filters = {
+        'status': f_status,
+        'source': f_source,
+        'domain': f_domain_filter,
+        'company': f_company,
+        'location': f_location,
+        'contract': f_contract,
+        'search': f_search,
+        'show_all': f_show_all,
+        'show_recruiters': f_show_recruiters,
+        'favorites': f_favorites,
+        'cv_sent': f_cv_sent,
+        'show_dismissed': f_show_dismissed,
+        'sort': f_sort,
+        'order': f_order,
+    }
+
+    # Query string for pagination links (all params except page)
+    pagination_params = urlencode({k: v for k, v in {
+        'per_page': str(per_page) if per_page != 50 else '',
+        'status': f_status,
+        'source': f_source,
+        'domain': f_domain_filter,
+        'company': f_company,
+        'location': f_location,
+        'contract': f_contract,
+        'search': f_search,
+        'show_all': '1' if f_show_all else '',
+        'show_recruiters': '1' if f_show_recruiters else '',
+        'favorites': '1' if f_favorites else '',
+        'cv_sent': '1' if f_cv_sent else '',
+        'show_dismissed': '1' if f_show_dismissed else '',
+        'sort': f_sort if sort_explicit else '',
+        'order': f_order if sort_explicit else '',
+    }.items() if v})
+
+    page_range = _make_page_range(page, total_pages)
+    start_item = (page - 1) * per_page + 1 if total_offers > 0 else 0
+    end_item = min(page * per_page, total_offers)
+
+    return render_template(
+        'dashboard.html',
+        offers=offers,
+        user_offers_map=user_offers_map,
+        stats=aggregates['stats'],
+        sources=aggregates['sources'],
+        statuses=VALID_STATUSES,
+        target_ids=target_ids,
+        target_count=aggregates['target_count'],
+        has_cv=has_cv,
+        cutoff_new=cutoff_new,
+        role=get_current_role(),
+        username=session.get("username"),
+        admin_domains=admin_domains,
+        user_quota=user_quota,
+        page=page,
+        per_page=per_page,
+        total_pages=total_pages,
+        total_offers=total_offers,
+        filters=filters,
+        pagination_params=pagination_params,
+        page_range=page_range,
+        start_item=start_item,
+        end_item=end_item,
+        show_guide=show_guide,
+    )
+
+
+# ── Dashboard aggregate cache ─────────────────────────────────────────────────
+# Per-process cache of the domain-wide dashboard numbers, keyed by
+# (user_id, domain_id). Entries expire after _DASHBOARD_CACHE_TTL seconds or
+# as soon as a tracking write bumps _dashboard_cache_version.
+_DASHBOARD_CACHE_TTL = 10
+_dashboard_cache: dict = {}
+_dashboard_cache_version = 0
+_dashboard_cache_lock = threading.Lock()
+
+
+def _invalidate_dashboard_cache() -> None:
+    """Drop cached dashboard aggregates after a tracking write."""
+    global _dashboard_cache_version
+    with _dashboard_cache_lock:
+        _dashboard_cache_version += 1
+        _dashboard_cache.clear()
+
+
+def _dashboard_aggregates(db, user_id, domain_id) -> dict:
+    """
+    Return the filter-independent dashboard data, served from a short TTL cache:
+    target_companies, target_count, stats (header counters) and sources.
+    """
+    key = (user_id, domain_id)
+    now = time.monotonic()
+    with _dashboard_cache_lock:
+        version = _dashboard_cache_version
+        cached = _dashboard_cache.get(key)
+        if cached and cached[0] > now and cached[1] == version:
+            return cached[2]
+
+    # Target companies (one row per distinct company)
+    company_q = db.query(Offer.company, func.count(Offer.id)).group_by(Offer.company)
+    if domain_id:
+        company_q = company_q.filter(Offer.domain_id == domain_id)
+    target_companies = set()
+    target_count = 0
+    for comp, n in company_q:
+        if _TARGETS_RE.search(normalize_text(comp or "")):
+            target_companies.add(comp)
+            target_count += n
+
+    # Stats (domain-wide, not affected by filters)
+    total_domain_count = db.query(func.count(Offer.id)).filter(Offer.is_active == True)
+    if domain_id:
+        total_domain_count = total_domain_count.filter(Offer.domain_id == domain_id)
+    total_domain_count = total_domain_count.scalar()
+
+    if user_id is not None:
+        stats_q = db.query(UserOffer).filter(UserOffer.user_id == user_id)
+        if domain_id:
+            stats_q = stats_q.join(Offer).filter(Offer.domain_id == domain_id)
+        cv_sent_count = stats_q.filter(UserOffer.cv_sent == True).count()
+        follow_up_count = stats_q.filter(UserOffer.follow_up_done == True).count()
+        interview_count = stats_q.filter(UserOffer.status == 'Interview').count()
+    else:
+        stats_q = db.query(Tracking)
+        if domain_id:
+            stats_q = stats_q.join(Offer).filter(Offer.domain_id == domain_id)
+        cv_sent_count = stats_q.filter(Tracking.cv_sent == True).count()
+        follow_up_count = stats_q.filter(Tracking.follow_up_done == True).count()
+        interview_count = stats_q.filter(Tracking.status == 'Interview').count()
+
+    # Sources for dropdown (domain-scoped, unfiltered)
+    sources_q = db.query(Offer.source).distinct()
+    if domain_id:
+        sources_q = sources_q.filter(Offer.domain_id == domain_id)
+
+    result = {
+        'target_companies': target_companies,
+        'target_count': target_count,
+        'stats': {
+            'total_offers': total_domain_count,
+            'cv_sent': cv_sent_count,
+            'follow_ups': follow_up_count,
+            'interviews': interview_count,
+        },
+        'sources': sorted([r[0] for r in sources_q.all()]),
+    }
+    with _dashboard_cache_lock:
+        if _dashboard_cache_version == version:
+            _dashboard_cache[key] = (now + _DASHBOARD_CACHE_TTL, version, result)
+    return result
 
 
 def _make_page_range(page, total_pages, window=2):
@@ -1261,6 +1290,9 @@ def update_tracking(offer_id):
     Accepts JSON with any combination of: status, cv_sent, follow_up_done,
     date_sent, follow_up_date, notes.
     DB users use UserOffer; config/legacy admin uses Tracking.
+
+    Runs as a single INSERT ... SELECT FROM offers ... ON CONFLICT DO UPDATE
+    ... RETURNING statement: no row back means the offer does not exist.
     """
     if session.get("role") == "viewer":
         return jsonify({"error": "Accès réservé"}), 403
@@ -1269,58 +1301,76 @@ def update_tracking(offer_id):
     db = SessionLocal()
     user_id = session.get("user_id")
     try:
-        t_q0 = time.perf_counter()
+        data = request.get_json()
+        now = datetime.utcnow()
+
         if user_id is not None:
-            tracking = db.query(UserOffer).filter(
-                UserOffer.user_id == user_id,
-                UserOffer.offer_id == offer_id,
-            ).first()
-            if not tracking:
-                offer_exists = db.query(Offer.id).filter(Offer.id == offer_id).scalar()
-                if not offer_exists:
-                    return jsonify({'error': 'Offer not found'}), 404
-                tracking = UserOffer(user_id=user_id, offer_id=offer_id, status='New')
-                db.add(tracking)
+            table = UserOffer.__table__
+            conflict_cols = ['user_id', 'offer_id']
+            values = {'user_id': user_id, 'is_favorite': False}
         else:
-            tracking = db.query(Tracking).filter(Tracking.offer_id == offer_id).first()
-            if not tracking:
-                offer_exists = db.query(Offer.id).filter(Offer.id == offer_id).scalar()
-                if not offer_exists:
-                    return jsonify({'error': 'Offer not found'}), 404
-                tracking = Tracking(offer_id=offer_id, status='New')
-                db.add(tracking)
-        t_q1 = time.perf_counter()
-
-        data = request.get_json()
+            table = Tracking.__table__
+            conflict_cols = ['offer_id']
+            values = {}
+
+        # Values for a brand-new row, and the SET clause for an existing one
+        values.update({
+            'offer_id': offer_id,
+            'status': 'New',
+            'cv_sent': False,
+            'follow_up_done': False,
+            'date_sent': None,
+            'follow_up_date': None,
+            'notes': None,
+            'created_at': now,
+            'updated_at': now,
+        })
+        set_ = {'updated_at': now}
 
-        t_upd0 = time.perf_counter()
         if 'status' in data:
             if data['status'] in VALID_STATUSES:
-                tracking.status = data['status']
+                values['status'] = set_['status'] = data['status']
 
         if 'cv_sent' in data:
-            tracking.cv_sent = bool(data['cv_sent'])
-            if tracking.cv_sent and not tracking.date_sent:
-                tracking.date_sent = datetime.utcnow()
-            elif not tracking.cv_sent:
-                tracking.date_sent = None
+            cv_sent = bool(data['cv_sent'])
+            values['cv_sent'] = set_['cv_sent'] = cv_sent
+            values['date_sent'] = now if cv_sent else None
+            # Keep the original send date when re-checking
+            set_['date_sent'] = func.coalesce(table.c.date_sent, now) if cv_sent else None
 
         if 'follow_up_done' in data:
-            tracking.follow_up_done = bool(data['follow_up_done'])
-            if tracking.follow_up_done and not tracking.follow_up_date:
-                tracking.follow_up_date = datetime.utcnow()
-            elif not tracking.follow_up_done:
-                tracking.follow_up_date = None
+            follow_up_done = bool(data['follow_up_done'])
+            values['follow_up_done'] = set_['follow_up_done'] = follow_up_done
+            values['follow_up_date'] = now if follow_up_done else None
+            set_['follow_up_date'] = (
+                func.coalesce(table.c.follow_up_date, now) if follow_up_done else None
+            )
 
         if 'notes' in data:
-            tracking.notes = data['notes'].strip() if data['notes'] else None
-
-        tracking.updated_at = datetime.utcnow()
-        t_upd1 = time.perf_counter()
-
-        t_c0 = time.perf_counter()
+            values['notes'] = set_['notes'] = data['notes'].strip() if data['notes'] else None
+
+        columns = list(values)
+        source = select(*[
+            Offer.id if col == 'offer_id'
+            else null() if values[col] is None
+            else literal(values[col], table.c[col].type)
+            for col in columns
+        ]).where(Offer.id == offer_id)
+        stmt = (
+            sqlite_insert(table)
+            .from_select(columns, source)
+            .on_conflict_do_update(index_elements=conflict_cols, set_=set_)
+            .returning(
+                table.c.status, table.c.cv_sent, table.c.follow_up_done,
+                table.c.date_sent, table.c.follow_up_date, table.c.notes,
+            )
+        )
+        tracking = db.execute(stmt).first()
+        if tracking is None:
+            db.rollback()
+            return jsonify({'error': 'Offer not found'}), 404
         db.commit()
-        t_c1 = time.perf_counter()
+        _invalidate_dashboard_cache()
 
         t_total = (time.perf_counter() - t_start) * 1000
 
@@ -1331,8 +1381,8 @@ def update_tracking(offer_id):
                 'status': tracking.status,
                 'cv_sent': tracking.cv_sent,
                 'follow_up_done': tracking.follow_up_done,
-                'date_sent': tracking.date_sent.strftime('%Y-%m-%d') if tracking.date_sent else None,
-                'follow_up_date': tracking.follow_up_date.strftime('%Y-%m-%d') if tracking.follow_up_date else None,
+                'date_sent': tracking.date_sent.date().isoformat() if tracking.date_sent else None,
+                'follow_up_date': tracking.follow_up_date.date().isoformat() if tracking.follow_up_date else None,
                 'notes': tracking.notes,
             }
         })
@@ -1340,8 +1390,6 @@ def update_tracking(offer_id):
     except Exception:
         db.rollback()
         return jsonify({'error': 'Erreur interne du serveur'}), 500
-    finally:
-        db.close()
 
 
 @bp.route('/api/tracking/<int:offer_id>/favorite', methods=['POST'])
@@ -1374,8 +1422,6 @@ def toggle_favorite(offer_id):
     except Exception:
         db.rollback()
         return jsonify({'error': 'Erreur interne du serveur'}), 500
-    finally:
-        db.close()
 
 
 @bp.route('/api/tracking/<int:offer_id>/apply', methods=['POST'])
@@ -1407,19 +1453,18 @@ def quick_apply(offer_id):
             uo.date_sent = datetime.utcnow()
         uo.updated_at = datetime.utcnow()
         db.commit()
+        _invalidate_dashboard_cache()
         return jsonify({
             'ok': True,
             'tracking': {
                 'status': uo.status,
                 'cv_sent': uo.cv_sent,
-                'date_sent': uo.date_sent.strftime('%Y-%m-%d') if uo.date_sent else None,
+                'date_sent': uo.date_sent.date().isoformat() if uo.date_sent else None,
             }
         })
     except Exception:
         db.rollback()
         return jsonify({'error': 'Erreur interne du serveur'}), 500
-    finally:
-        db.close()
 
 
 @bp.route('/api/tracking/<int:offer_id>/report-unavailable', methods=['POST'])
@@ -1455,14 +1500,13 @@ def report_unavailable(offer_id):
         offer.is_active = False
         offer.updated_at = datetime.utcnow()
         db.commit()
+        _invalidate_dashboard_cache()
         _sec_log("OFFER_REPORTED", username, f"offer_id={offer_id}")
         flash("Merci ! L'offre a été signalée et retirée.", "success")
         return jsonify({'ok': True})
     except Exception:
         db.rollback()
         return jsonify({'error': 'Erreur interne du serveur'}), 500
-    finally:
-        db.close()
 
 
 @bp.route('/api/tracking/<int:offer_id>/dismiss', methods=['POST'])
@@ -1491,12 +1535,11 @@ def dismiss_offer(offer_id):
             uo.status = 'Dismissed'
         uo.updated_at = datetime.utcnow()
         db.commit()
+        _invalidate_dashboard_cache()
         return jsonify({'ok': True, 'status': 'Dismissed'})
     except Exception:
         db.rollback()
         return jsonify({'error': 'Erreur interne du serveur'}), 500
-    finally:
-        db.close()
 
 
 @bp.route('/api/tracking/<int:offer_id>/restore', methods=['POST'])
@@ -1520,12 +1563,11 @@ def restore_offer(offer_id):
         uo.status = 'New'
         uo.updated_at = datetime.utcnow()
         db.commit()
+        _invalidate_dashboard_cache()
         return jsonify({'ok': True, 'status': 'New'})
     except Exception:
         db.rollback()
         return jsonify({'error': 'Erreur interne du serveur'}), 500
-    finally:
-        db.close()
 
 
 @bp.route('/api/export/pdf')
@@ -1544,134 +1586,131 @@ def export_pdf():
     user_id = session.get("user_id")
     domain_id = session.get("domain_id")
     role = get_current_role()
-    try:
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user:
-            return jsonify({"ok": False, "error": "Utilisateur introuvable"}), 404
+    user = db.query(User).filter(User.id == user_id).first()
+    if not user:
+        return jsonify({"ok": False, "error": "Utilisateur introuvable"}), 404
 
-        # Build query — admin sees all, user sees their domain
-        query = db.query(Offer)
-        if role != "admin" and domain_id:
-            query = query.filter(Offer.domain_id == domain_id)
-        query = query.filter(Offer.is_active.is_(True))
+    # Build query — admin sees all, user sees their domain
+    query = db.query(Offer)
+    if role != "admin" and domain_id:
+        query = query.filter(Offer.domain_id == domain_id)
+    query = query.filter(Offer.is_active.is_(True))
 
-        # Join UserOffer for cv_match_score
-        query = query.outerjoin(
-            UserOffer,
-            (UserOffer.offer_id == Offer.id) & (UserOffer.user_id == user_id),
-        )
+    # Join UserOffer for cv_match_score
+    query = query.outerjoin(
+        UserOffer,
+        (UserOffer.offer_id == Offer.id) & (UserOffer.user_id == user_id),
+    )
 
-        match_score = func.coalesce(UserOffer.cv_match_score, Offer.cv_match_score)
-        query = query.add_columns(match_score.label("match_score"))
-        query = query.order_by(match_score.desc().nullslast())
-        query = query.limit(50)
-
-        results = query.all()
-
-        # Build PDF
-        buf = io.BytesIO()
-        doc = SimpleDocTemplate(buf, pagesize=landscape(A4),
-                                leftMargin=15 * mm, rightMargin=15 * mm,
-                                topMargin=15 * mm, bottomMargin=15 * mm)
-        styles = getSampleStyleSheet()
-        elements = []
-
-        # Header
-        header_style = ParagraphStyle("Header", parent=styles["Heading1"],
-                                      fontSize=18, alignment=TA_CENTER,
-                                      spaceAfter=4)
-        sub_style = ParagraphStyle("Sub", parent=styles["Normal"],
-                                   fontSize=10, alignment=TA_CENTER,
-                                   textColor=colors.HexColor("#475569"),
-                                   spaceAfter=12)
-
-        domain_name = ""
-        if user.domain_id:
-            d = db.query(Domain).filter(Domain.id == user.domain_id).first()
-            domain_name = d.name if d else ""
-
-        elements.append(Paragraph("&#127919; MyJobHunter — Export PDF", header_style))
-        meta_parts = [datetime.utcnow().strftime("%d/%m/%Y"), user.username]
-        if domain_name:
-            meta_parts.append(domain_name)
-        elements.append(Paragraph(" | ".join(meta_parts), sub_style))
-        elements.append(Spacer(1, 6))
-
-        # Table data
-        col_style = ParagraphStyle("Cell", parent=styles["Normal"], fontSize=8,
-                                   leading=10)
-        title_style = ParagraphStyle("TitleCell", parent=col_style, fontName="Helvetica-Bold")
-
-        header_row = ["#", "Titre", "Entreprise", "Lieu", "Contrat", "Score IA", "Source"]
-        data = [header_row]
-
-        for idx, row in enumerate(results, 1):
-            offer = row[0] if hasattr(row, '__getitem__') else row.Offer if hasattr(row, 'Offer') else row
-            score = row[-1] if hasattr(row, '__getitem__') else getattr(row, 'match_score', None)
-            if hasattr(offer, 'title'):
-                o = offer
-            else:
-                o = row[0]
-                score = row[1] if len(row) > 1 else None
-
-            title_text = (o.title or "Sans titre")[:60]
-            company_text = (o.company or "—")[:30]
-            location_text = (o.location or "—")[:25]
-            contract_text = (o.contract_type or "—")[:15]
-            score_text = f"{score:.0f}%" if score is not None else "—"
-            source_text = (o.source or "—")[:15]
-
-            data.append([
-                str(idx),
-                Paragraph(title_text, col_style),
-                Paragraph(company_text, col_style),
-                Paragraph(location_text, col_style),
-                contract_text,
-                score_text,
-                source_text,
-            ])
-
-        col_widths = [20, 220, 100, 80, 60, 50, 60]
-        table = Table(data, colWidths=col_widths, repeatRows=1)
-        table.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#2563eb")),
-            ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-            ("FONTSIZE", (0, 0), (-1, 0), 9),
-            ("FONTSIZE", (0, 1), (-1, -1), 8),
-            ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
-            ("TOPPADDING", (0, 1), (-1, -1), 5),
-            ("BOTTOMPADDING", (0, 1), (-1, -1), 5),
-            ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#f8fafc")]),
-            ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#e2e8f0")),
-            ("ALIGN", (0, 0), (0, -1), "CENTER"),
-            ("ALIGN", (5, 0), (5, -1), "CENTER"),
-            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-        ]))
-        elements.append(table)
-
-        # Footer
-        elements.append(Spacer(1, 16))
-        footer_style = ParagraphStyle("Footer", parent=styles["Normal"],
-                                      fontSize=8, alignment=TA_CENTER,
-                                      textColor=colors.HexColor("#94a3b8"))
-        elements.append(Paragraph(
-            "G&eacute;n&eacute;r&eacute; par MyJobHunter — https://myjobhunter.fr",
-            footer_style
-        ))
-
-        doc.build(elements)
-        buf.seek(0)
-
-        filename = f"jobhunter-{datetime.utcnow().strftime('%Y%m%d')}.pdf"
-        return send_file(
-            buf,
-            mimetype="application/pdf",
-            as_attachment=True,
-            download_name=filename,
-        )
-    finally:
-        db.close()
+    match_score = func.coalesce(UserOffer.cv_match_score, Offer.cv_match_score)
+    query = query.add_columns(match_score.label("match_score"))
+    query = query.order_by(match_score.desc().nullslast())
+    query = query.limit(50)
+
+    results = query.all()
+
+    # Build PDF
+    buf = io.BytesIO()
+    doc = SimpleDocTemplate(buf, pagesize=landscape(A4),
+                            leftMargin=15 * mm, rightMargin=15 * mm,
+                            topMargin=15 * mm, bottomMargin=15 * mm)
+    styles = getSampleStyleSheet()
+    elements = []
+
+    # Header
+    header_style = ParagraphStyle("Header", parent=styles["Heading1"],
+                                  fontSize=18, alignment=TA_CENTER,
+                                  spaceAfter=4)
+    sub_style = ParagraphStyle("Sub", parent=styles["Normal"],
+                               fontSize=10, alignment=TA_CENTER,
+                               textColor=colors.HexColor("#475569"),
+                               spaceAfter=12)
+
+    domain_name = ""
+    if user.domain_id:
+        d = db.query(Domain).filter(Domain.id == user.domain_id).first()
+        domain_name = d.name if d else ""
+
+    elements.append(Paragraph("&#127919; MyJobHunter — Export PDF", header_style))
+    meta_parts = [datetime.utcnow().strftime("%d/%m/%Y"), user.username]
+    if domain_name:
+        meta_parts.append(domain_name)
+    elements.append(Paragraph(" | ".join(meta_parts), sub_style))
+    elements.append(Spacer(1, 6))
+
+    # Table data
+    col_style = ParagraphStyle("Cell", parent=styles["Normal"], fontSize=8,
+                               leading=10)
+    title_style = ParagraphStyle("TitleCell", parent=col_style, fontName="Helvetica-Bold")
+
+    header_row = ["#", "Titre", "Entreprise", "Lieu", "Contrat", "Score IA", "Source"]
+    data = [header_row]
+
+    for idx, row in enumerate(results, 1):
+        offer = row[0] if hasattr(row, '__getitem__') else row.Offer if hasattr(row, 'Offer') else row
+        score = row[-1] if hasattr(row, '__getitem__') else getattr(row, 'match_score', None)
+        if hasattr(offer, 'title'):
+            o = offer
+        else:
+            o = row[0]
+            score = row[1] if len(row) > 1 else None
+
+        title_text = (o.title or "Sans titre")[:60]
+        company_text = (o.company or "—")[:30]
+        location_text = (o.location or "—")[:25]
+        contract_text = (o.contract_type or "—")[:15]
+        score_text = f"{score:.0f}%" if score is not None else "—"
+        source_text = (o.source or "—")[:15]
+
+        data.append([
+            str(idx),
+            Paragraph(title_text, col_style),
+            Paragraph(company_text, col_style),
+            Paragraph(location_text, col_style),
+            contract_text,
+            score_text,
+            source_text,
+        ])
+
+    col_widths = [20, 220, 100, 80, 60, 50, 60]
+    table = Table(data, colWidths=col_widths, repeatRows=1)
+    table.setStyle(TableStyle([
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#2563eb")),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, 0), 9),
+        ("FONTSIZE", (0, 1), (-1, -1), 8),
+        ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
+        ("TOPPADDING", (0, 1), (-1, -1), 5),
+        ("BOTTOMPADDING", (0, 1), (-1, -1), 5),
+        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#f8fafc")]),
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#e2e8f0")),
+        ("ALIGN", (0, 0), (0, -1), "CENTER"),
+        ("ALIGN", (5, 0), (5, -1), "CENTER"),
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ]))
+    elements.append(table)
+
+    # Footer
+    elements.append(Spacer(1, 16))
+    footer_style = ParagraphStyle("Footer", parent=styles["Normal"],
+                                  fontSize=8, alignment=TA_CENTER,
+                                  textColor=colors.HexColor("#94a3b8"))
+    elements.append(Paragraph(
+        "G&eacute;n&eacute;r&eacute; par MyJobHunter — https://myjobhunter.fr",
+        footer_style
+    ))
+
+    doc.build(elements)
+    buf.seek(0)
+
+    filename = f"jobhunter-{datetime.utcnow().strftime('%Y%m%d')}.pdf"
+    return send_file(
+        buf,
+        mimetype="application/pdf",
+        as_attachment=True,
+        download_name=filename,
+    )
 
 
 @bp.route('/offer/<int:offer_id>')
@@ -1681,36 +1720,44 @@ def offer_detail(offer_id):
     db = SessionLocal()
     user_id = session.get("user_id")
     domain_id = session.get("domain_id")
-    try:
-        offer = db.query(Offer).options(joinedload(Offer.tracking)).filter(
-            Offer.id == offer_id
+    offer = db.query(Offer).options(joinedload(Offer.tracking)).filter(
+        Offer.id == offer_id
+    ).first()
+    if not offer:
+        return "Offer not found", 404
+
+    # Domain authorization: domain-scoped users may only view offers in their domain
+    if domain_id and offer.domain_id and offer.domain_id != domain_id:
+        return "Accès refusé", 403
+
+    # Resolve per-user tracking object
+    if user_id is not None:
+        user_offer = db.query(UserOffer).filter(
+            UserOffer.user_id == user_id,
+            UserOffer.offer_id == offer_id,
         ).first()
-        if not offer:
-            return "Offer not found", 404
+    else:
+        user_offer = offer.tracking  # config admin uses Tracking
 
-        # Domain authorization: domain-scoped users may only view offers in their domain
-        if domain_id and offer.domain_id and offer.domain_id != domain_id:
-            return "Accès refusé", 403
+    docs_dir = _user_docs_dir()
+    docs_dir.mkdir(parents=True, exist_ok=True)
+    doc_files = sorted(f.name for f in docs_dir.iterdir() if f.is_file())
+    return render_template('offer_detail.html', offer=offer,
+                           user_offer=user_offer,
+                           doc_files=doc_files,
+                           role=get_current_role(),
+                           username=session.get("username"))
 
-        # Resolve per-user tracking object
-        if user_id is not None:
-            user_offer = db.query(UserOffer).filter(
-                UserOffer.user_id == user_id,
-                UserOffer.offer_id == offer_id,
-            ).first()
-        else:
-            user_offer = offer.tracking  # config admin uses Tracking
 
-        docs_dir = _user_docs_dir()
-        docs_dir.mkdir(parents=True, exist_ok=True)
-        doc_files = sorted(f.name for f in docs_dir.iterdir() if f.is_file())
-        return render_template('offer_detail.html', offer=offer,
-                               user_offer=user_offer,
-                               doc_files=doc_files,
-                               role=get_current_role(),
-                               username=session.get("username"))
-    finally:
-        db.close()
+def _score_buckets(query, score_col) -> list[int]:
+    """Count rows of *query* per 10-point bucket of *score_col* (90–100 share bucket 9)."""
+    bucket = func.min(cast(func.coalesce(score_col, 0) / 10, Integer), 9).label('bucket')
+    rows = query.with_entities(bucket, func.count()).group_by(bucket).all()
+    counts = [0] * 10
+    for b, n in rows:
+        if b is not None and 0 <= b <= 9:
+            counts[b] = n
+    return counts
 
 
 @bp.route('/stats')
@@ -1720,173 +1767,165 @@ def stats():
     db = SessionLocal()
     user_id = session.get("user_id")
     domain_id = session.get("domain_id")
-    try:
-        offer_query = db.query(Offer)
-        if domain_id:
-            offer_query = offer_query.filter(Offer.domain_id == domain_id)
-        total_offers = offer_query.count()
+    offer_query = db.query(Offer)
+    if domain_id:
+        offer_query = offer_query.filter(Offer.domain_id == domain_id)
+    total_offers = offer_query.count()
 
-        def _uo():
-            """Base query for the current user's tracking rows."""
-            if user_id is not None:
-                return db.query(UserOffer).filter(UserOffer.user_id == user_id)
-            return db.query(Tracking)
-
-        tracked_offers = _uo().count()
-        cv_sent = _uo().filter(
-            (UserOffer.cv_sent if user_id is not None else Tracking.cv_sent) == True
-        ).count()
-        follow_ups = _uo().filter(
-            (UserOffer.follow_up_done if user_id is not None else Tracking.follow_up_done) == True
-        ).count()
-
-        status_counts = {}
-        status_col = UserOffer.status if user_id is not None else Tracking.status
-        for status in VALID_STATUSES:
-            count = _uo().filter(status_col == status).count()
-            status_counts[status] = count
-
-        # Interviews count for response rate
-        interviews = status_counts.get('Interview', 0) + status_counts.get('Accepted', 0)
-        response_rate = round(interviews / cv_sent * 100, 1) if cv_sent > 0 else 0
-
-        # Average CV match score
-        avg_cv_score = 0.0
-        high_score_count = 0
+    # Current user's tracking rows: UserOffer for DB users, Tracking for legacy admin
+    track_model = UserOffer if user_id is not None else Tracking
+
+    def _uo(*columns):
+        """Base query for the current user's tracking rows."""
+        q = db.query(*columns)
         if user_id is not None:
-            avg_row = db.query(func.avg(UserOffer.cv_match_score)).filter(
-                UserOffer.user_id == user_id,
-                UserOffer.cv_match_score.isnot(None),
-            ).scalar()
-            avg_cv_score = round(float(avg_row or 0), 1)
-            high_score_count = db.query(func.count(UserOffer.id)).filter(
-                UserOffer.user_id == user_id,
-                UserOffer.cv_match_score >= 70,
-            ).scalar() or 0
-
-        stats_data = {
-            'total_offers': total_offers,
-            'tracked': tracked_offers,
-            'cv_sent': cv_sent,
-            'follow_ups': follow_ups,
-            'status_counts': status_counts,
-            'response_rate': response_rate,
-            'avg_cv_score': avg_cv_score,
-            'high_score_count': high_score_count,
-        }
-
-        # ── Chart data ────────────────────────────────────────────────
-        # Offers per source (scoped by domain)
-        source_rows = (
-            offer_query.with_entities(Offer.source, func.count(Offer.id))
-            .group_by(Offer.source)
-            .order_by(func.count(Offer.id).desc())
-            .all()
-        )
-        source_counts = {s: c for s, c in source_rows if s}
-
-        # Top 10 companies by offer count (scoped by domain)
-        company_rows = (
-            offer_query.with_entities(Offer.company, func.count(Offer.id))
-            .group_by(Offer.company)
-            .order_by(func.count(Offer.id).desc())
-            .limit(10)
-            .all()
-        )
-        top_companies = {c: n for c, n in company_rows if c}
-
-        # Score distribution in 10 equal buckets (0–10, 10–20, …, 90–100)
-        score_rows = offer_query.with_entities(Offer.relevance_score).all()
-        score_buckets = [0] * 10
-        for (score,) in score_rows:
-            s = float(score or 0)
-            bucket = min(int(s // 10), 9)
-            score_buckets[bucket] += 1
-
-        # CV match score distribution (only when a CV has been uploaded)
-        has_cv = _has_cv_file(user_id)
-        cv_score_buckets = [0] * 10
-        if has_cv:
-            if user_id is not None:
-                # DB users: scores live in UserOffer.cv_match_score
-                cv_rows = (
-                    db.query(UserOffer.cv_match_score)
-                    .filter(
-                        UserOffer.user_id == user_id,
-                        UserOffer.cv_match_score.isnot(None),
-                    )
-                    .all()
-                )
-            else:
-                # Legacy admin: scores live in Offer.cv_match_score
-                cv_rows = offer_query.with_entities(Offer.cv_match_score).filter(
-                    Offer.cv_match_score.isnot(None)
-                ).all()
-            for (score,) in cv_rows:
-                s = float(score or 0)
-                bucket = min(int(s // 10), 9)
-                cv_score_buckets[bucket] += 1
-
-        # Weekly application timeline (date_sent grouped by ISO week)
-        weekly_data = {}
+            q = q.filter(UserOffer.user_id == user_id)
+        return q
+
+    # Total / cv_sent / follow-ups in a single scan
+    tracked_offers, cv_sent, follow_ups = _uo(
+        func.count(track_model.id),
+        func.sum(case((track_model.cv_sent == True, 1), else_=0)),
+        func.sum(case((track_model.follow_up_done == True, 1), else_=0)),
+    ).one()
+    cv_sent = cv_sent or 0
+    follow_ups = follow_ups or 0
+
+    status_rows = dict(
+        _uo(track_model.status, func.count(track_model.id))
+        .group_by(track_model.status)
+        .all()
+    )
+    status_counts = {status: status_rows.get(status, 0) for status in VALID_STATUSES}
+
+    # Interviews count for response rate
+    interviews = status_counts.get('Interview', 0) + status_counts.get('Accepted', 0)
+    response_rate = round(interviews / cv_sent * 100, 1) if cv_sent > 0 else 0
+
+    # Average CV match score
+    avg_cv_score = 0.0
+    high_score_count = 0
+    if user_id is not None:
+        avg_row = db.query(func.avg(UserOffer.cv_match_score)).filter(
+            UserOffer.user_id == user_id,
+            UserOffer.cv_match_score.isnot(None),
+        ).scalar()
+        avg_cv_score = round(float(avg_row or 0), 1)
+        high_score_count = db.query(func.count(UserOffer.id)).filter(
+            UserOffer.user_id == user_id,
+            UserOffer.cv_match_score >= 70,
+        ).scalar() or 0
+
+    stats_data = {
+        'total_offers': total_offers,
+        'tracked': tracked_offers,
+        'cv_sent': cv_sent,
+        'follow_ups': follow_ups,
+        'status_counts': status_counts,
+        'response_rate': response_rate,
+        'avg_cv_score': avg_cv_score,
+        'high_score_count': high_score_count,
+    }
+
+    # ── Chart data ────────────────────────────────────────────────
+    # Offers per source (scoped by domain)
+    source_rows = (
+        offer_query.with_entities(Offer.source, func.count(Offer.id))
+        .group_by(Offer.source)
+        .order_by(func.count(Offer.id).desc())
+        .all()
+    )
+    source_counts = {s: c for s, c in source_rows if s}
+
+    # Top 10 companies by offer count (scoped by domain)
+    company_rows = (
+        offer_query.with_entities(Offer.company, func.count(Offer.id))
+        .group_by(Offer.company)
+        .order_by(func.count(Offer.id).desc())
+        .limit(10)
+        .all()
+    )
+    top_companies = {c: n for c, n in company_rows if c}
+
+    # Score distribution in 10 equal buckets (0–10, 10–20, …, 90–100)
+    score_buckets = _score_buckets(offer_query, Offer.relevance_score)
+
+    # CV match score distribution (only when a CV has been uploaded)
+    has_cv = _has_cv_file(user_id)
+    cv_score_buckets = [0] * 10
+    if has_cv:
         if user_id is not None:
-            date_col = UserOffer.date_sent
-            weekly_rows = db.query(UserOffer.date_sent).filter(
+            # DB users: scores live in UserOffer.cv_match_score
+            cv_query = db.query(UserOffer).filter(
                 UserOffer.user_id == user_id,
-                UserOffer.date_sent.isnot(None),
-            ).all()
+                UserOffer.cv_match_score.isnot(None),
+            )
+            cv_score_buckets = _score_buckets(cv_query, UserOffer.cv_match_score)
         else:
-            weekly_rows = db.query(Tracking.date_sent).filter(
-                Tracking.date_sent.isnot(None),
-            ).all()
-        for (dt,) in weekly_rows:
-            if dt:
-                week_key = dt.strftime('%Y-W%W')
-                weekly_data[week_key] = weekly_data.get(week_key, 0) + 1
-        # Sort by week and keep last 12 weeks max
-        weekly_sorted = sorted(weekly_data.items())[-12:]
-        weekly_labels = [w[0] for w in weekly_sorted]
-        weekly_values = [w[1] for w in weekly_sorted]
-
-        # Contract type distribution
-        contract_counts = {}
-        for o in offer_query.with_entities(Offer.contract_type).all():
-            ct = (o[0] or '').strip().lower()
-            if 'cdi' in ct:
-                key = 'CDI'
-            elif 'cdd' in ct:
-                key = 'CDD'
-            elif 'alternance' in ct or 'apprenti' in ct:
-                key = 'Alternance'
-            elif 'stage' in ct:
-                key = 'Stage'
-            elif ct:
-                key = 'Autre'
-            else:
-                key = 'Non précisé'
-            contract_counts[key] = contract_counts.get(key, 0) + 1
-
-        chart_data = {
-            'sources':         source_counts,
-            'companies':       top_companies,
-            'scores':          score_buckets,
-            'statuses':        status_counts,
-            'cv_scores':       cv_score_buckets,
-            'weekly_labels':   weekly_labels,
-            'weekly_values':   weekly_values,
-            'contracts':       contract_counts,
-        }
-
-        return render_template(
-            'stats.html',
-            stats=stats_data,
-            chart_data=chart_data,
-            has_cv=has_cv,
-            role=get_current_role(),
-            username=session.get("username"),
-        )
-    finally:
-        db.close()
+            # Legacy admin: scores live in Offer.cv_match_score
+            cv_query = offer_query.filter(Offer.cv_match_score.isnot(None))
+            cv_score_buckets = _score_buckets(cv_query, Offer.cv_match_score)
+
+    # Weekly application timeline (date_sent grouped by ISO week)
+    weekly_data = {}
+    if user_id is not None:
+        date_col = UserOffer.date_sent
+        weekly_rows = db.query(UserOffer.date_sent).filter(
+            UserOffer.user_id == user_id,
+            UserOffer.date_sent.isnot(None),
+        ).all()
+    else:
+        weekly_rows = db.query(Tracking.date_sent).filter(
+            Tracking.date_sent.isnot(None),
+        ).all()
+    for (dt,) in weekly_rows:
+        if dt:
+            week_key = dt.strftime('%Y-W%W')
+            weekly_data[week_key] = weekly_data.get(week_key, 0) + 1
+    # Sort by week and keep last 12 weeks max
+    weekly_sorted = sorted(weekly_data.items())[-12:]
+    weekly_labels = [w[0] for w in weekly_sorted]
+    weekly_values = [w[1] for w in weekly_sorted]
+
+    # Contract type distribution
+    contract_counts = {}
+    for o in offer_query.with_entities(Offer.contract_type).all():
+        ct = (o[0] or '').strip().lower()
+        if 'cdi' in ct:
+            key = 'CDI'
+        elif 'cdd' in ct:
+            key = 'CDD'
+        elif 'alternance' in ct or 'apprenti' in ct:
+            key = 'Alternance'
+        elif 'stage' in ct:
+            key = 'Stage'
+        elif ct:
+            key = 'Autre'
+        else:
+            key = 'Non précisé'
+        contract_counts[key] = contract_counts.get(key, 0) + 1
+
+    chart_data = {
+        'sources':         source_counts,
+        'companies':       top_companies,
+        'scores':          score_buckets,
+        'statuses':        status_counts,
+        'cv_scores':       cv_score_buckets,
+        'weekly_labels':   weekly_labels,
+        'weekly_values':   weekly_values,
+        'contracts':       contract_counts,
+    }
+
+    # Stream the page so the browser can start on <head> and assets while
+    # the chart-heavy body is still rendering.
+    return stream_template(
+        'stats.html',
+        stats=stats_data,
+        chart_data=chart_data,
+        has_cv=has_cv,
+        role=get_current_role(),
+        username=session.get("username"),
+    )
 
 
 def _persist_scores(db, user_id, offers, scores: dict) -> None:
@@ -1894,36 +1933,52 @@ def _persist_scores(db, user_id, offers, scores: dict) -> None:
     Write cv_match_score values to the database.
     DB users  → upsert into UserOffer.cv_match_score (per-user).
     Legacy admin → write into Offer.cv_match_score.
+    *offers* may be ORM objects or column rows; only .id is read.
     """
     if user_id is not None:
         offer_ids = list(scores.keys())
-        existing_uos = {
-            uo.offer_id: uo
-            for uo in db.query(UserOffer).filter(
+        existing_uos = dict(
+            db.query(UserOffer.offer_id, UserOffer.id).filter(
                 UserOffer.user_id == user_id,
                 UserOffer.offer_id.in_(offer_ids),
             ).all()
-        }
+        )
+        updates = []
+        inserts = []
         for offer_id, score in scores.items():
             if offer_id in existing_uos:
-                existing_uos[offer_id].cv_match_score = score
+                updates.append({'id': existing_uos[offer_id], 'cv_match_score': score})
             else:
-                db.add(UserOffer(
-                    user_id=user_id,
-                    offer_id=offer_id,
-                    cv_match_score=score,
-                    status='New',
-                ))
+                inserts.append({
+                    'user_id': user_id,
+                    'offer_id': offer_id,
+                    'cv_match_score': score,
+                    'status': 'New',
+                })
+        if updates:
+            db.bulk_update_mappings(UserOffer, updates)
+        if inserts:
+            db.bulk_insert_mappings(UserOffer, inserts)
     else:
-        offer_map = {o.id: o for o in offers}
-        for offer_id, score in scores.items():
-            if offer_id in offer_map:
-                offer_map[offer_id].cv_match_score = score
+        known_ids = {o.id for o in offers}
+        updates = [
+            {'id': offer_id, 'cv_match_score': score}
+            for offer_id, score in scores.items()
+            if offer_id in known_ids
+        ]
+        if updates:
+            db.bulk_update_mappings(Offer, updates)
+
+
+# Offer columns read by the CV matchers; lighter than full ORM instances
+_MATCH_COLUMNS = (Offer.id, Offer.title, Offer.company, Offer.description)
 
 
 def _build_offer_query(db, domain_id, user_id, force):
     """
     Build the SQLAlchemy query for offers that need scoring.
+    The query yields lightweight rows exposing only .id, .title, .company
+    and .description — the fields both matchers read.
     Returns (query, skipped_count).
     """
     query = db.query(Offer)
@@ -1951,15 +2006,18 @@ def _build_offer_query(db, domain_id, user_id, force):
         else:
             skipped = 0
 
-    return query, skipped
+    return query.with_entities(*_MATCH_COLUMNS), skipped
 
 
 def _cv_matching_worker(user_id, domain_id, method: str, force: bool) -> None:
     """
     Thread worker: runs CV matching and writes scores to DB.
     Persists progress to _TASKS_FILE after each batch so all workers can poll it.
+
+    Runs outside any request, so it opens an isolated session via
+    SessionLocal.session_factory() and closes it itself.
     """
-    db = SessionLocal()
+    db = SessionLocal.session_factory()
     try:
         cv_text = _find_cv_text(user_id)
         if not cv_text:
@@ -2058,8 +2116,6 @@ def _run_cv_matching(method='tfidf', force=False, domain_id=None, user_id=None):
     except Exception as e:
         db.rollback()
         raise e
-    finally:
-        db.close()
 
 
 @bp.route('/api/cv/upload', methods=['POST'])
@@ -2102,25 +2158,29 @@ def cv_upload():
     file.seek(0)
 
     filename = sanitized_cv_name.lower()
-    raw = file.read()
-
-    # Magic bytes validation
-    if not _check_magic_bytes(raw, cv_ext):
-        return jsonify({'error': f'Le contenu du fichier ne correspond pas à l\'extension {cv_ext}'}), 400
+    bad_content_msg = f'Le contenu du fichier ne correspond pas à l\'extension {cv_ext}'
 
     # Extract text
     if cv_ext == '.pdf':
+        # Only the header is needed for magic bytes; pypdf reads the upload stream directly
+        header = file.stream.read(len(_MAGIC_BYTES['.pdf']))
+        file.stream.seek(0)
+        if not _check_magic_bytes(header, cv_ext):
+            return jsonify({'error': bad_content_msg}), 400
         try:
-            import PyPDF2
-            reader = PyPDF2.PdfReader(io.BytesIO(raw))
+            import pypdf
+            reader = pypdf.PdfReader(file.stream)
             cv_text = "\n".join(
                 page.extract_text() or "" for page in reader.pages
             )
         except ImportError:
-            return jsonify({'error': 'PyPDF2 not installed. pip install PyPDF2'}), 500
+            return jsonify({'error': 'pypdf not installed. pip install pypdf'}), 500
         except Exception:
             return jsonify({'error': 'Impossible de lire le fichier PDF'}), 400
     else:
+        raw = file.read()
+        if not _check_magic_bytes(raw, cv_ext):
+            return jsonify({'error': bad_content_msg}), 400
         # Assume plain text (UTF-8)
         try:
             cv_text = raw.decode('utf-8')
@@ -2135,7 +2195,8 @@ def cv_upload():
     if user_id is not None:
         user_cv_dir = DATA_DIR / "documents" / str(user_id)
         user_cv_dir.mkdir(parents=True, exist_ok=True)
-        (user_cv_dir / filename).write_bytes(raw)
+        file.stream.seek(0)
+        file.save(user_cv_dir / filename)
     else:
         CV_DIR.mkdir(parents=True, exist_ok=True)
         CV_TEXT_PATH.write_text(cv_text, encoding='utf-8')
@@ -2281,31 +2342,28 @@ def account():
             confirm_pw = request.form.get('confirm_password', '')
 
             db = SessionLocal()
-            try:
-                user = db.query(User).filter(User.id == user_id).first()
-                if not user or not bcrypt.check_password_hash(user.password_hash, current_pw):
-                    errors.append("Mot de passe actuel incorrect.")
-                else:
-                    errors.extend(_validate_password(new_pw))
-                    if new_pw != confirm_pw:
-                        errors.append("Les nouveaux mots de passe ne correspondent pas.")
-                if not errors:
-                    user.password_hash = bcrypt.generate_password_hash(new_pw).decode('utf-8')
-                    user.updated_at = datetime.utcnow()
-                    db.commit()
-                    # Regenerate session to invalidate old session cookies
-                    _uname = session.get("username")
-                    _role = session.get("role")
-                    _uid = session.get("user_id")
-                    _did = session.get("domain_id")
-                    session.clear()
-                    session["username"] = _uname
-                    session["role"] = _role
-                    session["user_id"] = _uid
-                    session["domain_id"] = _did
-                    success = "Mot de passe modifié avec succès."
-            finally:
-                db.close()
+            user = db.query(User).filter(User.id == user_id).first()
+            if not user or not bcrypt.check_password_hash(user.password_hash, current_pw):
+                errors.append("Mot de passe actuel incorrect.")
+            else:
+                errors.extend(_validate_password(new_pw))
+                if new_pw != confirm_pw:
+                    errors.append("Les nouveaux mots de passe ne correspondent pas.")
+            if not errors:
+                user.password_hash = bcrypt.generate_password_hash(new_pw).decode('utf-8')
+                user.updated_at = datetime.utcnow()
+                db.commit()
+                # Regenerate session to invalidate old session cookies
+                _uname = session.get("username")
+                _role = session.get("role")
+                _uid = session.get("user_id")
+                _did = session.get("domain_id")
+                session.clear()
+                session["username"] = _uname
+                session["role"] = _role
+                session["user_id"] = _uid
+                session["domain_id"] = _did
+                success = "Mot de passe modifié avec succès."
 
     # Resolve current 2FA state
     totp_enabled = False
@@ -2315,11 +2373,8 @@ def account():
 
     if has_db_user:
         db = SessionLocal()
-        try:
-            user = db.query(User).filter(User.id == user_id).first()
-            totp_enabled = bool(user and user.totp_enabled)
-        finally:
-            db.close()
+        user = db.query(User).filter(User.id == user_id).first()
+        totp_enabled = bool(user and user.totp_enabled)
 
     # Show QR code if a setup is in progress
     if has_db_user and session.get('_totp_setup_secret') and not totp_enabled:
@@ -2377,16 +2432,13 @@ def account_confirm_2fa():
         return redirect(url_for('main.account') + '?err=invalid_code')
 
     db = SessionLocal()
-    try:
-        user = db.query(User).filter(User.id == user_id).first()
-        if user:
-            user.totp_secret = _encrypt_totp_secret(secret)
-            user.totp_enabled = True
-            user.updated_at = datetime.utcnow()
-            db.commit()
-            _sec_log("2FA_ENABLED", user.username)
-    finally:
-        db.close()
+    user = db.query(User).filter(User.id == user_id).first()
+    if user:
+        user.totp_secret = _encrypt_totp_secret(secret)
+        user.totp_enabled = True
+        user.updated_at = datetime.utcnow()
+        db.commit()
+        _sec_log("2FA_ENABLED", user.username)
 
     session.pop('_totp_setup_secret', None)
     return redirect(url_for('main.account') + '?ok=2fa_enabled')
@@ -2404,20 +2456,17 @@ def account_disable_2fa():
     code = request.form.get('totp_code', '').strip().replace(' ', '')
 
     db = SessionLocal()
-    try:
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user or not user.totp_enabled or not user.totp_secret:
-            return redirect(url_for('main.account'))
-        totp = pyotp.TOTP(_decrypt_totp_secret(user.totp_secret))
-        if not totp.verify(code, valid_window=0):
-            return redirect(url_for('main.account') + '?err=invalid_code')
-        _sec_log("2FA_DISABLED", user.username)
-        user.totp_secret = None
-        user.totp_enabled = False
-        user.updated_at = datetime.utcnow()
-        db.commit()
-    finally:
-        db.close()
+    user = db.query(User).filter(User.id == user_id).first()
+    if not user or not user.totp_enabled or not user.totp_secret:
+        return redirect(url_for('main.account'))
+    totp = pyotp.TOTP(_decrypt_totp_secret(user.totp_secret))
+    if not totp.verify(code, valid_window=0):
+        return redirect(url_for('main.account') + '?err=invalid_code')
+    _sec_log("2FA_DISABLED", user.username)
+    user.totp_secret = None
+    user.totp_enabled = False
+    user.updated_at = datetime.utcnow()
+    db.commit()
 
     return redirect(url_for('main.account') + '?ok=2fa_disabled')
 
@@ -2436,64 +2485,61 @@ def account_profile():
     success = None
 
     db = SessionLocal()
-    try:
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user:
-            return redirect(url_for('main.logout'))
+    user = db.query(User).filter(User.id == user_id).first()
+    if not user:
+        return redirect(url_for('main.logout'))
 
-        if request.method == 'POST':
-            action = request.form.get('action')
+    if request.method == 'POST':
+        action = request.form.get('action')
 
-            if action == 'change_domain':
-                new_domain_id = request.form.get('domain_id', '').strip()
-                if new_domain_id == '':
-                    new_domain_id = None
-                else:
-                    try:
-                        new_domain_id = int(new_domain_id)
-                    except ValueError:
-                        errors.append("Domaine invalide.")
-                        new_domain_id = user.domain_id
-
-                if not errors and new_domain_id != user.domain_id:
-                    # Reset cv_match_score on all user_offers
-                    db.query(UserOffer).filter(UserOffer.user_id == user_id).update(
-                        {UserOffer.cv_match_score: None},
-                        synchronize_session='fetch'
-                    )
-                    user.domain_id = new_domain_id
-                    user.updated_at = datetime.utcnow()
-                    db.commit()
-                    session['domain_id'] = new_domain_id
-                    success = "Domaine mis à jour. Les scores Match IA ont été réinitialisés."
-
-            elif action == 'change_email':
-                new_email = request.form.get('email', '').strip()
-                import re as _re
-                _email_re = _re.compile(r'^[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}$')
-                if new_email and not _email_re.match(new_email):
-                    errors.append("Adresse e-mail invalide.")
-                else:
-                    user.email = new_email or None
-                    user.updated_at = datetime.utcnow()
-                    db.commit()
-                    success = "Adresse e-mail mise à jour."
-
-        # Reload user after possible commit
-        db.refresh(user)
-        domains = db.query(Domain).order_by(Domain.name).all()
-
-        return render_template(
-            'profile.html',
-            user=user,
-            domains=domains,
-            errors=errors,
-            success=success,
-            role=get_current_role(),
-            username=session.get('username'),
-        )
-    finally:
-        db.close()
+        if action == 'change_domain':
+            new_domain_id = request.form.get('domain_id', '').strip()
+            if new_domain_id == '':
+                new_domain_id = None
+            else:
+                try:
+                    new_domain_id = int(new_domain_id)
+                except ValueError:
+                    errors.append("Domaine invalide.")
+                    new_domain_id = user.domain_id
+
+            if not errors and new_domain_id != user.domain_id:
+                # Reset cv_match_score on all user_offers
+                db.query(UserOffer).filter(UserOffer.user_id == user_id).update(
+                    {UserOffer.cv_match_score: None},
+                    synchronize_session='fetch'
+                )
+                user.domain_id = new_domain_id
+                user.updated_at = datetime.utcnow()
+                db.commit()
+                session['domain_id'] = new_domain_id
+                success = "Domaine mis à jour. Les scores Match IA ont été réinitialisés."
+
+        elif action == 'change_email':
+            new_email = request.form.get('email', '').strip()
+            import re as _re
+            _email_re = _re.compile(r'^[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}$')
+            if new_email and not _email_re.match(new_email):
+                errors.append("Adresse e-mail invalide.")
+            else:
+                user.email = new_email or None
+                user.updated_at = datetime.utcnow()
+                db.commit()
+                success = "Adresse e-mail mise à jour."
+
+    # Reload user after possible commit
+    db.refresh(user)
+    domains = db.query(Domain).order_by(Domain.name).all()
+
+    return render_template(
+        'profile.html',
+        user=user,
+        domains=domains,
+        errors=errors,
+        success=success,
+        role=get_current_role(),
+        username=session.get('username'),
+    )
 
 
 @bp.route('/api/account/delete', methods=['POST'])
@@ -2511,22 +2557,19 @@ def account_delete():
         return jsonify({'ok': False, 'error': 'Confirmation incorrecte'}), 400
 
     db = SessionLocal()
-    try:
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user:
-            return jsonify({'ok': False, 'error': 'Utilisateur introuvable'}), 404
+    user = db.query(User).filter(User.id == user_id).first()
+    if not user:
+        return jsonify({'ok': False, 'error': 'Utilisateur introuvable'}), 404
 
-        # Delete documents directory
-        docs_dir = Path(DATA_DIR) / 'documents' / str(user_id)
-        if docs_dir.exists():
-            shutil.rmtree(docs_dir, ignore_errors=True)
+    # Delete documents directory
+    docs_dir = Path(DATA_DIR) / 'documents' / str(user_id)
+    if docs_dir.exists():
+        shutil.rmtree(docs_dir, ignore_errors=True)
 
-        # Delete user (cascades: user_offers, password_resets)
-        _sec_log("ACCOUNT_DELETE", user.username, "self-delete")
-        db.delete(user)
-        db.commit()
-    finally:
-        db.close()
+    # Delete user (cascades: user_offers, password_resets)
+    _sec_log("ACCOUNT_DELETE", user.username, "self-delete")
+    db.delete(user)
+    db.commit()
 
     session.clear()
     return jsonify({'ok': True})
@@ -2540,14 +2583,11 @@ def guide_seen():
     if not user_id:
         return jsonify({'ok': False, 'error': 'Non autorisé'}), 403
     db = SessionLocal()
-    try:
-        user = db.query(User).filter(User.id == user_id).first()
-        if user:
-            user.has_seen_guide = True
-            db.commit()
-        return jsonify({'ok': True})
-    finally:
-        db.close()
+    user = db.query(User).filter(User.id == user_id).first()
+    if user:
+        user.has_seen_guide = True
+        db.commit()
+    return jsonify({'ok': True})
 
 
 @bp.route('/api/account/toggle-weekly', methods=['POST'])
@@ -2558,15 +2598,12 @@ def toggle_weekly_email():
     if not user_id:
         return jsonify({'ok': False, 'error': 'Non autorisé'}), 403
     db = SessionLocal()
-    try:
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user:
-            return jsonify({'ok': False, 'error': 'Utilisateur introuvable'}), 404
-        user.email_weekly = not user.email_weekly
-        db.commit()
-        return jsonify({'ok': True, 'email_weekly': user.email_weekly})
-    finally:
-        db.close()
+    user = db.query(User).filter(User.id == user_id).first()
+    if not user:
+        return jsonify({'ok': False, 'error': 'Utilisateur introuvable'}), 404
+    user.email_weekly = not user.email_weekly
+    db.commit()
+    return jsonify({'ok': True, 'email_weekly': user.email_weekly})
 
 
 @bp.route('/api/account/toggle-alerts', methods=['POST'])
@@ -2577,15 +2614,12 @@ def toggle_alert_email():
     if not user_id:
         return jsonify({'ok': False, 'error': 'Non autorisé'}), 403
     db = SessionLocal()
-    try:
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user:
-            return jsonify({'ok': False, 'error': 'Utilisateur introuvable'}), 404
-        user.email_alerts = not user.email_alerts
-        db.commit()
-        return jsonify({'ok': True, 'email_alerts': user.email_alerts})
-    finally:
-        db.close()
+    user = db.query(User).filter(User.id == user_id).first()
+    if not user:
+        return jsonify({'ok': False, 'error': 'Utilisateur introuvable'}), 404
+    user.email_alerts = not user.email_alerts
+    db.commit()
+    return jsonify({'ok': True, 'email_alerts': user.email_alerts})
 
 
 @bp.route('/api/account/unsubscribe-weekly')
@@ -2611,17 +2645,14 @@ def unsubscribe_weekly():
                                error="Lien invalide ou expiré."), 403
 
     db = SessionLocal()
-    try:
-        user = db.query(User).filter(User.id == uid).first()
-        if not user:
-            return render_template('unsubscribe.html', success=False,
-                                   error="Utilisateur introuvable."), 404
-        user.email_weekly = False
-        db.commit()
-        return render_template('unsubscribe.html', success=True,
-                               username=user.username)
-    finally:
-        db.close()
+    user = db.query(User).filter(User.id == uid).first()
+    if not user:
+        return render_template('unsubscribe.html', success=False,
+                               error="Utilisateur introuvable."), 404
+    user.email_weekly = False
+    db.commit()
+    return render_template('unsubscribe.html', success=True,
+                           username=user.username)
 
 
 # ── Document management ───────────────────────────────────────────────────────
@@ -2794,8 +2825,8 @@ def generate_cover_letter(offer_id):
                 ext = tpl_path.suffix.lower()
                 if ext == '.pdf':
                     try:
-                        import PyPDF2
-                        reader = PyPDF2.PdfReader(str(tpl_path))
+                        import pypdf
+                        reader = pypdf.PdfReader(str(tpl_path))
                         template_text = "\n".join(
                             p.extract_text() or "" for p in reader.pages
                         )
@@ -2880,8 +2911,6 @@ def generate_cover_letter(offer_id):
 
     except Exception as e:
         return jsonify({'error': 'Erreur interne du serveur'}), 500
-    finally:
-        db.close()
 
 
 # ── Admin panel ───────────────────────────────────────────────────────────────
@@ -2892,38 +2921,35 @@ def generate_cover_letter(offer_id):
 def admin_page():
     """Admin panel: list all registered users with management actions."""
     db = SessionLocal()
-    try:
-        users = db.query(User).order_by(
-            User.last_login.is_(None),        # NULLs go to the bottom
-            User.last_login.desc(),            # most recent first
-        ).all()
-        domains = {d.id: d.name for d in db.query(Domain).all()}
-        # Count documents per user
-        doc_counts: dict[int, int] = {}
-        for u in users:
-            d = _admin_user_docs_dir(u.id)
-            doc_counts[u.id] = sum(1 for f in d.iterdir() if f.is_file()) if d.exists() else 0
-
-        # Count tracked offers per user
-        offer_counts: dict[int, int] = {
-            uid: cnt
-            for uid, cnt in db.query(UserOffer.user_id, func.count(UserOffer.id))
-                               .group_by(UserOffer.user_id)
-                               .all()
-        }
-
-        return render_template(
-            'admin.html',
-            users=users,
-            domains=domains,
-            doc_counts=doc_counts,
-            offer_counts=offer_counts,
-            now=datetime.utcnow(),
-            role=get_current_role(),
-            username=session.get("username"),
-        )
-    finally:
-        db.close()
+    users = db.query(User).order_by(
+        User.last_login.is_(None),        # NULLs go to the bottom
+        User.last_login.desc(),            # most recent first
+    ).all()
+    domains = {d.id: d.name for d in db.query(Domain).all()}
+    # Count documents per user
+    doc_counts: dict[int, int] = {}
+    for u in users:
+        d = _admin_user_docs_dir(u.id)
+        doc_counts[u.id] = sum(1 for f in d.iterdir() if f.is_file()) if d.exists() else 0
+
+    # Count tracked offers per user
+    offer_counts: dict[int, int] = {
+        uid: cnt
+        for uid, cnt in db.query(UserOffer.user_id, func.count(UserOffer.id))
+                           .group_by(UserOffer.user_id)
+                           .all()
+    }
+
+    return render_template(
+        'admin.html',
+        users=users,
+        domains=domains,
+        doc_counts=doc_counts,
+        offer_counts=offer_counts,
+        now=datetime.utcnow(),
+        role=get_current_role(),
+        username=session.get("username"),
+    )
 
 
 @bp.route('/api/admin/users/<int:user_id>/toggle', methods=['POST'])
@@ -2947,8 +2973,6 @@ def admin_toggle_user(user_id):
     except Exception as e:
         db.rollback()
         return jsonify({'error': 'Erreur interne du serveur'}), 500
-    finally:
-        db.close()
 
 
 @bp.route('/api/admin/users/<int:user_id>/delete', methods=['POST'])
@@ -2976,8 +3000,6 @@ def admin_delete_user(user_id):
     except Exception:
         db.rollback()
         return jsonify({'error': 'Erreur interne du serveur'}), 500
-    finally:
-        db.close()
 
 
 # ── Admin: per-user document management ───────────────────────────────────────
@@ -2993,21 +3015,18 @@ def _admin_user_docs_dir(user_id: int) -> Path:
 def admin_user_documents(user_id):
     """Admin view: list and manage documents belonging to a specific user."""
     db = SessionLocal()
-    try:
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user:
-            return "Utilisateur introuvable", 404
-        docs_dir = _admin_user_docs_dir(user_id)
-        files = sorted(f.name for f in docs_dir.iterdir() if f.is_file()) if docs_dir.exists() else []
-        return render_template(
-            'admin_user_docs.html',
-            target_user=user,
-            files=files,
-            role=get_current_role(),
-            username=session.get("username"),
-        )
-    finally:
-        db.close()
+    user = db.query(User).filter(User.id == user_id).first()
+    if not user:
+        return "Utilisateur introuvable", 404
+    docs_dir = _admin_user_docs_dir(user_id)
+    files = sorted(f.name for f in docs_dir.iterdir() if f.is_file()) if docs_dir.exists() else []
+    return render_template(
+        'admin_user_docs.html',
+        target_user=user,
+        files=files,
+        role=get_current_role(),
+        username=session.get("username"),
+    )
 
 
 @bp.route('/api/admin/documents/<int:user_id>/<filename>', methods=['GET'])
@@ -3064,8 +3083,6 @@ def admin_reset_password(user_id):
     except Exception:
         db.rollback()
         return jsonify({'error': 'Erreur interne'}), 500
-    finally:
-        db.close()
 
 
 @bp.route('/forgot-password', methods=['GET', 'POST'])
@@ -3081,90 +3098,84 @@ def forgot_password():
     if action == 'get_question':
         username = request.form.get('username', '').strip()
         db = SessionLocal()
-        try:
-            user = db.query(User).filter(
-                User.username == username, User.is_active == True
-            ).first()
-            if not user:
-                # Return same response as email-sent to prevent username enumeration
-                return render_template('forgot_password.html', step='email_sent')
-            # ── Email path: user has an email → send reset link directly ──────
-            if user.email:
-                db.query(PasswordReset).filter(
-                    PasswordReset.user_id == user.id,
-                    PasswordReset.used == False,
-                ).update({'used': True})
-                token = secrets.token_urlsafe(32)
-                db.add(PasswordReset(user_id=user.id, token=token))
-                db.commit()
-                reset_url = url_for('main.reset_password', token=token,
-                                    _external=True, _scheme='https')
-                _send_reset_email(user.email, username, reset_url)
-                return render_template('forgot_password.html', step='email_sent')
-            # ── Security question path ─────────────────────────────────────────
-            if not user.security_question:
-                return render_template(
-                    'forgot_password.html', step='1',
-                    error="Aucun email ni question de sécurité configurés pour ce compte. Contactez un administrateur.",
-                    security_questions=SECURITY_QUESTIONS,
-                )
-            return render_template('forgot_password.html', step='2',
-                                   username=username,
-                                   question=user.security_question)
-        finally:
-            db.close()
+        user = db.query(User).filter(
+            User.username == username, User.is_active == True
+        ).first()
+        if not user:
+            # Return same response as email-sent to prevent username enumeration
+            return render_template('forgot_password.html', step='email_sent')
+        # ── Email path: user has an email → send reset link directly ──────
+        if user.email:
+            db.query(PasswordReset).filter(
+                PasswordReset.user_id == user.id,
+                PasswordReset.used == False,
+            ).update({'used': True})
+            token = secrets.token_urlsafe(32)
+            db.add(PasswordReset(user_id=user.id, token=token))
+            db.commit()
+            reset_url = url_for('main.reset_password', token=token,
+                                _external=True, _scheme='https')
+            _send_reset_email(user.email, username, reset_url)
+            return render_template('forgot_password.html', step='email_sent')
+        # ── Security question path ─────────────────────────────────────────
+        if not user.security_question:
+            return render_template(
+                'forgot_password.html', step='1',
+                error="Aucun email ni question de sécurité configurés pour ce compte. Contactez un administrateur.",
+                security_questions=SECURITY_QUESTIONS,
+            )
+        return render_template('forgot_password.html', step='2',
+                               username=username,
+                               question=user.security_question)
 
     if action == 'verify_answer':
         username = request.form.get('username', '').strip()
         answer = request.form.get('answer', '').strip()
         db = SessionLocal()
-        try:
-            from app import bcrypt
-            user = db.query(User).filter(
-                User.username == username, User.is_active == True
-            ).first()
-            if not user or not user.security_answer_hash:
-                return render_template('forgot_password.html', step='1',
-                                       error="Utilisateur introuvable.",
-                                       security_questions=SECURITY_QUESTIONS)
-            # Check lockout
-            now = datetime.utcnow()
-            if user.security_lockout_until and now < user.security_lockout_until:
-                remaining = int((user.security_lockout_until - now).total_seconds() / 60) + 1
-                return render_template('forgot_password.html', step='2',
-                                       username=username,
-                                       question=user.security_question,
-                                       error=f"Trop de tentatives, réessayez dans {remaining} minutes.")
-            if not bcrypt.check_password_hash(user.security_answer_hash, answer.lower()):
-                user.failed_security_attempts = (user.failed_security_attempts or 0) + 1
-                _sec_log("SEC_QUESTION_FAIL", username, f"attempt={user.failed_security_attempts}")
-                if user.failed_security_attempts >= 5:
-                    user.security_lockout_until = now + timedelta(minutes=30)
-                    db.commit()
-                    _sec_log("SEC_QUESTION_LOCK", username, f"lockout_until={user.security_lockout_until.isoformat()}")
-                    return render_template('forgot_password.html', step='2',
-                                           username=username,
-                                           question=user.security_question,
-                                           error="Trop de tentatives, réessayez dans 30 minutes.")
+        from app import bcrypt
+        user = db.query(User).filter(
+            User.username == username, User.is_active == True
+        ).first()
+        if not user or not user.security_answer_hash:
+            return render_template('forgot_password.html', step='1',
+                                   error="Utilisateur introuvable.",
+                                   security_questions=SECURITY_QUESTIONS)
+        # Check lockout
+        now = datetime.utcnow()
+        if user.security_lockout_until and now < user.security_lockout_until:
+            remaining = int((user.security_lockout_until - now).total_seconds() / 60) + 1
+            return render_template('forgot_password.html', step='2',
+                                   username=username,
+                                   question=user.security_question,
+                                   error=f"Trop de tentatives, réessayez dans {remaining} minutes.")
+        if not bcrypt.check_password_hash(user.security_answer_hash, answer.lower()):
+            user.failed_security_attempts = (user.failed_security_attempts or 0) + 1
+            _sec_log("SEC_QUESTION_FAIL", username, f"attempt={user.failed_security_attempts}")
+            if user.failed_security_attempts >= 5:
+                user.security_lockout_until = now + timedelta(minutes=30)
                 db.commit()
+                _sec_log("SEC_QUESTION_LOCK", username, f"lockout_until={user.security_lockout_until.isoformat()}")
                 return render_template('forgot_password.html', step='2',
                                        username=username,
                                        question=user.security_question,
-                                       error="Réponse incorrecte. Vérifiez votre réponse.")
-            # Correct answer — reset counter and generate token
-            user.failed_security_attempts = 0
-            user.security_lockout_until = None
-            db.query(PasswordReset).filter(
-                PasswordReset.user_id == user.id,
-                PasswordReset.used == False
-            ).update({'used': True})
-            token = secrets.token_urlsafe(32)
-            db.add(PasswordReset(user_id=user.id, token=token))
+                                       error="Trop de tentatives, réessayez dans 30 minutes.")
             db.commit()
-            reset_url = url_for('main.reset_password', token=token, _external=True, _scheme='https')
-            return render_template('forgot_password.html', step='3', reset_url=reset_url)
-        finally:
-            db.close()
+            return render_template('forgot_password.html', step='2',
+                                   username=username,
+                                   question=user.security_question,
+                                   error="Réponse incorrecte. Vérifiez votre réponse.")
+        # Correct answer — reset counter and generate token
+        user.failed_security_attempts = 0
+        user.security_lockout_until = None
+        db.query(PasswordReset).filter(
+            PasswordReset.user_id == user.id,
+            PasswordReset.used == False
+        ).update({'used': True})
+        token = secrets.token_urlsafe(32)
+        db.add(PasswordReset(user_id=user.id, token=token))
+        db.commit()
+        reset_url = url_for('main.reset_password', token=token, _external=True, _scheme='https')
+        return render_template('forgot_password.html', step='3', reset_url=reset_url)
 
     return render_template('forgot_password.html', step='1',
                            security_questions=SECURITY_QUESTIONS)
@@ -3338,42 +3349,39 @@ def _send_confirmation_email(to_email: str, username: str, confirm_url: str) ->
 def reset_password(token):
     """Verify a password reset token and allow the user to set a new password."""
     db = SessionLocal()
-    try:
-        reset = db.query(PasswordReset).filter(
-            PasswordReset.token == token,
-            PasswordReset.used == False,
-        ).first()
-        if not reset:
-            return render_template('reset_password.html',
-                                   error="Lien invalide ou déjà utilisé.")
-        if datetime.utcnow() - reset.created_at > timedelta(minutes=15):
-            reset.used = True
-            db.commit()
-            return render_template('reset_password.html',
-                                   error="Ce lien a expiré (validité 15 minutes). Recommencez la procédure.")
+    reset = db.query(PasswordReset).filter(
+        PasswordReset.token == token,
+        PasswordReset.used == False,
+    ).first()
+    if not reset:
+        return render_template('reset_password.html',
+                               error="Lien invalide ou déjà utilisé.")
+    if datetime.utcnow() - reset.created_at > timedelta(minutes=15):
+        reset.used = True
+        db.commit()
+        return render_template('reset_password.html',
+                               error="Ce lien a expiré (validité 15 minutes). Recommencez la procédure.")
 
-        errors = []
-        if request.method == 'POST':
-            new_pw = request.form.get('new_password', '')
-            confirm = request.form.get('confirm_password', '')
-            errors.extend(_validate_password(new_pw))
-            if new_pw != confirm:
-                errors.append("Les mots de passe ne correspondent pas.")
-            if not errors:
-                from app import bcrypt
-                user = db.query(User).filter(User.id == reset.user_id).first()
-                if user:
-                    user.password_hash = bcrypt.generate_password_hash(new_pw).decode('utf-8')
-                    user.updated_at = datetime.utcnow()
-                    reset.used = True
-                    db.commit()
-                    _sec_log("PASSWORD_RESET", user.username)
-                    # Clear any active session for this user (current browser)
-                    session.clear()
-                    return redirect(url_for('main.login') + '?ok=password_reset')
-        return render_template('reset_password.html', token=token, errors=errors)
-    finally:
-        db.close()
+    errors = []
+    if request.method == 'POST':
+        new_pw = request.form.get('new_password', '')
+        confirm = request.form.get('confirm_password', '')
+        errors.extend(_validate_password(new_pw))
+        if new_pw != confirm:
+            errors.append("Les mots de passe ne correspondent pas.")
+        if not errors:
+            from app import bcrypt
+            user = db.query(User).filter(User.id == reset.user_id).first()
+            if user:
+                user.password_hash = bcrypt.generate_password_hash(new_pw).decode('utf-8')
+                user.updated_at = datetime.utcnow()
+                reset.used = True
+                db.commit()
+                _sec_log("PASSWORD_RESET", user.username)
+                # Clear any active session for this user (current browser)
+                session.clear()
+                return redirect(url_for('main.login') + '?ok=password_reset')
+    return render_template('reset_password.html', token=token, errors=errors)
 
 
 # ── Admin: site statistics ─────────────────────────────────────────────────────
@@ -3387,7 +3395,6 @@ def _parse_nginx_today():
     top_pages is a list of (path, count) tuples, max 10.
     Returns None values if the log file is unavailable.
     """
-    import re
     from collections import Counter
     today_prefix = datetime.now().strftime('%d/%b/%Y')
     # Match: IP ... [DD/Mon/YYYY: ... "METHOD /path HTTP ..."
@@ -3428,13 +3435,10 @@ def admin_stats():
     log_available = unique_ips is not None
 
     db = SessionLocal()
-    try:
-        today_start = datetime.combine(_date.today(), datetime.min.time())
-        registrations_today = db.query(func.count(User.id)).filter(
-            User.created_at >= today_start
-        ).scalar() or 0
-    finally:
-        db.close()
+    today_start = datetime.combine(_date.today(), datetime.min.time())
+    registrations_today = db.query(func.count(User.id)).filter(
+        User.created_at >= today_start
+    ).scalar() or 0
 
     return jsonify({
         'ok': True,
@@ -3541,17 +3545,14 @@ def status_page():
     last_scraping = "N/A"
     try:
         db = SessionLocal()
-        try:
-            active_offers = db.query(func.count(Offer.id)).filter(
-                Offer.is_active.is_(True)
-            ).scalar() or 0
-            db_ok = True
-            # Most recent found_date
-            latest = db.query(func.max(Offer.found_date)).scalar()
-            if latest:
-                last_scraping = latest.strftime("%d/%m/%Y %H:%M")
-        finally:
-            db.close()
+        active_offers = db.query(func.count(Offer.id)).filter(
+            Offer.is_active.is_(True)
+        ).scalar() or 0
+        db_ok = True
+        # Most recent found_date
+        latest = db.query(func.max(Offer.found_date)).scalar()
+        if latest:
+            last_scraping = latest.strftime("%d/%m/%Y %H:%M")
     except Exception:
         pass
 
@@ -3715,69 +3716,66 @@ def account_export():
         return jsonify({'error': 'Non autorisé'}), 403
 
     db = SessionLocal()
-    try:
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user:
-            return jsonify({'error': 'Utilisateur introuvable'}), 404
+    user = db.query(User).filter(User.id == user_id).first()
+    if not user:
+        return jsonify({'error': 'Utilisateur introuvable'}), 404
+
+    # ── Profile data ─────────────────────────────────────
+    export_data = {
+        'profil': {
+            'identifiant':   user.username,
+            'email':         user.email,
+            'role':          user.role,
+            'domaine_id':    user.domain_id,
+            'domaine':       user.domain.name if user.domain else None,
+            'a2f_active':    user.totp_enabled,
+            'inscription':   user.created_at.isoformat() if user.created_at else None,
+            'derniere_connexion': user.last_login.isoformat() if user.last_login else None,
+            'tokens_ia_utilises': user.claude_tokens_used,
+            'nb_matchings':  user.matching_count,
+        },
+        'candidatures': [],
+        'documents': [],
+    }
 
-        # ── Profile data ─────────────────────────────────────
-        export_data = {
-            'profil': {
-                'identifiant':   user.username,
-                'email':         user.email,
-                'role':          user.role,
-                'domaine_id':    user.domain_id,
-                'domaine':       user.domain.name if user.domain else None,
-                'a2f_active':    user.totp_enabled,
-                'inscription':   user.created_at.isoformat() if user.created_at else None,
-                'derniere_connexion': user.last_login.isoformat() if user.last_login else None,
-                'tokens_ia_utilises': user.claude_tokens_used,
-                'nb_matchings':  user.matching_count,
-            },
-            'candidatures': [],
-            'documents': [],
-        }
-
-        # ── UserOffer tracking data ───────────────────────────
-        user_offers = (
-            db.query(UserOffer)
-            .filter(UserOffer.user_id == user_id)
-            .options(joinedload(UserOffer.offer))
-            .all()
-        )
-        for uo in user_offers:
-            o = uo.offer
-            export_data['candidatures'].append({
-                'offre_id':     o.id if o else None,
-                'titre':        o.title if o else None,
-                'entreprise':   o.company if o else None,
-                'url':          o.url if o else None,
-                'statut':       uo.status,
-                'cv_envoye':    uo.cv_sent,
-                'relance_faite': uo.follow_up_done,
-                'date_envoi':   uo.date_sent.isoformat() if uo.date_sent else None,
-                'date_relance': uo.follow_up_date.isoformat() if uo.follow_up_date else None,
-                'notes':        uo.notes,
-                'score_match':  uo.cv_match_score,
-            })
+    # ── UserOffer tracking data ───────────────────────────
+    user_offers = (
+        db.query(UserOffer)
+        .filter(UserOffer.user_id == user_id)
+        .options(joinedload(UserOffer.offer))
+        .all()
+    )
+    for uo in user_offers:
+        o = uo.offer
+        export_data['candidatures'].append({
+            'offre_id':     o.id if o else None,
+            'titre':        o.title if o else None,
+            'entreprise':   o.company if o else None,
+            'url':          o.url if o else None,
+            'statut':       uo.status,
+            'cv_envoye':    uo.cv_sent,
+            'relance_faite': uo.follow_up_done,
+            'date_envoi':   uo.date_sent.isoformat() if uo.date_sent else None,
+            'date_relance': uo.follow_up_date.isoformat() if uo.follow_up_date else None,
+            'notes':        uo.notes,
+            'score_match':  uo.cv_match_score,
+        })
 
-        # ── Documents list (filenames only, not binary content) ──
-        docs_dir = DATA_DIR / 'documents' / str(user_id)
-        if docs_dir.exists():
-            export_data['documents'] = sorted(f.name for f in docs_dir.iterdir() if f.is_file())
-
-        export_json = _json.dumps(export_data, ensure_ascii=False, indent=2, default=str)
-        safe_username = "".join(c if c.isalnum() or c in "-_" else "_" for c in user.username)
-        filename = f"myjobhunter_export_{safe_username}.json"
-
-        from flask import Response
-        return Response(
-            export_json,
-            mimetype='application/json',
-            headers={
-                'Content-Disposition': f'attachment; filename="{filename}"',
-                'Content-Type': 'application/json; charset=utf-8',
-            },
-        )
-    finally:
-        db.close()
+    # ── Documents list (filenames only, not binary content) ──
+    docs_dir = DATA_DIR / 'documents' / str(user_id)
+    if docs_dir.exists():
+        export_data['documents'] = sorted(f.name for f in docs_dir.iterdir() if f.is_file())
+
+    export_json = _json.dumps(export_data, ensure_ascii=False, indent=2, default=str)
+    safe_username = "".join(c if c.isalnum() or c in "-_" else "_" for c in user.username)
+    filename = f"myjobhunter_export_{safe_username}.json"
+
+    from flask import Response
+    return Response(
+        export_json,
+        mimetype='application/json',
+        headers={
+            'Content-Disposition': f'attachment; filename="{filename}"',
+            'Content-Type': 'application/json; charset=utf-8',
+        },
+    )
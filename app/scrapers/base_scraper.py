@@ -4,16 +4,48 @@ All scrapers must implement the collect() method.
 """
 
 import logging
+import threading
 import time
 import random
 from abc import ABC, abstractmethod
 from datetime import datetime
+from urllib.parse import urlsplit
 
 from config import ScrapingConfig
 
 logger = logging.getLogger(__name__)
 
 
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    Allows bursts of up to ``capacity`` calls, then ``rate`` calls per
+    second. Each acquire() reserves the next slot under the lock and
+    sleeps outside it, so concurrent callers are spaced out evenly.
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until it is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._last) * self.rate
+            )
+            self._last = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
 class BaseScraper(ABC):
     """
     Abstract base class that all job source scrapers must inherit from.
@@ -23,8 +55,15 @@ class BaseScraper(ABC):
         - collect(): method that fetches and returns raw job offers
     """
 
+    # Per-host pacing for _wait_for_host(): sustained requests per second
+    # and the burst allowed before pacing starts. Scrapers may override.
+    HOST_RATE = 0.5
+    HOST_BURST = 3
+
     def __init__(self):
         self.config = ScrapingConfig()
+        self._host_buckets = {}
+        self._host_buckets_lock = threading.Lock()
 
     @property
     @abstractmethod
@@ -57,28 +96,56 @@ class BaseScraper(ABC):
         logger.debug(f"[{self.source_name}] Waiting {delay:.1f}s before next request")
         time.sleep(delay)
 
-    def _normalize_offer(self, **kwargs):
+    def _wait_for_host(self, url):
+        """
+        Block until a request to url's host is allowed.
+
+        Unlike _delay(), this only sleeps when the host's budget is used
+        up, and it is shared by all threads of this scraper.
+        """
+        host = urlsplit(url).netloc
+        with self._host_buckets_lock:
+            bucket = self._host_buckets.get(host)
+            if bucket is None:
+                bucket = self._host_buckets[host] = TokenBucket(
+                    self.HOST_RATE, self.HOST_BURST
+                )
+        bucket.acquire()
+
+    def _normalize_offer(
+        self,
+        title="Unknown Title",
+        company="Unknown Company",
+        location=None,
+        contract_type=None,
+        description=None,
+        url="",
+        external_id=None,
+        posted_date=None,
+        relevance_score=0.0,
+        offer_type="job",
+    ):
         """
         Create a normalized offer dictionary from scraper-specific data.
 
         Args:
-            **kwargs: Offer fields (title, company, location, etc.)
+            Offer fields (title, company, location, etc.) as keyword arguments.
 
         Returns:
             dict: Normalized offer dictionary
         """
         return {
-            "title": kwargs.get("title", "Unknown Title"),
-            "company": kwargs.get("company", "Unknown Company"),
-            "location": kwargs.get("location"),
-            "contract_type": kwargs.get("contract_type"),
-            "description": kwargs.get("description"),
-            "url": kwargs.get("url", ""),
+            "title": title,
+            "company": company,
+            "location": location,
+            "contract_type": contract_type,
+            "description": description,
+            "url": url,
             "source": self.source_name,
-            "external_id": kwargs.get("external_id"),
-            "posted_date": kwargs.get("posted_date"),
-            "relevance_score": kwargs.get("relevance_score", 0.0),
-            "offer_type": kwargs.get("offer_type", "job"),
+            "external_id": external_id,
+            "posted_date": posted_date,
+            "relevance_score": relevance_score,
+            "offer_type": offer_type,
         }
 
     def close(self):
@@ -1,25 +1,34 @@
 """
 Scraper for Indeed France (fr.indeed.com).
-Fetches apprenticeship/alternance job offers using Selenium with Brave browser
-and undetected-chromedriver to bypass Cloudflare anti-bot protection.
+Fetches apprenticeship/alternance job offers over plain HTTP first, and falls
+back to Selenium with Brave browser and undetected-chromedriver only when a
+Cloudflare challenge is detected.
 
-Note: Indeed blocks headless browsers, so Brave runs in visible (minimized)
-mode. A browser window will briefly appear during scraping.
+Note: Indeed blocks headless browsers, so in fallback mode Brave runs in
+visible (minimized) mode. A browser window will briefly appear during scraping.
 """
 
+import atexit
+import hashlib
+import json
 import logging
 import os
+import random
 import re
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from urllib.parse import urlencode, urljoin
+from urllib.parse import urlencode
 
-import undetected_chromedriver as uc
-from bs4 import BeautifulSoup
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
+import requests
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
 
 from app.scrapers.base_scraper import BaseScraper
+from config import DATA_DIR
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +43,10 @@ BRAVE_PATH = os.getenv(
 )
 
 def _detect_brave_version():
-    """Auto-detect installed Brave browser major version."""
+    """Auto-detect installed Brave browser major version (once, on first use)."""
+    global BRAVE_VERSION_MAIN
+    if BRAVE_VERSION_MAIN is not None:
+        return BRAVE_VERSION_MAIN
     import subprocess
     try:
         path = BRAVE_PATH
@@ -43,14 +55,18 @@ def _detect_brave_version():
             if result.returncode == 0:
                 m = re.search(r'(\d+)\.\d+\.\d+', result.stdout)
                 if m:
-                    return int(m.group(1))
+                    BRAVE_VERSION_MAIN = int(m.group(1))
+                    return BRAVE_VERSION_MAIN
     except Exception:
         pass
-    return 145  # fallback
+    BRAVE_VERSION_MAIN = 145  # fallback
+    return BRAVE_VERSION_MAIN
 
 
-# Brave Chromium major version (auto-detected, fallback to 145)
-BRAVE_VERSION_MAIN = _detect_brave_version()
+# Brave Chromium major version (auto-detected on first driver start, fallback to 145).
+# Selenium / undetected-chromedriver are likewise only imported once the
+# browser fallback is actually needed.
+BRAVE_VERSION_MAIN = None
 
 # Search queries (alternance keywords for sysadmin/infra roles)
 SEARCH_QUERIES = [
@@ -70,13 +86,112 @@ MAX_PAGES = 1
 # Max seconds to wait for Cloudflare challenge to resolve
 CLOUDFLARE_WAIT = 15
 
+# Markers of a Cloudflare challenge / block page in a plain HTTP response
+CHALLENGE_MARKERS = (b"challenge-platform", b"cf_chl", b"captcha", b"unusual traffic")
+
+# Challenge / block pages are small; larger bodies are real result pages
+BLOCK_PAGE_MAX_SIZE = 50_000
+
+# Cookies (incl. Cloudflare cf_clearance) reused between runs
+COOKIE_CACHE_PATH = DATA_DIR / "cache" / "indeed_cookies.json"
+COOKIE_CACHE_TTL = 30 * 60
+
+# Search result pages reused by back-to-back runs
+PAGE_CACHE_DIR = DATA_DIR / "cache" / "indeed"
+PAGE_CACHE_TTL = 10 * 60
+
+# Brave instances kept alive between runs in the same process (scheduler)
+DRIVER_POOL_SIZE = 1
+_driver_pool = []
+_driver_pool_lock = threading.Lock()
+
+
+def _drain_driver_pool():
+    """Quit every pooled browser (registered with atexit)."""
+    with _driver_pool_lock:
+        drivers = list(_driver_pool)
+        _driver_pool.clear()
+    for driver in drivers:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+atexit.register(_drain_driver_pool)
+
+# Only job cards are kept when parsing a results page; the rest of the page
+# (nav, filters, scripts, footer) is skipped while building the tree.
+_CARD_STRAINER = SoupStrainer(
+    class_=["job_seen_beacon", "cardOutline", "result", "css-5lfssm"]
+)
+
+# Card field selectors, compiled once; each tuple is tried in order
+_SEL_CARDS = sv.compile("div.job_seen_beacon")
+_SEL_CARDS_FALLBACK = sv.compile("div.cardOutline, div.result, li.css-5lfssm")
+_SEL_TITLE = tuple(sv.compile(s) for s in (
+    "h2.jobTitle a span", "a.jcs-JobTitle span", "h2.jobTitle a", "h2.jobTitle",
+))
+_SEL_LINK = tuple(sv.compile(s) for s in (
+    "h2.jobTitle a", "a.jcs-JobTitle", "a[data-jk]",
+))
+_SEL_COMPANY = tuple(sv.compile(s) for s in (
+    "[data-testid='company-name']", "span.companyName", "span.company",
+))
+_SEL_LOCATION = tuple(sv.compile(s) for s in (
+    "[data-testid='text-location']", "div.companyLocation",
+))
+_SEL_SNIPPET = tuple(sv.compile(s) for s in (
+    "div.job-snippet", "ul.jobCardShelfContainer", "table.jobCardShelfContainer",
+))
+_SEL_DATE = tuple(sv.compile(s) for s in (
+    "span.date", "[data-testid='myJobsStateDate']",
+))
+
+
+def _first(card, selectors):
+    """Return the first element matched by the given compiled selectors."""
+    for selector in selectors:
+        el = selector.select_one(card)
+        if el:
+            return el
+    return None
+
+
+def _leaf_text(el):
+    """Text of an element, reading .string directly when it is a leaf."""
+    text = el.string
+    if text is not None:
+        return text.strip()
+    return el.get_text(" ", strip=True)
+
+
+# Relative posting dates: "il y a 3 jours", "il y a 5 heures", "aujourd'hui"
+_REL_DATE_RE = re.compile(r"(\d+)\s*(jour|heure|minute)")
+_TODAY_RE = re.compile(r"aujourd|instant")
+_REL_DATE_UNITS = {"jour": "days", "heure": "hours", "minute": "minutes"}
+
+# Single-round-trip probe for rendered job results
+_RESULTS_PROBE_JS = (
+    "return document.readyState !== 'loading' && !!("
+    "document.querySelector('div.job_seen_beacon')"
+    " || document.querySelector('[data-jk]')"
+    " || document.getElementById('mosaic-jobResults'));"
+)
+
+# Parallel plain-HTTP queries, throttled to about one request per second overall
+MAX_WORKERS = 4
+REQUEST_INTERVAL = 1.0
+
 
 class IndeedScraper(BaseScraper):
     """
-    Scraper for Indeed France via Selenium + undetected-chromedriver.
+    Scraper for Indeed France via plain HTTP, with a Selenium fallback.
 
-    Uses Brave browser (minimized window) to bypass Cloudflare protection.
-    Indeed blocks headless browsers, so a visible window is required.
+    Pages are fetched with a pooled requests.Session. As soon as a Cloudflare
+    challenge is detected, the rest of the run switches to Brave browser
+    (minimized window) via undetected-chromedriver. Indeed blocks headless
+    browsers, so a visible window is required in that mode.
     Searches for alternance offers across France, parses job cards,
     and deduplicates by job key.
     """
@@ -88,13 +203,78 @@ class IndeedScraper(BaseScraper):
     def __init__(self):
         super().__init__()
         self.driver = None
+        # Reference time for relative posting dates, refreshed once per run
+        self._run_now = datetime.utcnow()
+        # Job keys seen this run; cards are deduplicated as they are parsed
+        self._seen_ids = set()
+        self._raw_count = 0
+        self._seen_lock = threading.Lock()
+        self._challenged = threading.Event()
+        self._rate_lock = threading.Lock()
+        self._next_request_at = 0.0
+        self.session = requests.Session()
+        self.session.mount(
+            "https://", HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS)
+        )
+        self.session.headers.update({
+            "User-Agent": self.config.USER_AGENT,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "fr-FR,fr;q=0.9,en;q=0.8",
+        })
+        self._cached_cookies = self._load_cookies()
+        for cookie in self._cached_cookies:
+            self.session.cookies.set(
+                cookie["name"], cookie["value"],
+                domain=cookie.get("domain", ""), path=cookie.get("path", "/"),
+            )
+
+    @staticmethod
+    def _load_cookies():
+        """Return cached cookies if the cache file is younger than COOKIE_CACHE_TTL."""
+        try:
+            if time.time() - COOKIE_CACHE_PATH.stat().st_mtime > COOKIE_CACHE_TTL:
+                return []
+            return json.loads(COOKIE_CACHE_PATH.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return []
+
+    @staticmethod
+    def _save_cookies(cookies):
+        """Atomically write cookies (Selenium dict format) to the cache file."""
+        if not cookies:
+            return
+        try:
+            COOKIE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=str(COOKIE_CACHE_PATH.parent), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(cookies, fh)
+            os.replace(tmp_path, str(COOKIE_CACHE_PATH))
+        except OSError as e:
+            logger.debug(f"[indeed] Could not save cookie cache: {e}")
 
     def _create_driver(self):
-        """Create an undetected Chrome driver using Brave browser."""
+        """Reuse a pooled Brave driver, or create an undetected Chrome driver."""
+        while True:
+            with _driver_pool_lock:
+                driver = _driver_pool.pop() if _driver_pool else None
+            if driver is None:
+                break
+            try:
+                driver.current_url  # raises if the browser has died
+                logger.info("[indeed] Reusing pooled Brave browser")
+                return driver
+            except Exception:
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+
         if not os.path.exists(BRAVE_PATH):
             logger.error(f"[indeed] Brave not found at {BRAVE_PATH}")
             return None
 
+        import undetected_chromedriver as uc
+
         options = uc.ChromeOptions()
         options.binary_location = BRAVE_PATH
 
@@ -102,18 +282,33 @@ class IndeedScraper(BaseScraper):
         options.add_argument("--start-minimized")
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-gpu")
         options.add_argument("--window-size=1920,1080")
         options.add_argument("--lang=fr-FR")
 
+        # Cut background work Brave does besides rendering the page
+        options.add_argument("--disable-background-networking")
+        options.add_argument("--disable-sync")
+        options.add_argument("--disable-extensions")
+        options.add_argument("--no-first-run")
+        options.add_argument("--no-default-browser-check")
+        options.add_argument("--disable-features=Translate,MediaRouter")
+
+        # Only the HTML is parsed: skip images, stylesheets and fonts
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+        })
+
         try:
             driver = uc.Chrome(
                 options=options,
                 headless=False,
                 use_subprocess=True,
-                version_main=BRAVE_VERSION_MAIN,
+                version_main=_detect_brave_version(),
             )
-            driver.set_page_load_timeout(30)
+            driver.set_page_load_timeout(15)
             # Minimize window immediately
             driver.minimize_window()
             logger.info("[indeed] Brave browser started (minimized)")
@@ -124,11 +319,24 @@ class IndeedScraper(BaseScraper):
 
     def _wait_for_cloudflare(self):
         """Wait for Cloudflare 'Un instant...' challenge to resolve."""
-        for i in range(CLOUDFLARE_WAIT):
-            title = self.driver.title.lower()
-            if "instant" not in title and "blocked" not in title and title:
-                return True
-            time.sleep(1)
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        def _cleared(driver):
+            # One round trip per poll for both title and load state
+            title, state = driver.execute_script(
+                "return [document.title, document.readyState];"
+            )
+            title = (title or "").lower()
+            return (
+                bool(title) and "instant" not in title and "blocked" not in title
+                and state != "loading"
+            )
+
+        try:
+            WebDriverWait(self.driver, CLOUDFLARE_WAIT, poll_frequency=0.5).until(_cleared)
+            return True
+        except Exception:
+            pass  # Timed out, fall back to a title check
 
         title = self.driver.title
         if "blocked" in title.lower():
@@ -140,71 +348,172 @@ class IndeedScraper(BaseScraper):
 
         return True
 
-    def collect(self):
-        """
-        Collect alternance offers from Indeed France.
+    @staticmethod
+    def _page_cache_path(url):
+        return PAGE_CACHE_DIR / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.html"
+
+    def _read_page_cache(self, url):
+        """Return the cached HTML for url if younger than PAGE_CACHE_TTL, else None."""
+        path = self._page_cache_path(url)
+        try:
+            if time.time() - path.stat().st_mtime > PAGE_CACHE_TTL:
+                return None
+            return path.read_bytes()
+        except OSError:
+            return None
 
-        Launches Brave via undetected-chromedriver, waits for Cloudflare
-        challenge, then searches each keyword query with pagination.
+    def _write_page_cache(self, url, html):
+        """Atomically store a results page (raw bytes) in the cache."""
+        try:
+            PAGE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=str(PAGE_CACHE_DIR), suffix=".tmp")
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(html)
+            os.replace(tmp_path, str(self._page_cache_path(url)))
+        except OSError as e:
+            logger.debug(f"[indeed] Could not cache page: {e}")
+
+    def _start_browser(self):
+        """
+        Launch Brave and clear the Cloudflare challenge on the homepage.
 
         Returns:
-            list[dict]: Normalized offer dictionaries.
+            bool: True if the browser is ready to fetch search pages.
         """
         self.driver = self._create_driver()
         if not self.driver:
-            return []
+            return False
 
-        try:
-            # Visit homepage and wait for Cloudflare challenge
-            logger.info("[indeed] Visiting homepage (waiting for Cloudflare)...")
-            self.driver.get(BASE_URL)
+        # Visit homepage and wait for Cloudflare challenge
+        logger.info("[indeed] Visiting homepage (waiting for Cloudflare)...")
+        self.driver.get(BASE_URL)
 
-            if not self._wait_for_cloudflare():
-                return []
+        # A cached cf_clearance lets search pages through without the
+        # homepage challenge; _fetch_page_browser still waits if it reappears.
+        if self._restore_browser_cookies():
+            logger.info("[indeed] Reusing cached Cloudflare clearance")
+            return True
 
-            logger.info(f"[indeed] Homepage loaded: '{self.driver.title}'")
-            self._delay()
+        if not self._wait_for_cloudflare():
+            return False
 
-            all_offers = []
-            blocked = False
-
-            for query in SEARCH_QUERIES:
-                if blocked:
-                    logger.warning(
-                        "[indeed] Skipping remaining queries due to blocking."
-                    )
-                    break
-
-                logger.info(f"[indeed] Searching: '{query}'")
-                offers, was_blocked = self._search_query(query)
-                all_offers.extend(offers)
-                blocked = was_blocked
-                self._delay()
+        logger.info(f"[indeed] Homepage loaded: '{self.driver.title}'")
+        self._delay()
+        return True
+
+    def _restore_browser_cookies(self):
+        """
+        Load cached cookies into the browser.
+
+        Returns:
+            bool: True if a Cloudflare clearance cookie was restored.
+        """
+        now = time.time()
+        has_clearance = False
+        for cookie in self._cached_cookies:
+            expiry = cookie.get("expiry")
+            if expiry and expiry < now:
+                continue
+            try:
+                self.driver.add_cookie({
+                    k: v for k, v in cookie.items()
+                    if k in ("name", "value", "domain", "path", "secure", "expiry") and v is not None
+                })
+            except Exception:
+                continue
+            if cookie["name"] == "cf_clearance":
+                has_clearance = True
+        return has_clearance
+
+    def collect(self):
+        """
+        Collect alternance offers from Indeed France.
 
-            # Deduplicate by external_id
-            seen_ids = set()
-            unique_offers = []
-            for offer in all_offers:
-                eid = offer.get("external_id")
-                if eid and eid in seen_ids:
-                    continue
-                if eid:
-                    seen_ids.add(eid)
-                unique_offers.append(offer)
+        Runs the keyword queries in parallel over plain HTTP. If Cloudflare
+        challenges a request, the pending queries are cancelled and the
+        remaining ones run sequentially in Brave via undetected-chromedriver.
+
+        Returns:
+            list[dict]: Normalized offer dictionaries.
+        """
+        self._run_now = datetime.utcnow()
+        self._seen_ids = set()
+        self._raw_count = 0
+        try:
+            all_offers = []
+            remaining = list(SEARCH_QUERIES)
+
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+                futures = {pool.submit(self._search_query, q): q for q in SEARCH_QUERIES}
+                for future in as_completed(futures):
+                    if future.cancelled():
+                        continue
+                    offers, was_blocked = future.result()
+                    all_offers.extend(offers)
+                    if not was_blocked:
+                        remaining.remove(futures[future])
+                    else:
+                        for pending in futures:
+                            pending.cancel()
+
+            if len(remaining) < len(SEARCH_QUERIES):
+                self._save_cookies([
+                    {
+                        "name": c.name, "value": c.value, "domain": c.domain,
+                        "path": c.path, "expiry": c.expires,
+                    }
+                    for c in self.session.cookies
+                ])
+
+            if remaining and self._challenged.is_set():
+                logger.info(
+                    f"[indeed] Cloudflare challenge detected, switching to Brave "
+                    f"for {len(remaining)} queries."
+                )
+                if self._start_browser():
+                    all_offers.extend(self._collect_browser(remaining))
 
             logger.info(
-                f"[indeed] Total unique offers: {len(unique_offers)} "
-                f"(from {len(all_offers)} raw results)"
+                f"[indeed] Total unique offers: {len(all_offers)} "
+                f"(from {self._raw_count} raw results)"
             )
 
-            return unique_offers
+            return all_offers
 
         finally:
             self._quit_driver()
 
+    def _collect_browser(self, queries):
+        """
+        Run the given queries sequentially in the browser.
+
+        Returns:
+            list[dict]: Offers found before any blocking.
+        """
+        offers = []
+        for query in queries:
+            logger.info(f"[indeed] Searching in browser: '{query}'")
+            query_offers, was_blocked = self._search_query(query)
+            offers.extend(query_offers)
+            if was_blocked:
+                logger.warning("[indeed] Skipping remaining queries due to blocking.")
+                break
+            self._delay()
+        return offers
+
     def _quit_driver(self):
-        """Safely quit the browser driver."""
+        """Save the browser cookies, then return the driver to the pool or quit it."""
         if self.driver:
+            try:
+                self._save_cookies(self.driver.get_cookies())
+            except Exception:
+                pass
+            with _driver_pool_lock:
+                if len(_driver_pool) < DRIVER_POOL_SIZE:
+                    _driver_pool.append(self.driver)
+                    self.driver = None
+                    logger.info("[indeed] Browser returned to pool")
+                    return
             try:
                 self.driver.quit()
                 logger.info("[indeed] Browser closed")
@@ -240,20 +549,103 @@ class IndeedScraper(BaseScraper):
 
             offers.extend(page_offers)
 
-            if page < MAX_PAGES - 1:
+            # Plain HTTP requests are paced by _throttle() instead
+            if self.driver and page < MAX_PAGES - 1:
                 self._delay()
 
         return offers, False
 
+    def _throttle(self):
+        """Space plain HTTP requests REQUEST_INTERVAL apart across all workers."""
+        with self._rate_lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_request_at)
+            self._next_request_at = start_at + REQUEST_INTERVAL + random.uniform(0, 0.3)
+        if start_at > now:
+            time.sleep(start_at - now)
+
+    def _http_fetch(self, url):
+        """
+        Fetch a page over plain HTTP.
+
+        Returns:
+            tuple: (html_bytes_or_None, was_challenged)
+        """
+        try:
+            response = self.session.get(url, timeout=self.config.TIMEOUT)
+        except requests.RequestException as e:
+            logger.warning(f"[indeed] HTTP request failed: {e}")
+            return None, False
+
+        if response.status_code in (403, 429, 503):
+            return None, True
+        if not response.ok:
+            logger.warning(f"[indeed] HTTP {response.status_code} for {url}")
+            return None, False
+
+        # Only small bodies can be challenge pages; scan those on raw bytes
+        body = response.content
+        if len(body) < BLOCK_PAGE_MAX_SIZE:
+            body_lower = body.lower()
+            if any(marker in body_lower for marker in CHALLENGE_MARKERS):
+                return None, True
+        # Raw bytes: lxml reads the charset from the page itself
+        return body, False
+
     def _fetch_page(self, params, query, page_num):
         """
-        Navigate to a search results page and parse it.
+        Fetch a search results page and parse it.
+
+        Uses plain HTTP until the browser has been started, after which every
+        page goes through Brave. A challenge seen by any HTTP worker makes the
+        others stop early.
 
         Returns:
             tuple: (offers_list_or_None, was_blocked)
         """
         url = f"{SEARCH_URL}?{urlencode(params)}"
 
+        cached = self._read_page_cache(url)
+        if cached is not None:
+            offers = self._parse_results(
+                BeautifulSoup(cached, "lxml", parse_only=_CARD_STRAINER)
+            )
+            logger.info(
+                f"[indeed] [q='{query}'] page {page_num}: {len(offers)} offers (cached)"
+            )
+            return offers, False
+
+        if self.driver:
+            return self._fetch_page_browser(url, query, page_num)
+
+        self._throttle()
+        if self._challenged.is_set():
+            return None, True
+
+        html, challenged = self._http_fetch(url)
+        if challenged:
+            self._challenged.set()
+            return None, True
+        if html is None:
+            return None, False
+
+        offers = self._parse_results(
+            BeautifulSoup(html, "lxml", parse_only=_CARD_STRAINER)
+        )
+        if offers:
+            self._write_page_cache(url, html)
+        logger.info(f"[indeed] [q='{query}'] page {page_num}: {len(offers)} offers")
+        return offers, False
+
+    def _fetch_page_browser(self, url, query, page_num):
+        """
+        Navigate to a search results page in the browser and parse it.
+
+        Returns:
+            tuple: (offers_list_or_None, was_blocked)
+        """
+        from selenium.webdriver.support.ui import WebDriverWait
+
         try:
             self.driver.get(url)
 
@@ -263,12 +655,8 @@ class IndeedScraper(BaseScraper):
 
             # Wait for job results to appear
             try:
-                WebDriverWait(self.driver, 10).until(
-                    lambda d: (
-                        d.find_elements(By.CSS_SELECTOR, "div.job_seen_beacon")
-                        or d.find_elements(By.CSS_SELECTOR, "[data-jk]")
-                        or d.find_elements(By.ID, "mosaic-jobResults")
-                    )
+                WebDriverWait(self.driver, 10, poll_frequency=0.25).until(
+                    lambda d: d.execute_script(_RESULTS_PROBE_JS)
                 )
             except Exception:
                 pass  # Timeout waiting, try to parse anyway
@@ -281,8 +669,11 @@ class IndeedScraper(BaseScraper):
                 )
                 return None, True
 
-            soup = BeautifulSoup(self.driver.page_source, "lxml")
+            html = self.driver.page_source
+            soup = BeautifulSoup(html, "lxml", parse_only=_CARD_STRAINER)
             offers = self._parse_results(soup)
+            if offers:
+                self._write_page_cache(url, html.encode("utf-8"))
 
             logger.info(
                 f"[indeed] [q='{query}'] page {page_num}: {len(offers)} offers"
@@ -299,13 +690,11 @@ class IndeedScraper(BaseScraper):
         offers = []
 
         # Indeed card container: div.job_seen_beacon holds all job info
-        job_cards = soup.select("div.job_seen_beacon")
+        job_cards = _SEL_CARDS.select(soup)
 
         if not job_cards:
             # Fallback selectors
-            job_cards = soup.select(
-                "div.cardOutline, div.result, li.css-5lfssm"
-            )
+            job_cards = _SEL_CARDS_FALLBACK.select(soup)
 
         for card in job_cards:
             offer = self._parse_card(card)
@@ -322,70 +711,60 @@ class IndeedScraper(BaseScraper):
             job_key = jk_el.get("data-jk", "") if jk_el else ""
 
             # Title (inside h2.jobTitle > a > span)
-            title_el = (
-                card.select_one("h2.jobTitle a span")
-                or card.select_one("a.jcs-JobTitle span")
-                or card.select_one("h2.jobTitle a")
-                or card.select_one("h2.jobTitle")
-            )
-            title = title_el.get_text(strip=True) if title_el else None
+            title_el = _first(card, _SEL_TITLE)
+            title = _leaf_text(title_el) if title_el else None
             if not title:
                 return None
 
+            # Deduplicate by job key across queries and pages
+            external_id = f"indeed_{job_key}" if job_key else None
+            with self._seen_lock:
+                self._raw_count += 1
+                if external_id:
+                    if external_id in self._seen_ids:
+                        return None
+                    self._seen_ids.add(external_id)
+
             # URL from title link
-            link_el = (
-                card.select_one("h2.jobTitle a")
-                or card.select_one("a.jcs-JobTitle")
-                or card.select_one("a[data-jk]")
-            )
+            link_el = _first(card, _SEL_LINK)
             if link_el and link_el.get("href"):
                 href = link_el["href"]
-                url = urljoin(BASE_URL, href)
+                # Indeed hrefs are absolute or site-root relative
+                if href.startswith(("http://", "https://")):
+                    url = href
+                elif href.startswith("/"):
+                    url = BASE_URL + href
+                else:
+                    url = f"{BASE_URL}/{href}"
             elif job_key:
                 url = f"{BASE_URL}/viewjob?jk={job_key}"
             else:
                 url = ""
 
             # Company name (span with data-testid="company-name")
-            company_el = (
-                card.select_one("[data-testid='company-name']")
-                or card.select_one("span.companyName")
-                or card.select_one("span.company")
-            )
+            company_el = _first(card, _SEL_COMPANY)
             company = (
-                company_el.get_text(strip=True) if company_el else "Non renseigné"
+                _leaf_text(company_el) if company_el else "Non renseigné"
             )
 
             # Location (div with data-testid="text-location")
-            location_el = (
-                card.select_one("[data-testid='text-location']")
-                or card.select_one("div.companyLocation")
-            )
-            location = location_el.get_text(strip=True) if location_el else None
+            location_el = _first(card, _SEL_LOCATION)
+            location = _leaf_text(location_el) if location_el else None
 
             # Description snippet (from metadata list items)
-            snippet_el = (
-                card.select_one("div.job-snippet")
-                or card.select_one("ul.jobCardShelfContainer")
-                or card.select_one("table.jobCardShelfContainer")
-            )
+            snippet_el = _first(card, _SEL_SNIPPET)
             description = (
-                snippet_el.get_text(strip=True) if snippet_el else None
+                snippet_el.get_text(" ", strip=True) if snippet_el else None
             )
 
             # Posted date (span.date or data-testid)
-            date_el = (
-                card.select_one("span.date")
-                or card.select_one("[data-testid='myJobsStateDate']")
-            )
+            date_el = _first(card, _SEL_DATE)
             posted_date = None
             if date_el:
                 posted_date = self._parse_relative_date(
-                    date_el.get_text(strip=True)
+                    _leaf_text(date_el)
                 )
 
-            external_id = f"indeed_{job_key}" if job_key else None
-
             return self._normalize_offer(
                 title=title,
                 company=company,
@@ -407,22 +786,16 @@ class IndeedScraper(BaseScraper):
             return None
 
         text = text.lower().strip()
-        now = datetime.utcnow()
+        now = self._run_now
 
         # "aujourd'hui" / "à l'instant"
-        if "aujourd" in text or "instant" in text:
+        if _TODAY_RE.search(text):
             return now
 
-        # "il y a X jours"
-        match = re.search(r"(\d+)\s*jour", text)
-        if match:
-            days = int(match.group(1))
-            return now - timedelta(days=days)
-
-        # "il y a X heures"
-        match = re.search(r"(\d+)\s*heure", text)
+        # "il y a X jours" / "il y a X heures"
+        match = _REL_DATE_RE.search(text)
         if match:
-            hours = int(match.group(1))
-            return now - timedelta(hours=hours)
+            unit = _REL_DATE_UNITS[match.group(2)]
+            return now - timedelta(**{unit: int(match.group(1))})
 
         return None
@@ -4,10 +4,13 @@ Fetches apprenticeship/alternance job offers using ROME codes.
 """
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from app.scrapers.base_scraper import BaseScraper
 from config import APIKeys, ROME_CODES, FILTERS
@@ -42,10 +45,31 @@ class LaBonneAlternanceScraper(BaseScraper):
         self.api_key = APIKeys.LBA_API_KEY
         self.base_url = APIKeys.LBA_API_URL
         self.session = requests.Session()
+        # Keep-alive pool for the concurrent searches; 5xx and the API's 419
+        # rate-limit status are retried with backoff. Retry.sleep() waits for
+        # a Retry-After header on any retried status, 419 included;
+        # RETRY_AFTER_STATUS_CODES (413/429/503) only decides which statuses
+        # outside status_forcelist are retried when the header is present.
+        retry = Retry(
+            total=3,
+            status_forcelist=[419, 500, 502, 503, 504],
+            backoff_factor=1.5,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self.session.mount(
+            "https://", HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retry)
+        )
         self.session.headers.update({
             "Authorization": f"Bearer {self.api_key}",
             "Accept": "application/json",
         })
+        # Offers are deduplicated as they are parsed (geo and department
+        # searches run concurrently, hence the lock)
+        self._seen_ids = set()
+        self._seen_urls = set()
+        self._raw_count = 0
+        self._seen_lock = threading.Lock()
 
     def collect(self):
         """
@@ -60,6 +84,9 @@ class LaBonneAlternanceScraper(BaseScraper):
             return []
 
         all_offers = []
+        self._seen_ids = set()
+        self._seen_urls = set()
+        self._raw_count = 0
 
         # Search by ROME codes in batches (API accepts comma-separated)
         rome_codes_str = ",".join(ROME_CODES)
@@ -70,37 +97,23 @@ class LaBonneAlternanceScraper(BaseScraper):
             f"in departments: {departments}"
         )
 
+        # Both strategies are independent requests, so run them concurrently:
         # Strategy 1: Search by geo (Paris center + radius)
-        geo_offers = self._search_by_geo(rome_codes_str)
-        all_offers.extend(geo_offers)
-
         # Strategy 2: Search by departments for broader coverage
-        dept_offers = self._search_by_departments(rome_codes_str, departments)
-        all_offers.extend(dept_offers)
-
-        # Deduplicate by external_id and URL
-        seen_ids = set()
-        seen_urls = set()
-        unique_offers = []
-        for offer in all_offers:
-            eid = offer.get("external_id")
-            if eid and eid in seen_ids:
-                continue
-            url = offer.get("url", "")
-            if not eid and url and url in seen_urls:
-                continue
-            if eid:
-                seen_ids.add(eid)
-            if url:
-                seen_urls.add(url)
-            unique_offers.append(offer)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            geo_future = pool.submit(self._search_by_geo, rome_codes_str)
+            dept_future = pool.submit(
+                self._search_by_departments, rome_codes_str, departments
+            )
+            all_offers.extend(geo_future.result())
+            all_offers.extend(dept_future.result())
 
         logger.info(
-            f"[la_bonne_alternance] Total unique offers: {len(unique_offers)} "
-            f"(from {len(all_offers)} raw results)"
+            f"[la_bonne_alternance] Total unique offers: {len(all_offers)} "
+            f"(from {self._raw_count} raw results)"
         )
 
-        return unique_offers
+        return all_offers
 
     def close(self):
         """Close the HTTP session."""
@@ -157,18 +170,14 @@ class LaBonneAlternanceScraper(BaseScraper):
         url = f"{self.base_url}{endpoint}"
 
         try:
-            # Use requests params with repeated keys for departements
+            # requests encodes a list value as repeated departements= keys
             if departments:
-                all_params = list(params.items()) + [("departements", d) for d in departments]
-                response = self.session.get(url, params=all_params, timeout=self.config.TIMEOUT)
-            else:
-                response = self.session.get(url, params=params, timeout=self.config.TIMEOUT)
+                params = {**params, "departements": list(departments)}
+            response = self.session.get(url, params=params, timeout=self.config.TIMEOUT)
 
-            # Handle rate limiting (API uses 419, not 429)
+            # Rate limiting (API uses 419, not 429) is retried by the adapter
             if response.status_code == 419:
-                logger.warning("[la_bonne_alternance] Rate limited (419). Backing off...")
-                self._delay()
-                self._delay()  # Double delay on rate limit
+                logger.warning("[la_bonne_alternance] Still rate limited (419) after retries.")
                 return None
 
             if response.status_code == 401:
@@ -203,14 +212,14 @@ class LaBonneAlternanceScraper(BaseScraper):
         for job in jobs:
             offer = self._parse_job(job)
             if offer:
-                offers.append(offer)
+                self._add_unique(offers, offer)
 
         # Parse potential recruiters (companies likely to hire)
         recruiters = data.get("recruiters", [])
         for recruiter in recruiters:
             offer = self._parse_recruiter(recruiter)
             if offer:
-                offers.append(offer)
+                self._add_unique(offers, offer)
 
         # Log any warnings from the API
         warnings = data.get("warnings", [])
@@ -227,6 +236,22 @@ class LaBonneAlternanceScraper(BaseScraper):
 
         return offers
 
+    def _add_unique(self, offers, offer):
+        """Append offer unless its external_id (or URL, when it has no ID) was already seen."""
+        eid = offer.get("external_id")
+        url = offer.get("url", "")
+        with self._seen_lock:
+            self._raw_count += 1
+            if eid and eid in self._seen_ids:
+                return
+            if not eid and url and url in self._seen_urls:
+                return
+            if eid:
+                self._seen_ids.add(eid)
+            if url:
+                self._seen_urls.add(url)
+        offers.append(offer)
+
     def _parse_job(self, job):
         """Parse a single job offer from the API response."""
         try:
@@ -265,9 +290,8 @@ class LaBonneAlternanceScraper(BaseScraper):
             creation_str = publication.get("creation")
             if creation_str:
                 try:
-                    posted_date = datetime.fromisoformat(
-                        creation_str.replace("Z", "+00:00")
-                    )
+                    # Python 3.11+ parses the trailing "Z" natively
+                    posted_date = datetime.fromisoformat(creation_str)
                 except (ValueError, TypeError):
                     pass
 
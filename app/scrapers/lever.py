@@ -6,9 +6,12 @@ Endpoint: GET https://api.lever.co/v0/postings/{company}?mode=json
 """
 
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from app.scrapers.base_scraper import BaseScraper
 
@@ -19,6 +22,9 @@ COMPANIES = [
     ("scaleway", "Scaleway"),
 ]
 
+# Companies fetched concurrently (one GET each, on different boards)
+MAX_WORKERS = 8
+
 # IDF location indicators
 IDF_INDICATORS = [
     "paris", "île-de-france", "ile-de-france", "idf",
@@ -28,6 +34,12 @@ IDF_INDICATORS = [
     "vélizy", "velizy", "guyancourt", "saclay",
 ]
 
+# Single alternation over all indicators: one scan per location string
+_IDF_RE = re.compile("|".join(re.escape(ind) for ind in IDF_INDICATORS), re.IGNORECASE)
+
+# Alternance / apprenticeship keywords in posting text
+_KW_RE = re.compile(r"alternance|apprenti", re.IGNORECASE)
+
 
 class LeverScraper(BaseScraper):
     """
@@ -44,6 +56,9 @@ class LeverScraper(BaseScraper):
     def __init__(self):
         super().__init__()
         self.session = requests.Session()
+        self.session.mount(
+            "https://", HTTPAdapter(pool_connections=1, pool_maxsize=MAX_WORKERS)
+        )
         self.session.headers.update({
             "Accept": "application/json",
             "User-Agent": self.config.USER_AGENT,
@@ -56,11 +71,13 @@ class LeverScraper(BaseScraper):
     def collect(self):
         all_offers = []
 
-        for slug, company_name in COMPANIES:
-            logger.info(f"[lever] Searching {company_name} ({slug})")
-            offers = self._fetch_company(slug, company_name)
-            all_offers.extend(offers)
-            self._delay()
+        # Each company is a single request to api.lever.co, so the fetches
+        # overlap instead of being spaced out by _delay().
+        workers = max(1, min(MAX_WORKERS, len(COMPANIES)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(lambda c: self._fetch_company(*c), COMPANIES)
+            for offers in results:
+                all_offers.extend(offers)
 
         logger.info(f"[lever] Total offers: {len(all_offers)}")
         return all_offers
@@ -68,6 +85,7 @@ class LeverScraper(BaseScraper):
     def _fetch_company(self, slug, company_name):
         """Fetch and filter postings for a single company."""
         url = f"https://api.lever.co/v0/postings/{slug}?mode=json"
+        logger.info(f"[lever] Searching {company_name} ({slug})")
 
         try:
             response = self.session.get(url, timeout=self.config.TIMEOUT)
@@ -98,23 +116,20 @@ class LeverScraper(BaseScraper):
         """Check if posting is in IDF and related to alternance."""
         # Check location
         categories = posting.get("categories", {})
-        locations = categories.get("allLocations", [])
-        location_str = " ".join(locations).lower() if locations else ""
-        if not location_str:
-            location_str = (categories.get("location") or "").lower()
-
-        is_idf = any(ind in location_str for ind in IDF_INDICATORS)
-        if not is_idf:
+        locations = categories.get("allLocations") or [categories.get("location") or ""]
+        if not any(_IDF_RE.search(loc) for loc in locations if loc):
             return False
 
-        # Check alternance/apprentissage in text, description, or commitment
-        searchable = " ".join([
-            posting.get("text", ""),
-            posting.get("descriptionPlain", ""),
-            categories.get("commitment", ""),
-        ]).lower()
-
-        return "alternance" in searchable or "apprenti" in searchable
+        # Check alternance/apprentissage in title, commitment, then description
+        return any(
+            _KW_RE.search(field)
+            for field in (
+                posting.get("text"),
+                categories.get("commitment"),
+                posting.get("descriptionPlain"),
+            )
+            if field
+        )
 
     def _parse_posting(self, posting, company_name):
         """Parse a Lever posting into a normalized offer dict."""
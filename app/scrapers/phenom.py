@@ -1,46 +1,24 @@
 """
-Scraper for Phenom People career sites using Selenium + Brave.
-Phenom sites are SPAs that render job cards client-side, so a real
-browser is required. Uses undetected-chromedriver to avoid bot detection.
+Scraper for Phenom People career sites.
+Phenom sites are SPAs whose search page loads job cards from the site's
+"/widgets" JSON endpoint (ddoKey "refineSearch"); that endpoint is called
+directly, so no browser is needed.
 
 Companies using Phenom: Orange, Bouygues.
 """
 
 import logging
-import os
 import re
-import time
-from urllib.parse import quote_plus
+from concurrent.futures import ThreadPoolExecutor
 
-import undetected_chromedriver as uc
-from bs4 import BeautifulSoup
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from app.scrapers.base_scraper import BaseScraper
 
 logger = logging.getLogger(__name__)
 
-BRAVE_PATH = os.getenv(
-    "BRAVE_PATH",
-    r"C:\Program Files\BraveSoftware\Brave-Browser\Application\brave.exe",
-)
-def _detect_brave_version():
-    """Auto-detect installed Brave browser major version."""
-    import subprocess
-    try:
-        path = BRAVE_PATH
-        if os.path.exists(path):
-            result = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                m = re.search(r'(\d+)\.\d+\.\d+', result.stdout)
-                if m:
-                    return int(m.group(1))
-    except Exception:
-        pass
-    return 145  # fallback
-
-
-BRAVE_VERSION_MAIN = _detect_brave_version()
-
 # (base_url, search_path, lang_prefix, display_name)
 # lang_prefix is part of the URL path (e.g. /fr/fr or /global/fr)
 COMPANIES = [
@@ -65,6 +43,12 @@ SEARCH_QUERIES = [
 
 # Max pages to scrape per query (10 results per page)
 MAX_PAGES = 5
+PAGE_SIZE = 10
+
+# (company, query) searches run concurrently; pages within one search stay
+# sequential since each depends on the previous page being full. Requests
+# to each company host are paced by _wait_for_host().
+MAX_WORKERS = 6
 
 # IDF location indicators
 IDF_INDICATORS = [
@@ -79,13 +63,22 @@ IDF_INDICATORS = [
     "meudon", "sèvres", "bagneux",
 ]
 
+# Job fields tried in order for each value (Phenom sites differ in naming)
+_LOCATION_FIELDS = ("location", "cityCountry", "multi_location", "addressLine")
+_CONTRACT_FIELDS = ("contractType", "type", "hiringType")
+_CATEGORY_FIELDS = ("category", "multi_category")
+_COMPANY_FIELDS = ("company", "businessSegment")
+
+# Single alternation over all indicators: one scan per location string
+_IDF_RE = re.compile("|".join(re.escape(ind) for ind in IDF_INDICATORS), re.IGNORECASE)
+
 
 class PhenomScraper(BaseScraper):
     """
-    Selenium-based scraper for Phenom People career sites.
+    Scraper for Phenom People career sites via their search JSON API.
 
-    Launches Brave browser (minimized) to render the SPA,
-    parses job cards from the DOM, and paginates via URL params.
+    Posts "refineSearch" requests to each site's /widgets endpoint,
+    paginates with the "from" offset, and filters postings for IDF.
     """
 
     @property
@@ -94,116 +87,103 @@ class PhenomScraper(BaseScraper):
 
     def __init__(self):
         super().__init__()
-        self.driver = None
-
-    def close(self):
-        """Close the browser driver if open."""
-        self._quit_driver()
-
-    def _create_driver(self):
-        """Create an undetected Chrome driver using Brave browser."""
-        if not os.path.exists(BRAVE_PATH):
-            logger.error(f"[phenom] Brave not found at {BRAVE_PATH}")
-            return None
-
-        options = uc.ChromeOptions()
-        options.binary_location = BRAVE_PATH
-        options.add_argument("--start-minimized")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument("--lang=fr-FR")
-
-        try:
-            driver = uc.Chrome(
-                options=options,
-                headless=False,
-                use_subprocess=True,
-                version_main=BRAVE_VERSION_MAIN,
-            )
-            driver.set_page_load_timeout(30)
-            driver.minimize_window()
-            logger.info("[phenom] Brave browser started (minimized)")
-            return driver
-        except Exception as e:
-            logger.error(f"[phenom] Failed to start Brave: {e}")
-            return None
-
-    def _quit_driver(self):
-        """Safely quit the browser driver."""
-        if self.driver:
-            try:
-                self.driver.quit()
-                logger.info("[phenom] Browser closed")
-            except Exception:
-                pass
-            self.driver = None
+        self.session = requests.Session()
+        # Connection errors, 429 and 5xx are retried with jittered exponential
+        # backoff. The search POST is read-only, so it is safe to retry.
+        retry = Retry(
+            total=3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+            backoff_factor=0.5,
+            backoff_jitter=0.5,
+            backoff_max=8,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=max(1, len(COMPANIES)),
+                pool_maxsize=MAX_WORKERS,
+                max_retries=retry,
+            ),
+        )
+        self.session.headers.update({
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "User-Agent": self.config.USER_AGENT,
+        })
 
     def collect(self):
-        self.driver = self._create_driver()
-        if not self.driver:
-            return []
+        searches = [
+            (base_url, search_path, company_name, query)
+            for base_url, search_path, company_name in COMPANIES
+            for query in SEARCH_QUERIES
+        ]
+
+        # company_name -> {job_id: parsed dict}
+        jobs_by_company = {company_name: {} for _, _, company_name in COMPANIES}
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_WORKERS, len(searches)))) as pool:
+            results = pool.map(lambda search: self._search_query(*search), searches)
+            for (_, _, company_name, _), jobs in zip(searches, results):
+                company_jobs = jobs_by_company[company_name]
+                for job in jobs:
+                    jid = job.get("job_id")
+                    if jid and jid not in company_jobs:
+                        company_jobs[jid] = job
+
+        all_offers = []
+        for company_name, company_jobs in jobs_by_company.items():
+            all_offers.extend(self._filter_company(company_jobs, company_name))
+
+        # Deduplicate by external_id
+        seen = set()
+        unique = []
+        for offer in all_offers:
+            eid = offer.get("external_id")
+            if eid and eid in seen:
+                continue
+            if eid:
+                seen.add(eid)
+            unique.append(offer)
 
-        try:
-            all_offers = []
-
-            for base_url, search_path, company_name in COMPANIES:
-                logger.info(f"[phenom] Searching {company_name} ({base_url})")
-                offers = self._search_company(base_url, search_path, company_name)
-                all_offers.extend(offers)
-                self._delay()
-
-            # Deduplicate by external_id
-            seen = set()
-            unique = []
-            for offer in all_offers:
-                eid = offer.get("external_id")
-                if eid and eid in seen:
-                    continue
-                if eid:
-                    seen.add(eid)
-                unique.append(offer)
-
-            logger.info(
-                f"[phenom] Total unique offers: {len(unique)} "
-                f"(from {len(all_offers)} raw)"
+        logger.info(
+            f"[phenom] Total unique offers: {len(unique)} "
+            f"(from {len(all_offers)} raw)"
+        )
+        return unique
+
+    def _search_query(self, base_url, search_path, company_name, query):
+        """Run one query against one company, following pagination."""
+        logger.info(f"[phenom] Searching {company_name} ({base_url}): '{query}'")
+
+        # "/fr/fr/search-results" -> site prefix "/fr/fr", country "fr", lang "fr_fr"
+        prefix = search_path.rsplit("/", 1)[0]
+        country, lang = prefix.strip("/").split("/")
+        site = {
+            "prefix": prefix,
+            "country": country,
+            "lang": f"{lang}_{country}",
+        }
+
+        all_jobs = []
+        for page in range(MAX_PAGES):
+            jobs = self._fetch_page(
+                base_url, site, query, page * PAGE_SIZE, company_name
             )
-            return unique
-
-        finally:
-            self._quit_driver()
-
-    def _search_company(self, base_url, search_path, company_name):
-        """Search one company across all queries."""
-        all_jobs = {}  # job_id -> parsed dict
-
-        for query in SEARCH_QUERIES:
-            for page in range(MAX_PAGES):
-                offset = page * 10
-                url = (
-                    f"{base_url}{search_path}"
-                    f"?keywords={quote_plus(query)}"
-                    f"&from={offset}&s=1"
-                )
-
-                jobs = self._fetch_page(url, company_name, base_url)
 
-                if jobs is None:
-                    break  # error or blocked
+            if jobs is None:
+                break  # error or blocked
 
-                for job in jobs:
-                    jid = job.get("job_id")
-                    if jid and jid not in all_jobs:
-                        all_jobs[jid] = job
+            all_jobs.extend(jobs)
 
-                if len(jobs) < 10:
-                    break  # last page
+            if len(jobs) < PAGE_SIZE:
+                break  # last page
 
-                self._delay()
-            self._delay()
+        return all_jobs
 
-        # Filter for IDF
+    def _filter_company(self, all_jobs, company_name):
+        """Keep one company's IDF postings as normalized offers."""
         idf_offers = []
         for job in all_jobs.values():
             if self._is_idf(job.get("location", "")):
@@ -217,87 +197,68 @@ class PhenomScraper(BaseScraper):
         )
         return idf_offers
 
-    def _fetch_page(self, url, company_name, base_url):
-        """Navigate to a search page and parse job cards."""
+    def _fetch_page(self, base_url, site, query, offset, company_name):
+        """Fetch one page of search results from the Phenom widgets API."""
+        payload = {
+            "lang": site["lang"],
+            "deviceType": "desktop",
+            "country": site["country"],
+            "pageName": "search-results",
+            "ddoKey": "refineSearch",
+            "sortBy": "",
+            "subsearch": "",
+            "from": offset,
+            "jobs": True,
+            "counts": False,
+            "all_fields": [],
+            "size": PAGE_SIZE,
+            "clearAll": False,
+            "jdsource": "facets",
+            "isSliderEnable": False,
+            "pageId": "page20",
+            "siteType": "external",
+            "keywords": query,
+            "global": True,
+            "selected_fields": {},
+        }
+
+        url = f"{base_url}/widgets"
         try:
-            self.driver.get(url)
-            # Wait for SPA to render job cards
-            time.sleep(6)
-
-            # Check for blocked / error pages
-            title = self.driver.title.lower()
-            if "blocked" in title or "error" in title:
-                logger.warning(f"[phenom] Blocked on {company_name}")
+            self._wait_for_host(url)
+            response = self.session.post(
+                url, json=payload, timeout=self.config.TIMEOUT
+            )
+            if response.status_code != 200:
+                logger.warning(
+                    f"[phenom] HTTP {response.status_code} on {company_name}"
+                )
                 return None
-
-            soup = BeautifulSoup(self.driver.page_source, "lxml")
-            return self._parse_cards(soup, base_url)
-
-        except Exception as e:
-            logger.error(f"[phenom] Error fetching {url}: {e}")
+            data = response.json().get("refineSearch", {}).get("data", {})
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.error(f"[phenom] Error fetching {company_name} '{query}': {e}")
             return None
 
-    def _parse_cards(self, soup, base_url):
-        """Parse Phenom job cards from rendered DOM."""
         jobs = []
-
-        # Job cards are marked with data-ph-at-id="jobs-list-item"
-        cards = soup.select('[data-ph-at-id="jobs-list-item"]')
-
-        for card in cards:
-            job = self._parse_single_card(card, base_url)
+        for raw in data.get("jobs") or []:
+            job = self._parse_job(raw, base_url, site["prefix"])
             if job:
                 jobs.append(job)
-
         return jobs
 
-    def _parse_single_card(self, card, base_url):
-        """Parse a single Phenom job card."""
+    def _parse_job(self, raw, base_url, prefix):
+        """Parse a single Phenom job from the search API response."""
         try:
-            # Title and link from job-link element
-            link_el = card.select_one('[data-ph-at-id="job-link"]')
-            if not link_el:
-                return None
-
-            title = (
-                link_el.get("data-ph-at-job-title-text")
-                or link_el.get_text(strip=True)
-            )
-            job_id = link_el.get("data-ph-at-job-id-text", "")
-
-            href = link_el.get("href", "")
-            if href and not href.startswith("http"):
-                href = f"{base_url}{href}"
-
+            title = raw.get("title")
+            job_id = str(raw.get("jobId") or raw.get("jobSeqNo") or "")
             if not title:
                 return None
 
-            # Location — try multiple Phenom field names
-            location = self._get_field_text(card, [
-                "job-location",
-                "job-cityCountry",
-                "job-multi_location",
-                "job-addressLine",
-            ])
-
-            # Contract type
-            contract = self._get_field_text(card, [
-                "job-contractType",
-                "job-type",
-                "job-hiringType",
-            ])
-
+            location = self._get_field(raw, _LOCATION_FIELDS)
+            contract = self._get_field(raw, _CONTRACT_FIELDS)
             # Category / department
-            category = self._get_field_text(card, [
-                "job-category",
-                "job-multi_category",
-            ])
-
+            category = self._get_field(raw, _CATEGORY_FIELDS)
             # Company (for multi-brand sites like Bouygues)
-            company = self._get_field_text(card, [
-                "job-company",
-                "job-businessSegment",
-            ])
+            company = self._get_field(raw, _COMPANY_FIELDS)
 
             # Build description
             desc_parts = []
@@ -312,31 +273,27 @@ class PhenomScraper(BaseScraper):
                 "job_id": job_id,
                 "title": title,
                 "location": location or "",
-                "url": href,
+                "url": f"{base_url}{prefix}/job/{job_id}" if job_id else "",
                 "description": " | ".join(desc_parts) if desc_parts else None,
             }
 
         except Exception as e:
-            logger.warning(f"[phenom] Error parsing card: {e}")
+            logger.warning(f"[phenom] Error parsing job: {e}")
             return None
 
-    def _get_field_text(self, card, at_ids):
-        """Get text from the first matching data-ph-at-id element."""
-        for at_id in at_ids:
-            el = card.select_one(f'[data-ph-at-id="{at_id}"]')
-            if el:
-                text = el.get_text(strip=True)
-                # Remove label prefix like "City, Country :" or "Catégorie :"
-                if ":" in text:
-                    text = text.split(":", 1)[1].strip()
-                if text:
-                    return text
+    def _get_field(self, raw, keys):
+        """Get the first non-empty value among the given job fields."""
+        for key in keys:
+            value = raw.get(key)
+            if isinstance(value, list):
+                value = ", ".join(str(v) for v in value if v)
+            if value:
+                return str(value).strip()
         return None
 
     def _is_idf(self, location):
         """Check if location is in Île-de-France."""
-        loc_lower = location.lower()
-        return any(ind in loc_lower for ind in IDF_INDICATORS)
+        return bool(_IDF_RE.search(location))
 
     def _to_offer(self, job, company_name):
         """Convert parsed job dict to normalized offer."""
@@ -8,9 +8,12 @@ Filtering is done client-side by domain (Numérique) and IDF department code.
 
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from app.scrapers.base_scraper import BaseScraper
 
@@ -22,6 +25,13 @@ API_URL = f"{BASE_URL}/wp-json/api/offer-list"
 # Number of API pages to fetch per run (20 offers per page)
 MAX_PAGES = 60
 
+# Pages 2..N are fetched concurrently once page 1 reports the page count
+MAX_WORKERS = 6
+
+# Requests per second (and burst) to the offer-list API across all workers
+API_RATE = 2.0
+API_BURST = MAX_WORKERS
+
 # Île-de-France department codes
 IDF_DEPT_CODES = {"75", "77", "78", "91", "92", "93", "94", "95"}
 
@@ -32,6 +42,12 @@ FR_MONTHS = {
     "septembre": 9, "octobre": 10, "novembre": 11, "décembre": 12,
 }
 
+# Department code in a location like "Paris (75)"
+_DEPT_RE = re.compile(r"\((\d{2,3})\)")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+# "18 février 2026"
+_FR_DATE_RE = re.compile(r"\s*(\d{1,2})\s+(\w+)\s+(\d{4})\s*$")
+
 
 class PlaceEmploiPublicScraper(BaseScraper):
     """
@@ -43,6 +59,9 @@ class PlaceEmploiPublicScraper(BaseScraper):
     3. Use the list-level data; no detail-page fetching needed.
     """
 
+    HOST_RATE = API_RATE
+    HOST_BURST = API_BURST
+
     @property
     def source_name(self):
         return "place_emploi_public"
@@ -52,6 +71,23 @@ class PlaceEmploiPublicScraper(BaseScraper):
         self.session = requests.Session()
         # Note: SSL verification disabled due to cert issues on choisirleservicepublic.gouv.fr
         self.session.verify = False
+        # Connection errors and 5xx are retried with jittered exponential
+        # backoff. The offer-list POST is a read-only search, so it is safe
+        # to retry.
+        retry = Retry(
+            total=3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+            backoff_factor=0.5,
+            backoff_jitter=0.5,
+            backoff_max=8,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self.session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=MAX_WORKERS, max_retries=retry),
+        )
         self.session.headers.update({
             "User-Agent": self.config.USER_AGENT,
             "Content-Type": "application/json",
@@ -70,54 +106,69 @@ class PlaceEmploiPublicScraper(BaseScraper):
         all_offers = []
         seen_refs = set()
 
-        for page in range(1, MAX_PAGES + 1):
-            try:
-                response = self.session.post(
-                    API_URL,
-                    json={"page": page},
-                    timeout=self.config.TIMEOUT,
-                )
-
-                if response.status_code != 200:
-                    logger.warning(
-                        f"[place_emploi_public] API returned {response.status_code} on page {page}"
-                    )
-                    break
+        first = self._fetch_page(1)
+        if not first:
+            return []
 
-                data = response.json()
-                items = data.get("items", [])
+        pagination = first.get("pagination", {})
+        try:
+            nb_pages = min(int(pagination.get("nb_page", 1)), MAX_PAGES)
+        except (TypeError, ValueError):
+            nb_pages = 1
+        logger.debug(
+            f"[place_emploi_public] {nb_pages} pages "
+            f"({pagination.get('total_elements_count', '?')} total)"
+        )
 
-                if not items:
-                    logger.info(f"[place_emploi_public] No items on page {page}, stopping.")
-                    break
+        pages = [first]
+        if nb_pages > 1:
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+                # map() keeps page order, so dedup stays deterministic
+                pages.extend(pool.map(self._fetch_page, range(2, nb_pages + 1)))
 
-                pagination = data.get("pagination", {})
-                nb_pages = pagination.get("nb_page", 1)
+        for data in pages:
+            if not data:
+                continue
+            for item in data.get("items", []):
+                offer = self._filter_and_parse(item, seen_refs)
+                if offer:
+                    all_offers.append(offer)
 
-                logger.debug(
-                    f"[place_emploi_public] page {page}/{nb_pages} "
-                    f"({pagination.get('total_elements_count', '?')} total)"
-                )
-
-                for item in items:
-                    offer = self._filter_and_parse(item, seen_refs)
-                    if offer:
-                        all_offers.append(offer)
+        logger.info(f"[place_emploi_public] Collected {len(all_offers)} Numérique/IDF offers")
+        return all_offers
 
-                if page >= nb_pages:
-                    break
+    def _fetch_page(self, page):
+        """
+        Fetch one page of the offer-list API.
 
-                self._delay()
+        Returns:
+            dict or None: JSON response, or None on error / empty page.
+        """
+        try:
+            self._wait_for_host(API_URL)
+            response = self.session.post(
+                API_URL,
+                json={"page": page},
+                timeout=self.config.TIMEOUT,
+            )
+
+            if response.status_code != 200:
+                logger.warning(
+                    f"[place_emploi_public] API returned {response.status_code} on page {page}"
+                )
+                return None
 
-            except requests.exceptions.RequestException as e:
-                logger.error(f"[place_emploi_public] Request error on page {page}: {e}")
-                break
-            except Exception as e:
-                logger.error(f"[place_emploi_public] Unexpected error on page {page}: {e}", exc_info=True)
-                break
+            data = response.json()
+            if not data.get("items"):
+                logger.info(f"[place_emploi_public] No items on page {page}.")
+                return None
+            return data
 
-        logger.info(f"[place_emploi_public] Collected {len(all_offers)} Numérique/IDF offers")
-        return all_offers
+        except requests.exceptions.RequestException as e:
+            logger.error(f"[place_emploi_public] Request error on page {page}: {e}")
+        except Exception as e:
+            logger.error(f"[place_emploi_public] Unexpected error on page {page}: {e}", exc_info=True)
+        return None
 
     def _filter_and_parse(self, item, seen_refs):
         """
@@ -130,7 +181,7 @@ class PlaceEmploiPublicScraper(BaseScraper):
 
         # Location filter — only Île-de-France
         raw_loc = item.get("localisation", "")
-        dept_match = re.search(r"\((\d{2,3})\)", raw_loc)
+        dept_match = _DEPT_RE.search(raw_loc)
         if not dept_match or dept_match.group(1) not in IDF_DEPT_CODES:
             return None
 
@@ -146,7 +197,7 @@ class PlaceEmploiPublicScraper(BaseScraper):
             return None
 
         # Clean location string (strip HTML like <strong>)
-        clean_loc = re.sub(r"<[^>]+>", "", raw_loc).strip()
+        clean_loc = _HTML_TAG_RE.sub("", raw_loc).strip()
         dept_code = dept_match.group(1)
         location = f"Île-de-France ({dept_code})"
 
@@ -163,14 +214,15 @@ class PlaceEmploiPublicScraper(BaseScraper):
         title = (item.get("title") or "Offre sans titre").strip()
 
         # Build description from available metadata
-        desc_parts = []
-        if item.get("fonction_public"):
-            desc_parts.append(f"Versant: {item['fonction_public']}")
-        if clean_loc:
-            desc_parts.append(f"Lieu: {clean_loc}")
-        if item.get("domain"):
-            desc_parts.append(f"Domaine: {item['domain']}")
-        description = "\n".join(desc_parts) if desc_parts else None
+        versant = item.get("fonction_public")
+        domain = item.get("domain")
+        description = "\n".join(
+            part for part in (
+                versant and f"Versant: {versant}",
+                clean_loc and f"Lieu: {clean_loc}",
+                domain and f"Domaine: {domain}",
+            ) if part
+        ) or None
 
         return self._normalize_offer(
             title=title,
@@ -185,16 +237,13 @@ class PlaceEmploiPublicScraper(BaseScraper):
 
     def _parse_date(self, date_str):
         """Parse French date strings like '18 février 2026'."""
-        if not date_str:
+        match = _FR_DATE_RE.match(date_str or "")
+        if not match:
+            return None
+        month = FR_MONTHS.get(match.group(2).lower())
+        if not month:
             return None
         try:
-            parts = date_str.strip().split()
-            if len(parts) == 3:
-                day = int(parts[0])
-                month = FR_MONTHS.get(parts[1].lower(), 0)
-                year = int(parts[2])
-                if month:
-                    return datetime(year, month, day)
-        except (ValueError, IndexError):
-            pass
-        return None
+            return datetime(int(match.group(3)), month, int(match.group(1)))
+        except ValueError:
+            return None
@@ -8,9 +8,12 @@ Endpoint: GET /v1/companies/{companyId}/postings?q=&limit=100
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from app.scrapers.base_scraper import BaseScraper
 
@@ -42,6 +45,14 @@ SEARCH_QUERIES = [
     "alternance support informatique",
 ]
 
+# Companies searched concurrently; all share the api.smartrecruiters.com
+# keep-alive pool. Queries within one company stay sequential.
+MAX_WORKERS = 4
+
+# Requests per second (and burst) to api.smartrecruiters.com, shared by
+# all company threads
+API_RATE = 1.0
+API_BURST = MAX_WORKERS
 
 
 class SmartRecruitersScraper(BaseScraper):
@@ -52,6 +63,9 @@ class SmartRecruitersScraper(BaseScraper):
     Uses the public API (no authentication required).
     """
 
+    HOST_RATE = API_RATE
+    HOST_BURST = API_BURST
+
     @property
     def source_name(self):
         return "smartrecruiters"
@@ -59,6 +73,21 @@ class SmartRecruitersScraper(BaseScraper):
     def __init__(self):
         super().__init__()
         self.session = requests.Session()
+        # Connection errors and 5xx are retried with jittered exponential
+        # backoff instead of ending the query's pagination
+        retry = Retry(
+            total=3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            backoff_factor=0.5,
+            backoff_jitter=0.5,
+            backoff_max=8,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self.session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=MAX_WORKERS, max_retries=retry),
+        )
         self.session.headers.update({
             "Accept": "application/json",
             "User-Agent": self.config.USER_AGENT,
@@ -71,69 +100,48 @@ class SmartRecruitersScraper(BaseScraper):
         Returns:
             list[dict]: Normalized offer dictionaries.
         """
-        all_offers = []
-
-        for company_id, company_name in COMPANIES:
-            logger.info(f"[smartrecruiters] Searching {company_name} ({company_id})")
-            offers = self._search_company(company_id, company_name)
-            all_offers.extend(offers)
-            self._delay()
-
-        # Deduplicate by external_id and URL
-        seen_ids = set()
-        seen_urls = set()
-        unique_offers = []
-        for offer in all_offers:
-            eid = offer.get("external_id")
-            if eid and eid in seen_ids:
-                continue
-            url = offer.get("url", "")
-            if not eid and url and url in seen_urls:
-                continue
-            if eid:
-                seen_ids.add(eid)
-            if url:
-                seen_urls.add(url)
-            unique_offers.append(offer)
+        # Deduplicated as offers arrive: external_id (URL if missing) -> offer.
+        # Offers with neither are skipped rather than collapsed under one key.
+        unique_offers = {}
+        raw_count = 0
+
+        workers = max(1, min(MAX_WORKERS, len(COMPANIES)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(lambda c: self._search_company(*c), COMPANIES)
+            for offers in results:
+                raw_count += len(offers)
+                for offer in offers:
+                    key = offer.get("external_id") or offer.get("url")
+                    if not key:
+                        continue
+                    unique_offers.setdefault(key, offer)
 
         logger.info(
             f"[smartrecruiters] Total unique offers: {len(unique_offers)} "
-            f"(from {len(all_offers)} raw results)"
+            f"(from {raw_count} raw results)"
         )
 
-        return unique_offers
+        return list(unique_offers.values())
 
     def _search_company(self, company_id, company_name):
         """Search a single company for alternance offers."""
-        all_postings = []
-
-        for query in SEARCH_QUERIES:
-            postings = self._fetch_postings(company_id, query)
-            all_postings.extend(postings)
-            self._delay()
-
-        # Deduplicate within this company
+        logger.info(f"[smartrecruiters] Searching {company_name} ({company_id})")
+        # Postings already returned by an earlier query for this company
         seen = set()
-        unique = []
-        for p in all_postings:
-            pid = p.get("id")
-            if pid in seen:
-                continue
-            seen.add(pid)
-            unique.append(p)
-
-        # Filter for France and parse
         offers = []
-        for posting in unique:
-            if not self._is_france(posting):
-                continue
-            offer = self._parse_posting(posting, company_name)
-            if offer:
-                offers.append(offer)
+        for query in SEARCH_QUERIES:
+            # Each unique posting is filtered for France and parsed as it
+            # streams in from the API
+            for posting in self._fetch_postings(company_id, query, seen):
+                if not self._is_france(posting):
+                    continue
+                offer = self._parse_posting(posting, company_name)
+                if offer:
+                    offers.append(offer)
 
         logger.info(
             f"[smartrecruiters] [{company_name}] {len(offers)} France offers "
-            f"(from {len(unique)} unique postings)"
+            f"(from {len(seen)} unique postings)"
         )
 
         return offers
@@ -142,10 +150,15 @@ class SmartRecruitersScraper(BaseScraper):
         """Close the HTTP session."""
         self.session.close()
 
-    def _fetch_postings(self, company_id, query):
-        """Fetch postings from the SmartRecruiters API."""
+    def _fetch_postings(self, company_id, query, already_seen):
+        """
+        Yield postings from the SmartRecruiters API, page by page.
+
+        Only postings whose id is not in ``already_seen`` are yielded; the
+        set is updated in place so later queries skip them too.
+        """
         MAX_PAGES = 50
-        postings = []
+        fetched = 0
         offset = 0
         limit = 100
         page = 0
@@ -159,6 +172,7 @@ class SmartRecruitersScraper(BaseScraper):
             params = {"q": query, "limit": limit, "offset": offset}
 
             try:
+                self._wait_for_host(url)
                 response = self.session.get(
                     url, params=params, timeout=self.config.TIMEOUT
                 )
@@ -171,21 +185,26 @@ class SmartRecruitersScraper(BaseScraper):
                     break
 
                 data = response.json()
-                content = data.get("content", [])
-                total = data.get("totalFound", 0)
 
-                postings.extend(content)
+            except requests.exceptions.RequestException as e:
+                logger.error(f"[smartrecruiters] Request error: {e}")
+                break
 
-                if len(postings) >= total or not content:
-                    break
+            content = data.get("content", [])
+            total = data.get("totalFound", 0)
 
-                offset += limit
+            fetched += len(content)
+            for p in content:
+                pid = p.get("id")
+                if pid in already_seen:
+                    continue
+                already_seen.add(pid)
+                yield p
 
-            except requests.exceptions.RequestException as e:
-                logger.error(f"[smartrecruiters] Request error: {e}")
+            if fetched >= total or not content:
                 break
 
-        return postings
+            offset += limit
 
     def _is_france(self, posting):
         """Check if a posting is located in France."""
@@ -222,9 +241,8 @@ class SmartRecruitersScraper(BaseScraper):
             released = posting.get("releasedDate")
             if released:
                 try:
-                    posted_date = datetime.fromisoformat(
-                        released.replace("Z", "+00:00")
-                    )
+                    # fromisoformat accepts the trailing "Z" (Python 3.11+)
+                    posted_date = datetime.fromisoformat(released)
                 except (ValueError, TypeError):
                     pass
 
@@ -239,8 +257,7 @@ class SmartRecruitersScraper(BaseScraper):
             # Department as description
             dept = posting.get("department", {}).get("label", "")
             func = posting.get("function", {}).get("label", "")
-            desc_parts = [p for p in [dept, func] if p]
-            description = " - ".join(desc_parts) if desc_parts else None
+            description = " - ".join(p for p in (dept, func) if p) or None
 
             return self._normalize_offer(
                 title=title,
@@ -5,12 +5,15 @@ Uses the AJAX search results API that returns HTML fragments in JSON.
 Companies using TalentBrew: Veolia, Vinci.
 """
 
+import functools
 import html
 import logging
 import re
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from app.scrapers.base_scraper import BaseScraper
 
@@ -47,6 +50,67 @@ IDF_INDICATORS = [
     "yvelines", "essonne", "val-d'oise", "seine-et-marne",
 ]
 
+# Single alternation over all indicators: one scan per location string
+_IDF_RE = re.compile("|".join(re.escape(ind) for ind in IDF_INDICATORS), re.IGNORECASE)
+
+_TOTAL_PAGES_RE = re.compile(r'data-total-pages="(\d+)"')
+
+# Job links in a results fragment, in a single pass. Both site layouts
+# share the <a href data-job-id> prefix; the alternation then matches either
+#   Veolia-style: <h2>Title</h2> ... <span class="job-location">Location</span>
+#     (groups 3, 4)
+#   Vinci-style:  <span class="search-results--link-jobtitle">Title</span>
+#                 <span class="...search-results--link-location">Location</span>
+#     (groups 5, 6)
+_JOB_RE = re.compile(
+    r'<a\s+href="(/[^"]+)"\s*data-job-id="([^"]+)"[^>]*>'
+    r'(?:'
+    r'\s*<h2>([^<]+)</h2>'
+    r'.*?class="job-location[^"]*"[^>]*>'
+    r'(?:<span[^>]*></span>)?\s*([^<]+)'
+    r'|'
+    r'.*?link-jobtitle[^>]*>([^<]+)</span>'
+    r'.*?link-location[^>]*>([^<]+)</span>'
+    r')',
+    re.DOTALL,
+)
+
+# Search parameters that are the same for every request; _fetch_page adds
+# the page number, keywords and pagination flag
+_BASE_PARAMS = {
+    "ActiveFacetID": "0",
+    "RecordsPerPage": "25",
+    "Location": "France",
+    "Latitude": "46.227638",
+    "Longitude": "2.213749",
+    "ShowRadius": "False",
+    "SearchResultsModuleName": "Search Results",
+    "SearchFiltersModuleName": "Search Filters",
+    "SortCriteria": "0",
+    "SortDirection": "0",
+    "SearchType": "5",
+    "FacetFilters[0].ID": "Country",
+    "FacetFilters[0].FacetType": "2",
+    "FacetFilters[0].Count": "1",
+    "FacetFilters[0].Display": "France",
+    "FacetFilters[0].IsApplied": "true",
+}
+
+# Max result pages per query (25 results per page)
+MAX_PAGES = 10
+
+# Each company is on its own host, so companies are searched concurrently.
+MAX_WORKERS = 4
+# Pages of one company fetched concurrently (page 1 of every query first,
+# then the remaining pages); requests are paced by _wait_for_host().
+QUERY_WORKERS = 3
+
+
+@functools.lru_cache(maxsize=2048)
+def _unescape(text):
+    """html.unescape, cached (titles/locations repeat) and skipped without '&'."""
+    return html.unescape(text) if "&" in text else text
+
 
 class TalentBrewScraper(BaseScraper):
     """
@@ -63,6 +127,26 @@ class TalentBrewScraper(BaseScraper):
     def __init__(self):
         super().__init__()
         self.session = requests.Session()
+        # One keep-alive pool per company host; connection errors and 5xx
+        # are retried with jittered exponential backoff so a transient
+        # failure does not lose the page
+        retry = Retry(
+            total=3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            backoff_factor=0.5,
+            backoff_jitter=0.5,
+            backoff_max=8,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=max(1, len(COMPANIES)),
+                pool_maxsize=QUERY_WORKERS,
+                max_retries=retry,
+            ),
+        )
         self.session.headers.update({
             "User-Agent": self.config.USER_AGENT,
             "Accept": "application/json",
@@ -70,50 +154,48 @@ class TalentBrewScraper(BaseScraper):
         })
 
     def collect(self):
-        all_offers = []
-
-        for base_url, search_path, company_name in COMPANIES:
-            logger.info(f"[talentbrew] Searching {company_name}")
-            offers = self._search_company(base_url, search_path, company_name)
-            all_offers.extend(offers)
-            self._delay()
-
-        # Deduplicate by external_id
-        seen_ids = set()
-        unique = []
-        for offer in all_offers:
-            eid = offer.get("external_id")
-            if eid and eid in seen_ids:
-                continue
-            if eid:
-                seen_ids.add(eid)
-            unique.append(offer)
+        # Deduplicated as offers arrive: external_id -> offer
+        unique = {}
+        raw_count = 0
+
+        workers = max(1, min(MAX_WORKERS, len(COMPANIES)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(lambda c: self._search_company(*c), COMPANIES)
+            for offers in results:
+                raw_count += len(offers)
+                for offer in offers:
+                    unique.setdefault(offer["external_id"], offer)
 
         logger.info(
             f"[talentbrew] Total unique offers: {len(unique)} "
-            f"(from {len(all_offers)} raw)"
+            f"(from {raw_count} raw)"
         )
-        return unique
+        return list(unique.values())
 
     def _search_company(self, base_url, search_path, company_name):
         """Search a single company across all queries."""
+        logger.info(f"[talentbrew] Searching {company_name}")
         all_jobs = {}  # job_id -> parsed dict
 
-        for query in SEARCH_QUERIES:
-            page = 1
-            while page <= 10:  # max 10 pages per query
-                jobs, total_pages = self._fetch_page(
-                    base_url, search_path, query, page
-                )
-                for job in jobs:
-                    jid = job.get("job_id")
-                    if jid and jid not in all_jobs:
-                        all_jobs[jid] = job
-                if page >= total_pages:
-                    break
-                page += 1
-                self._delay()
-            self._delay()
+        def fetch(query, page):
+            return self._fetch_page(base_url, search_path, query, page)
+
+        with ThreadPoolExecutor(max_workers=QUERY_WORKERS) as pool:
+            # Wave 1: page 1 of every query, which also gives its page count
+            first_pages = list(pool.map(lambda q: fetch(q, 1), SEARCH_QUERIES))
+            remaining = [
+                (query, page)
+                for query, (_, total_pages) in zip(SEARCH_QUERIES, first_pages)
+                for page in range(2, min(total_pages, MAX_PAGES) + 1)
+            ]
+            # Wave 2: all remaining pages of all queries at once
+            other_pages = list(pool.map(lambda qp: fetch(*qp), remaining))
+
+        for jobs, _ in first_pages + other_pages:
+            for job in jobs:
+                jid = job.get("job_id")
+                if jid and jid not in all_jobs:
+                    all_jobs[jid] = job
 
         # Filter for IDF
         idf_offers = []
@@ -132,29 +214,15 @@ class TalentBrewScraper(BaseScraper):
     def _fetch_page(self, base_url, search_path, query, page):
         """Fetch one page of search results."""
         params = {
-            "ActiveFacetID": "0",
+            **_BASE_PARAMS,
             "CurrentPage": str(page),
-            "RecordsPerPage": "25",
             "Keywords": query,
-            "Location": "France",
-            "Latitude": "46.227638",
-            "Longitude": "2.213749",
-            "ShowRadius": "False",
             "IsPagination": "True" if page > 1 else "False",
-            "SearchResultsModuleName": "Search Results",
-            "SearchFiltersModuleName": "Search Filters",
-            "SortCriteria": "0",
-            "SortDirection": "0",
-            "SearchType": "5",
-            "FacetFilters[0].ID": "Country",
-            "FacetFilters[0].FacetType": "2",
-            "FacetFilters[0].Count": "1",
-            "FacetFilters[0].Display": "France",
-            "FacetFilters[0].IsApplied": "true",
         }
 
         try:
             url = f"{base_url}{search_path}"
+            self._wait_for_host(url)
             response = self.session.get(url, params=params, timeout=self.config.TIMEOUT)
 
             if response.status_code != 200:
@@ -169,9 +237,7 @@ class TalentBrewScraper(BaseScraper):
                 return [], 0
 
             # Extract total pages
-            total_pages_match = re.search(
-                r'data-total-pages="(\d+)"', results_html
-            )
+            total_pages_match = _TOTAL_PAGES_RE.search(results_html)
             total_pages = int(total_pages_match.group(1)) if total_pages_match else 1
 
             # Parse jobs from HTML
@@ -186,35 +252,16 @@ class TalentBrewScraper(BaseScraper):
         """Parse job listings from TalentBrew HTML fragment."""
         jobs = []
 
-        # Pattern 1: Veolia-style
-        # <a href="/fr/emploi/..." data-job-id="123"><h2>Title</h2>
-        # <span class="job-location">...\n  Location\n</span>
-        pattern1 = re.findall(
-            r'<a\s+href="(/[^"]+)"\s*data-job-id="([^"]+)"[^>]*>'
-            r'\s*<h2>([^<]+)</h2>'
-            r'.*?class="job-location[^"]*"[^>]*>'
-            r'(?:<span[^>]*></span>)?\s*([^<]+)',
-            results_html,
-            re.DOTALL,
-        )
-
-        # Pattern 2: Vinci-style
-        # <a href="/fr/emploi/..." data-job-id="123" class="search-results--link">
-        # <span class="search-results--link-jobtitle">Title</span>
-        # <span class="...search-results--link-location">Location</span>
-        pattern2 = re.findall(
-            r'<a\s+href="(/[^"]+)"\s*data-job-id="([^"]+)"[^>]*>'
-            r'.*?link-jobtitle[^>]*>([^<]+)</span>'
-            r'.*?link-location[^>]*>([^<]+)</span>',
-            results_html,
-            re.DOTALL,
-        )
-
-        for url_path, job_id, title, location in pattern1 + pattern2:
+        for m in _JOB_RE.finditer(results_html):
+            url_path, job_id = m.group(1, 2)
+            if m.group(3) is not None:
+                title, location = m.group(3, 4)
+            else:
+                title, location = m.group(5, 6)
             jobs.append({
                 "job_id": job_id.strip(),
-                "title": html.unescape(title.strip()),
-                "location": html.unescape(location.strip()),
+                "title": _unescape(title.strip()),
+                "location": _unescape(location.strip()),
                 "url_path": url_path.strip(),
             })
 
@@ -222,8 +269,7 @@ class TalentBrewScraper(BaseScraper):
 
     def _is_idf(self, location):
         """Check if location is in Île-de-France."""
-        loc_lower = location.lower()
-        return any(ind in loc_lower for ind in IDF_INDICATORS)
+        return bool(_IDF_RE.search(location))
 
     def _to_offer(self, job, company_name, base_url):
         """Convert parsed job dict to normalized offer."""
@@ -9,9 +9,12 @@ Body: {"limit": 20, "offset": 0, "searchText": "alternance"}
 
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from app.scrapers.base_scraper import BaseScraper
 
@@ -63,6 +66,28 @@ NON_FRANCE_INDICATORS = [
     "australia", "singapore", "japan", "brazil",
 ]
 
+# Single alternation over all indicators: one scan per location string
+_NON_FRANCE_RE = re.compile("|".join(re.escape(ind) for ind in NON_FRANCE_INDICATORS))
+
+# Requisition id at the end of externalPath (e.g. /job/Paris/Title_R0304980-1)
+_EXT_ID_RE = re.compile(r"_([A-Z0-9]+-?\d*)$")
+# "Posted 3 Days Ago" / "Posted 30+ Days Ago"
+_POSTED_DAYS_RE = re.compile(r"(\d+)\+?\s*day")
+# French: "il y a X jours"
+_POSTED_JOURS_RE = re.compile(r"(\d+)\s*jour")
+
+# (company, query) searches run concurrently; pages within one search stay
+# sequential (each needs the previous offset). Requests to each tenant host
+# are paced by _wait_for_host().
+MAX_WORKERS = 8
+
+# A query stops paging after this many consecutive pages without a single
+# France posting; Workday ranks by relevance, not location, so the rest of
+# a global listing is unlikely to bring any. The query then counts as
+# incomplete, so a truncated empty query still falls back to the narrower
+# ones.
+MAX_PAGES_WITHOUT_FRANCE = 3
+
 
 class WorkdayScraper(BaseScraper):
     """
@@ -79,6 +104,26 @@ class WorkdayScraper(BaseScraper):
     def __init__(self):
         super().__init__()
         self.session = requests.Session()
+        # Connection errors, 429 and 5xx are retried with jittered exponential
+        # backoff. The search POST is read-only, so it is safe to retry.
+        retry = Retry(
+            total=3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+            backoff_factor=0.5,
+            backoff_jitter=0.5,
+            backoff_max=8,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=max(1, len(COMPANIES)),
+                pool_maxsize=MAX_WORKERS,
+                max_retries=retry,
+            ),
+        )
         self.session.headers.update({
             "Content-Type": "application/json",
             "Accept": "application/json",
@@ -92,13 +137,31 @@ class WorkdayScraper(BaseScraper):
         Returns:
             list[dict]: Normalized offer dictionaries.
         """
-        all_offers = []
+        # company -> {externalPath: job}, deduplicated across queries
+        jobs_by_company = {company: {} for company in COMPANIES}
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            if "" in SEARCH_QUERIES:
+                # An empty searchText lists every posting of the tenant, which
+                # covers all the narrower queries. Run it first; the narrower
+                # ones are only needed where it stopped early (pagination cap
+                # or error).
+                incomplete = self._run_searches(
+                    pool, [(company, "") for company in COMPANIES], jobs_by_company
+                )
+                searches = [
+                    (company, query)
+                    for company in COMPANIES if company in incomplete
+                    for query in SEARCH_QUERIES if query
+                ]
+            else:
+                searches = [
+                    (company, query) for company in COMPANIES for query in SEARCH_QUERIES
+                ]
+            self._run_searches(pool, searches, jobs_by_company)
 
-        for slug, wd_num, site, company_name in COMPANIES:
-            logger.info(f"[workday] Searching {company_name} ({slug}.wd{wd_num}/{site})")
-            offers = self._search_company(slug, wd_num, site, company_name)
-            all_offers.extend(offers)
-            self._delay()
+        all_offers = []
+        for company, company_jobs in jobs_by_company.items():
+            all_offers.extend(self._filter_company(company, company_jobs))
 
         # Deduplicate by external_id and URL
         seen_ids = set()
@@ -124,24 +187,31 @@ class WorkdayScraper(BaseScraper):
 
         return unique_offers
 
-    def _search_company(self, slug, wd_num, site, company_name):
-        """Search a single company for alternance offers."""
-        all_jobs = []
-
-        for query in SEARCH_QUERIES:
-            jobs = self._fetch_jobs(slug, wd_num, site, query)
-            all_jobs.extend(jobs)
-            self._delay()
-
-        # Deduplicate by externalPath within this company
-        seen = set()
-        unique = []
-        for job in all_jobs:
-            path = job.get("externalPath", "")
-            if path in seen:
-                continue
-            seen.add(path)
-            unique.append(job)
+    def _run_searches(self, pool, searches, jobs_by_company):
+        """
+        Run (company, query) searches on the pool, merging the jobs into
+        jobs_by_company. Returns the companies whose results are incomplete.
+        """
+        incomplete = set()
+        results = pool.map(lambda search: self._search_query(*search), searches)
+        for (company, _), (jobs, complete) in zip(searches, results):
+            company_jobs = jobs_by_company[company]
+            for job in jobs:
+                company_jobs.setdefault(job.get("externalPath", ""), job)
+            if not complete:
+                incomplete.add(company)
+        return incomplete
+
+    def _search_query(self, company, query):
+        """Run one query against one company's Workday site."""
+        slug, wd_num, site, company_name = company
+        logger.info(f"[workday] Searching {company_name} ({slug}.wd{wd_num}/{site}): '{query}'")
+        return self._fetch_jobs(slug, wd_num, site, query)
+
+    def _filter_company(self, company, jobs):
+        """Keep one company's France postings as normalized offers."""
+        slug, wd_num, _, company_name = company
+        unique = list(jobs.values())
 
         # Filter for France and parse
         base_url = f"https://{slug}.wd{wd_num}.myworkdayjobs.com"
@@ -165,9 +235,18 @@ class WorkdayScraper(BaseScraper):
         self.session.close()
 
     def _fetch_jobs(self, slug, wd_num, site, query):
-        """Fetch jobs from the Workday API with pagination."""
+        """
+        Fetch jobs from the Workday API with pagination.
+
+        Returns:
+            tuple: (jobs, complete), complete being False when pagination
+            stopped before the reported total (page cap, pages without
+            France postings, or error).
+        """
         MAX_PAGES = 50
         all_jobs = []
+        complete = False
+        pages_without_france = 0
         offset = 0
         limit = 20
         page = 0
@@ -188,6 +267,7 @@ class WorkdayScraper(BaseScraper):
             }
 
             try:
+                self._wait_for_host(url)
                 response = self.session.post(
                     url, json=payload, timeout=self.config.TIMEOUT
                 )
@@ -206,15 +286,27 @@ class WorkdayScraper(BaseScraper):
                 all_jobs.extend(jobs)
 
                 if len(all_jobs) >= total or not jobs:
+                    complete = True
                     break
 
+                if any(self._is_france(job) for job in jobs):
+                    pages_without_france = 0
+                else:
+                    pages_without_france += 1
+                    if pages_without_france >= MAX_PAGES_WITHOUT_FRANCE:
+                        logger.info(
+                            f"[workday] No France postings in {pages_without_france} "
+                            f"pages for {slug}/{site} q='{query}', stopping"
+                        )
+                        break
+
                 offset += limit
 
             except requests.exceptions.RequestException as e:
                 logger.error(f"[workday] Request error: {e}")
                 break
 
-        return all_jobs
+        return all_jobs, complete
 
     def _is_france(self, job):
         """Check if a job is located in France (reject known non-France locations)."""
@@ -224,9 +316,8 @@ class WorkdayScraper(BaseScraper):
             return False  # Skip jobs without location
 
         # Reject if location matches a known non-France country
-        for indicator in NON_FRANCE_INDICATORS:
-            if indicator in location:
-                return False
+        if _NON_FRANCE_RE.search(location):
+            return False
 
         # Accept: includes "france", French city names, or unrecognized locations
         # (Workday companies are searched with French queries, so most results are French)
@@ -246,7 +337,7 @@ class WorkdayScraper(BaseScraper):
 
             # External ID from path (e.g., /job/Paris/Title_R0304980-1)
             ext_id = ""
-            path_match = re.search(r'_([A-Z0-9]+-?\d*)$', external_path)
+            path_match = _EXT_ID_RE.search(external_path)
             if path_match:
                 ext_id = path_match.group(1)
 
@@ -292,17 +383,7 @@ class WorkdayScraper(BaseScraper):
         if "today" in text or "aujourd" in text:
             return now
 
-        match = re.search(r"(\d+)\s*day", text)
-        if match:
-            return now - timedelta(days=int(match.group(1)))
-
-        # "Posted 30+ Days Ago"
-        match = re.search(r"(\d+)\+?\s*day", text)
-        if match:
-            return now - timedelta(days=int(match.group(1)))
-
-        # French: "il y a X jours"
-        match = re.search(r"(\d+)\s*jour", text)
+        match = _POSTED_DAYS_RE.search(text) or _POSTED_JOURS_RE.search(text)
         if match:
             return now - timedelta(days=int(match.group(1)))
 
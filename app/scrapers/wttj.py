@@ -4,9 +4,12 @@ Fetches apprenticeship/alternance job offers for sysadmin/infrastructure roles.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from app.scrapers.base_scraper import BaseScraper
 from config import KEYWORDS
@@ -39,6 +42,12 @@ SEARCH_QUERIES = [
     "système information",
 ]
 
+# Max result pages per query (50 hits per page)
+MAX_PAGES = 10
+
+# Pages 2..N of a query are fetched concurrently once page 1 reports nbPages
+MAX_WORKERS = 4
+
 
 class WTTJScraper(BaseScraper):
     """
@@ -48,6 +57,10 @@ class WTTJScraper(BaseScraper):
     alternance offers across France for sysadmin/infrastructure roles.
     """
 
+    # Algolia's search endpoint takes a higher request rate than career sites
+    HOST_RATE = 2.0
+    HOST_BURST = MAX_WORKERS
+
     @property
     def source_name(self):
         return "welcome_to_the_jungle"
@@ -55,6 +68,22 @@ class WTTJScraper(BaseScraper):
     def __init__(self):
         super().__init__()
         self.session = requests.Session()
+        # Connection errors, 429 and 5xx are retried with jittered exponential
+        # backoff. The search POST is read-only, so it is safe to retry.
+        retry = Retry(
+            total=3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+            backoff_factor=0.5,
+            backoff_jitter=0.5,
+            backoff_max=8,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self.session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=MAX_WORKERS, max_retries=retry),
+        )
         self.session.headers.update({
             "x-algolia-application-id": ALGOLIA_APP_ID,
             "x-algolia-api-key": ALGOLIA_API_KEY,
@@ -87,7 +116,6 @@ class WTTJScraper(BaseScraper):
 
             offers = self._search(query, facet_filters)
             all_offers.extend(offers)
-            self._delay()
 
         # Deduplicate by external_id and URL
         seen_ids = set()
@@ -119,52 +147,21 @@ class WTTJScraper(BaseScraper):
 
     def _search(self, query, facet_filters):
         """Run a single Algolia search and return parsed offers."""
-        all_hits = []
-        page = 0
-        max_pages = 10  # Safety limit
-
-        while page < max_pages:
-            payload = {
-                "query": query,
-                "hitsPerPage": 50,
-                "page": page,
-                "facetFilters": facet_filters,
-                "filters": "office.country_code:FR",
-            }
-
-            try:
-                response = self.session.post(
-                    ALGOLIA_URL, json=payload, timeout=self.config.TIMEOUT
+        first = self._fetch_page(query, facet_filters, 0)
+        if first is None:
+            return []
+        all_hits, nb_pages = first
+
+        remaining = range(1, min(nb_pages, MAX_PAGES))
+        if remaining:
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+                pages = pool.map(
+                    lambda page: self._fetch_page(query, facet_filters, page),
+                    remaining,
                 )
-
-                if response.status_code != 200:
-                    logger.error(
-                        f"[wttj] Algolia returned {response.status_code}: "
-                        f"{response.text[:200]}"
-                    )
-                    break
-
-                data = response.json()
-                hits = data.get("hits", [])
-                nb_pages = data.get("nbPages", 0)
-
-                label = f"q='{query}'" if query else "sub-category"
-                logger.info(
-                    f"[wttj] [{label}] page {page + 1}/{nb_pages}: "
-                    f"{len(hits)} hits"
-                )
-
-                all_hits.extend(hits)
-
-                page += 1
-                if page >= nb_pages:
-                    break
-
-                self._delay()
-
-            except requests.exceptions.RequestException as e:
-                logger.error(f"[wttj] Request error: {e}")
-                break
+                for result in pages:
+                    if result is not None:
+                        all_hits.extend(result[0])
 
         # Parse all hits into normalized offers
         offers = []
@@ -175,6 +172,49 @@ class WTTJScraper(BaseScraper):
 
         return offers
 
+    def _fetch_page(self, query, facet_filters, page):
+        """
+        Fetch one page of Algolia results.
+
+        Returns:
+            tuple or None: (hits, nb_pages), or None on error.
+        """
+        payload = {
+            "query": query,
+            "hitsPerPage": 50,
+            "page": page,
+            "facetFilters": facet_filters,
+            "filters": "office.country_code:FR",
+        }
+
+        try:
+            self._wait_for_host(ALGOLIA_URL)
+            response = self.session.post(
+                ALGOLIA_URL, json=payload, timeout=self.config.TIMEOUT
+            )
+
+            if response.status_code != 200:
+                logger.error(
+                    f"[wttj] Algolia returned {response.status_code}: "
+                    f"{response.text[:200]}"
+                )
+                return None
+
+            data = response.json()
+            hits = data.get("hits", [])
+            nb_pages = data.get("nbPages", 0)
+
+            label = f"q='{query}'" if query else "sub-category"
+            logger.info(
+                f"[wttj] [{label}] page {page + 1}/{nb_pages}: "
+                f"{len(hits)} hits"
+            )
+            return hits, nb_pages
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"[wttj] Request error: {e}")
+            return None
+
     def _parse_hit(self, hit):
         """Parse a single Algolia hit into a normalized offer dict."""
         try:
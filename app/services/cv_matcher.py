@@ -11,35 +11,80 @@ Usage:
     scores = matcher.score_offers(offers)   # {offer_id: float 0-100}
 """
 
+import functools
 import logging
 import re
+import threading
 
 logger = logging.getLogger(__name__)
 
-
+# Size of the hashed uni/bigram feature space. Large enough that collisions
+# between distinct terms are negligible for a few thousand offers.
+N_FEATURES = 2 ** 20
+
+# Minimal French stop-word list for TF-IDF
+FRENCH_STOP_WORDS = frozenset([
+    "le", "la", "les", "de", "du", "des", "et", "en", "au", "aux",
+    "un", "une", "pour", "par", "sur", "avec", "dans", "qui", "que",
+    "est", "son", "sa", "ses", "ce", "se", "ou", "à", "il", "elle",
+    "ils", "elles", "nous", "vous", "je", "tu", "me", "te", "lui",
+    "y", "en", "ne", "pas", "plus", "très", "bien", "tout", "tous",
+    "cette", "cet", "ces", "mon", "ma", "mes", "ton", "ta", "tes",
+    "notre", "votre", "leur", "leurs", "ont", "été", "être", "avoir",
+    "fait", "faire", "comme", "mais", "si", "car", "donc", "or",
+    "ni", "on", "autres", "même", "aussi", "encore", "déjà",
+    "toute", "toutes", "ainsi", "afin", "lors", "dont", "d", "l",
+    "s", "n", "j", "m", "qu",
+])
+
+# Sorted list form for sklearn, which does not accept a frozenset
+_STOP_WORDS_LIST = sorted(FRENCH_STOP_WORDS)
+
+# Hashed term counts of recently scored offers, keyed by (id, hash of
+# title, company and description) so edited offers are recounted without
+# the cache holding on to every description string. Shared by all
+# matchers: re-scoring the same offers for another user or a new CV only
+# tokenizes offers not seen before. Oldest entries are evicted first.
+OFFER_COUNTS_CACHE_SIZE = 20_000
+_offer_counts_cache = {}
+_offer_counts_lock = threading.Lock()
+
+# Runs of HTML tags and whitespace, collapsed to one space in a single pass
+_TAGS_WS_RE = re.compile(r"(?:<[^>]+>|\s)+")
+
+
+@functools.lru_cache(maxsize=None)
 def _check_deps():
-    """Import heavy ML deps lazily so the rest of the app still loads without them."""
+    """
+    Import heavy ML deps lazily so the rest of the app still loads without them.
+
+    Runs once: returns (hasher, TfidfTransformer, vstack), where hasher is a
+    shared HashingVectorizer (stateless, so safe to reuse across calls).
+    """
     try:
-        from sklearn.feature_extraction.text import TfidfVectorizer
-        from sklearn.metrics.pairwise import cosine_similarity
-        return TfidfVectorizer, cosine_similarity
+        from scipy.sparse import vstack
+        from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
     except ImportError:
         raise ImportError(
             "scikit-learn is required for CV matching. "
             "Install it with: pip install scikit-learn"
         )
+    hasher = HashingVectorizer(
+        analyzer="word",
+        ngram_range=(1, 2),
+        n_features=N_FEATURES,
+        alternate_sign=False,
+        norm=None,
+        stop_words=_STOP_WORDS_LIST,
+    )
+    return hasher, TfidfTransformer, vstack
 
 
 def _normalize(text):
     """Lower-case and strip accents/punctuation for consistent tokenization."""
     if not text:
         return ""
-    text = text.lower()
-    # Remove HTML tags
-    text = re.sub(r"<[^>]+>", " ", text)
-    # Collapse whitespace
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+    return _TAGS_WS_RE.sub(" ", text.lower()).strip()
 
 
 def _offer_text(offer):
@@ -52,47 +97,64 @@ def _offer_text(offer):
     return _normalize(" ".join(parts))
 
 
+def _offer_counts(offer_list, hasher, vstack):
+    """Hashed term-count matrix (one row per offer), served from the cache."""
+    keys = [(o.id, hash((o.title, o.company, o.description))) for o in offer_list]
+    with _offer_counts_lock:
+        rows = [_offer_counts_cache.get(key) for key in keys]
+
+    missing = [i for i, row in enumerate(rows) if row is None]
+    if missing:
+        fresh = hasher.transform([_offer_text(offer_list[i]) for i in missing])
+        with _offer_counts_lock:
+            for j, i in enumerate(missing):
+                rows[i] = _offer_counts_cache[keys[i]] = fresh[j]
+            while len(_offer_counts_cache) > OFFER_COUNTS_CACHE_SIZE:
+                del _offer_counts_cache[next(iter(_offer_counts_cache))]
+
+    return vstack(rows, format="csr")
+
+
 class CVMatcher:
     """
-    Fits a TF-IDF model on a set of job offers + the user's CV, then
+    Fits TF-IDF weights on a set of job offers + the user's CV, then
     returns cosine-similarity scores between the CV and each offer.
+
+    Term counts come from a stateless HashingVectorizer, so no vocabulary
+    is built per call and the CV's counts are computed once per matcher;
+    only the IDF weights are fitted on each scored corpus.
     """
 
     def __init__(self, cv_text: str):
         if not cv_text or not cv_text.strip():
             raise ValueError("CV text is empty")
         self.cv_text = _normalize(cv_text)
+        self._cv_counts = None
 
     def score_offers(self, offers) -> dict:
         """
         Compute a 0-100 match score for each offer.
 
         Args:
-            offers: iterable of Offer ORM objects (need .id, .title,
-                    .company, .description)
+            offers: iterable of Offer ORM objects or column rows
+                    (need .id, .title, .company, .description)
 
         Returns:
             dict mapping offer.id -> float (0-100, rounded to 1 decimal)
         """
-        TfidfVectorizer, cosine_similarity = _check_deps()
+        hasher, TfidfTransformer, vstack = _check_deps()
 
         offer_list = list(offers)
         if not offer_list:
             return {}
 
-        offer_texts = [_offer_text(o) for o in offer_list]
-        corpus = offer_texts + [self.cv_text]
-
         try:
-            vectorizer = TfidfVectorizer(
-                analyzer="word",
-                ngram_range=(1, 2),
-                sublinear_tf=True,
-                min_df=1,
-                max_features=20_000,
-                stop_words=_french_stop_words(),
+            if self._cv_counts is None:
+                self._cv_counts = hasher.transform([self.cv_text])
+            counts = vstack(
+                [_offer_counts(offer_list, hasher, vstack), self._cv_counts]
             )
-            tfidf = vectorizer.fit_transform(corpus)
+            tfidf = TfidfTransformer(sublinear_tf=True).fit_transform(counts)
         except ValueError as e:
             logger.warning(f"[cv_matcher] TF-IDF error: {e}")
             return {o.id: 0.0 for o in offer_list}
@@ -101,27 +163,10 @@ class CVMatcher:
         cv_vec = tfidf[-1]
         offer_vecs = tfidf[:-1]
 
-        similarities = cosine_similarity(cv_vec, offer_vecs).flatten()
-
-        scores = {}
-        for offer, sim in zip(offer_list, similarities):
-            scores[offer.id] = round(float(sim) * 100, 1)
-
-        return scores
-
-
-def _french_stop_words():
-    """Minimal French stop-word list for TF-IDF."""
-    return [
-        "le", "la", "les", "de", "du", "des", "et", "en", "au", "aux",
-        "un", "une", "pour", "par", "sur", "avec", "dans", "qui", "que",
-        "est", "son", "sa", "ses", "ce", "se", "ou", "à", "il", "elle",
-        "ils", "elles", "nous", "vous", "je", "tu", "me", "te", "lui",
-        "y", "en", "ne", "pas", "plus", "très", "bien", "tout", "tous",
-        "cette", "cet", "ces", "mon", "ma", "mes", "ton", "ta", "tes",
-        "notre", "votre", "leur", "leurs", "ont", "été", "être", "avoir",
-        "fait", "faire", "comme", "mais", "si", "car", "donc", "or",
-        "ni", "on", "autres", "même", "aussi", "encore", "déjà",
-        "toute", "toutes", "ainsi", "afin", "lors", "dont", "d", "l",
-        "s", "n", "j", "m", "qu",
-    ]
+        # TfidfTransformer L2-normalizes each row, so the cosine similarity is
+        # a plain sparse dot product; ravel() avoids flatten()'s copy
+        similarities = (offer_vecs @ cv_vec.T).toarray().ravel()
+
+        # Scale and round the whole array at once
+        percents = (similarities * 100).round(1).tolist()
+        return dict(zip((o.id for o in offer_list), percents))
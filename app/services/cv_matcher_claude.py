@@ -14,11 +14,41 @@ Usage:
 import json
 import logging
 import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from app.services.cv_matcher import FRENCH_STOP_WORDS
+from app.services.filter_engine import normalize_text
 
 logger = logging.getLogger(__name__)
 
 BATCH_SIZE = 10
 
+# Batches sent to the API at the same time (each call is I/O-bound; kept
+# small to stay under the account's rate limit)
+MAX_CONCURRENT_BATCHES = 5
+
+# Keyword prefilter: offers sharing none of the CV's most frequent
+# CV_KEYWORDS terms are scored 0 without an API call
+CV_KEYWORDS = 50
+_TOKEN_RE = re.compile(r"\w\w+")
+
+# Stop words in the same accent-folded form as the tokens they filter
+_STOP_WORDS_NORM = frozenset(normalize_text(w) for w in FRENCH_STOP_WORDS)
+
+# Markdown code fence around the JSON reply, at either end
+_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+
+def _keywords(text: str) -> list:
+    """
+    Lower-cased, accent-folded word tokens of text, stop words removed.
+
+    Folded like FilterEngine's matching, so "réseau" in the CV and
+    "reseau" in an offer count as the same keyword.
+    """
+    return [t for t in _TOKEN_RE.findall(normalize_text(text)) if t not in _STOP_WORDS_NORM]
+
 
 def _offer_summary(offer):
     """Build a short text summary of an offer for the prompt."""
@@ -32,18 +62,13 @@ def _offer_summary(offer):
     return " – ".join(p for p in parts if p)
 
 
-def _build_prompt(cv_text: str, batch: list) -> str:
-    offers_block = "\n".join(
-        f'- ID {offer.id}: {_offer_summary(offer)}' for offer in batch
-    )
-    return f"""Tu es un recruteur senior exigeant. Évalue la compatibilité RÉELLE entre ce CV et chaque offre d'emploi. Sois STRICT et RÉALISTE dans tes scores — la plupart des offres doivent obtenir entre 20% et 60%.
+def _build_prompt_prefix(cv_text: str) -> str:
+    """Instructions, CV and rubric: identical for every batch."""
+    return f"""Tu es un recruteur senior exigeant. Évalue la compatibilité RÉELLE entre ce CV et chaque offre d'emploi listée à la fin. Sois STRICT et RÉALISTE dans tes scores — la plupart des offres doivent obtenir entre 20% et 60%.
 
 CV DU CANDIDAT :
 {cv_text[:3000]}
 
-OFFRES D'EMPLOI :
-{offers_block}
-
 Réponds UNIQUEMENT avec un objet JSON valide (pas de markdown, pas de texte avant/après) :
 {{
   "<id_offre>": {{"score": <0-100>, "raison": "<explication courte en 1 phrase>"}},
@@ -65,6 +90,15 @@ RÈGLES IMPORTANTES :
 - Ne sois PAS généreux : un score moyen de 40-50% pour un ensemble d'offres mixtes est normal"""
 
 
+def _build_offers_block(batch: list) -> str:
+    """The per-batch part of the prompt."""
+    offers_block = "\n".join(
+        f'- ID {offer.id}: {_offer_summary(offer)}' for offer in batch
+    )
+    return f"""OFFRES D'EMPLOI :
+{offers_block}"""
+
+
 class ClaudeCVMatcher:
     """
     Scores job offers against a CV using Claude Haiku.
@@ -76,13 +110,25 @@ class ClaudeCVMatcher:
             raise ValueError("CV text is empty")
         self.cv_text = cv_text.strip()
         self.total_tokens_used = 0
+        # Sent first in every request. Not marked for prompt caching: with
+        # the CV capped at 3000 characters it stays well under the model's
+        # minimum cacheable prompt length, so cache_control would be ignored
+        self._prompt_prefix = _build_prompt_prefix(self.cv_text)
+        self._cv_keywords = {
+            word for word, _ in Counter(_keywords(self.cv_text)).most_common(CV_KEYWORDS)
+        }
+
+    def _shares_keywords(self, offer) -> bool:
+        """Cheap lexical check: does the offer mention any CV keyword?"""
+        text = f"{offer.title or ''} {offer.description or ''}"
+        return not self._cv_keywords.isdisjoint(_keywords(text))
 
     def score_offers(self, offers, progress_callback=None) -> dict:
         """
         Compute a 0-100 match score for each offer using Claude.
 
         Args:
-            offers:            iterable of Offer ORM objects (.id, .title, .company, .description)
+            offers:            iterable of Offer ORM objects or column rows (.id, .title, .company, .description)
             progress_callback: optional callable(batches_done, total_batches, offers_done)
                                called after each batch completes — used for async progress tracking.
 
@@ -114,80 +160,138 @@ class ClaudeCVMatcher:
             return {}
 
         scores = {}
+        candidates = []
+        for offer in offer_list:
+            if self._shares_keywords(offer):
+                candidates.append(offer)
+            else:
+                scores[offer.id] = 0.0
+        if scores:
+            logger.info(
+                f"[cv_matcher_claude] {len(scores)}/{len(offer_list)} offers share "
+                "no keyword with the CV, scored 0 without an API call"
+            )
+        if not candidates:
+            return scores
+
         batches = [
-            offer_list[i: i + BATCH_SIZE]
-            for i in range(0, len(offer_list), BATCH_SIZE)
+            candidates[i: i + BATCH_SIZE]
+            for i in range(0, len(candidates), BATCH_SIZE)
         ]
 
         total_batches = len(batches)
-        offers_done = 0
+        batches_done = 0
+        offers_done = len(scores)
 
-        for idx, batch in enumerate(batches):
-            logger.info(
-                f"[cv_matcher_claude] Batch {idx + 1}/{total_batches} "
-                f"({len(batch)} offers)…"
+        def record(batch, batch_scores, tokens):
+            nonlocal batches_done, offers_done
+            scores.update(batch_scores)
+            self.total_tokens_used += tokens
+
+            batches_done += 1
+            offers_done += len(batch)
+            if progress_callback is not None:
+                progress_callback(batches_done, total_batches, offers_done)
+
+        # The first batch is sent alone so that a fatal error (bad key, no
+        # credit) surfaces before the other requests go out
+        record(batches[0], *self._score_batch(client, model, batches[0], 0, total_batches))
+        if total_batches == 1:
+            return scores
+
+        pool = ThreadPoolExecutor(
+            max_workers=min(MAX_CONCURRENT_BATCHES, total_batches - 1)
+        )
+        try:
+            futures = {
+                pool.submit(
+                    self._score_batch, client, model, batch, idx, total_batches
+                ): batch
+                for idx, batch in enumerate(batches[1:], start=1)
+            }
+            for future in as_completed(futures):
+                record(futures[future], *future.result())
+        finally:
+            # A fatal error stops the batches that have not started yet
+            pool.shutdown(wait=True, cancel_futures=True)
+
+        return scores
+
+    def _score_batch(self, client, model, batch, idx, total_batches):
+        """
+        Score one batch of offers with a single API call.
+
+        Returns:
+            tuple: ({offer.id: score}, tokens used). Recoverable errors
+            score the whole batch 0; fatal API errors raise RuntimeError.
+        """
+        import anthropic  # already checked by score_offers
+
+        logger.info(
+            f"[cv_matcher_claude] Batch {idx + 1}/{total_batches} "
+            f"({len(batch)} offers)…"
+        )
+        content = [
+            {"type": "text", "text": self._prompt_prefix},
+            {"type": "text", "text": _build_offers_block(batch)},
+        ]
+        scores = {}
+        tokens = 0
+        try:
+            message = client.messages.create(
+                model=model,
+                max_tokens=1024,
+                messages=[{"role": "user", "content": content}],
             )
-            prompt = _build_prompt(self.cv_text, batch)
-            try:
-                message = client.messages.create(
-                    model=model,
-                    max_tokens=1024,
-                    messages=[{"role": "user", "content": prompt}],
-                )
-                raw = message.content[0].text.strip()
-                if hasattr(message, 'usage') and message.usage:
-                    self.total_tokens_used += (
-                        (message.usage.input_tokens or 0) +
-                        (message.usage.output_tokens or 0)
-                    )
-                # Strip markdown code fences if present
-                raw = re.sub(r"^```(?:json)?\s*", "", raw)
-                raw = re.sub(r"\s*```$", "", raw)
-                data = json.loads(raw)
-
-                for offer in batch:
-                    key = str(offer.id)
-                    if key in data:
-                        entry = data[key]
-                        score = float(entry.get("score", 0))
-                        scores[offer.id] = round(min(max(score, 0), 100), 1)
-                    else:
-                        scores[offer.id] = 0.0
-
-            except json.JSONDecodeError as e:
-                logger.warning(
-                    f"[cv_matcher_claude] JSON parse error in batch {idx + 1}: {e}"
+            raw = message.content[0].text.strip()
+            if hasattr(message, 'usage') and message.usage:
+                tokens = (
+                    (message.usage.input_tokens or 0) +
+                    (message.usage.output_tokens or 0)
                 )
-                for offer in batch:
-                    scores[offer.id] = 0.0
-            except anthropic.BadRequestError as e:
-                logger.error(f"[cv_matcher_claude] 400 error in batch {idx + 1}: {e}")
-                raise RuntimeError(f"Erreur API Claude (400) : {e}") from e
-            except anthropic.APIStatusError as e:
-                msg = str(e).lower()
-                if "credit balance is too low" in msg or e.status_code in (400, 402):
-                    logger.error(
-                        f"[cv_matcher_claude] Fatal API error (status {e.status_code}), "
-                        "stopping early."
-                    )
-                    raise RuntimeError(
-                        f"Crédit Anthropic insuffisant ou erreur fatale "
-                        f"(HTTP {e.status_code}) : {e}"
-                    ) from e
-                logger.error(
-                    f"[cv_matcher_claude] API error in batch {idx + 1}: {e}"
-                )
-                for offer in batch:
+            # Strip markdown code fences if present
+            raw = _FENCE_RE.sub("", raw)
+            data = json.loads(raw)
+
+            for offer in batch:
+                key = str(offer.id)
+                if key in data:
+                    entry = data[key]
+                    score = float(entry.get("score", 0))
+                    scores[offer.id] = round(min(max(score, 0), 100), 1)
+                else:
                     scores[offer.id] = 0.0
-            except Exception as e:
+
+        except json.JSONDecodeError as e:
+            logger.warning(
+                f"[cv_matcher_claude] JSON parse error in batch {idx + 1}: {e}"
+            )
+            for offer in batch:
+                scores[offer.id] = 0.0
+        except anthropic.BadRequestError as e:
+            logger.error(f"[cv_matcher_claude] 400 error in batch {idx + 1}: {e}")
+            raise RuntimeError(f"Erreur API Claude (400) : {e}") from e
+        except anthropic.APIStatusError as e:
+            msg = str(e).lower()
+            if "credit balance is too low" in msg or e.status_code in (400, 402):
                 logger.error(
-                    f"[cv_matcher_claude] API error in batch {idx + 1}: {e}"
+                    f"[cv_matcher_claude] Fatal API error (status {e.status_code}), "
+                    "stopping early."
                 )
-                for offer in batch:
-                    scores[offer.id] = 0.0
-
-            offers_done += len(batch)
-            if progress_callback is not None:
-                progress_callback(idx + 1, total_batches, offers_done)
+                raise RuntimeError(
+                    f"Crédit Anthropic insuffisant ou erreur fatale "
+                    f"(HTTP {e.status_code}) : {e}"
+                ) from e
+            logger.error(
+                f"[cv_matcher_claude] API error in batch {idx + 1}: {e}"
+            )
+            for offer in batch:
+                scores[offer.id] = 0.0
+        except Exception as e:
+            logger.error(
+                f"[cv_matcher_claude] API error in batch {idx + 1}: {e}"
+            )
+            for offer in batch:
+                scores[offer.id] = 0.0
 
-        return scores
+        return scores, tokens
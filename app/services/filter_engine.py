@@ -4,6 +4,7 @@ Filters and scores job offers based on keywords, location, contract type,
 and target company matching.
 """
 
+import heapq
 import logging
 import re
 import unicodedata
@@ -17,6 +18,22 @@ logger = logging.getLogger(__name__)
 # These bypass the keyword filter and only go through location filtering.
 PREFILTERED_SOURCES = {"la_bonne_alternance"}
 
+# 5-digit French postal code (e.g., 75001, 92100)
+_POSTAL_CODE_RE = re.compile(r"\b(\d{5})\b")
+
+# Postal code prefixes rejected whatever the configured departments (Corsica)
+REJECTED_DEPARTMENTS = frozenset({"20"})
+
+# IDF department names or common identifiers found in location strings
+IDF_INDICATORS = (
+    "paris", "ile-de-france", "ile de france", "idf",
+    "hauts-de-seine", "seine-saint-denis", "val-de-marne",
+    "val-d'oise", "yvelines", "essonne", "seine-et-marne",
+)
+
+# Single alternation over all indicators: one scan per location string
+_IDF_RE = re.compile("|".join(re.escape(ind) for ind in IDF_INDICATORS), re.IGNORECASE)
+
 # Accent mapping for French characters
 ACCENT_MAP = str.maketrans(
     "àâäéèêëïîôùûüÿçœæÀÂÄÉÈÊËÏÎÔÙÛÜŸÇŒÆ",
@@ -26,7 +43,47 @@ ACCENT_MAP = str.maketrans(
 
 def normalize_text(text):
     """Remove accents and normalize text for matching."""
-    return text.lower().translate(ACCENT_MAP)
+    text = text.lower()
+    # Pure ASCII text has no accents to map
+    if text.isascii():
+        return text
+    return text.translate(ACCENT_MAP)
+
+
+# TARGET_COMPANIES is fixed for the process (unlike KEYWORDS, which
+# run_scrapers patches per domain), so its normalized forms and the single
+# alternation over them are built once at import: one scan per company
+# string instead of a substring test per target
+_TARGETS_NORM = tuple(normalize_text(c) for c in TARGET_COMPANIES)
+_TARGET_RE = (
+    re.compile("|".join(re.escape(c) for c in _TARGETS_NORM))
+    if _TARGETS_NORM else None
+)
+
+
+# Offer dict keys caching the normalized fields and keyword hit counts
+# while the offer is filtered
+_CACHE_KEYS = ("_title_norm", "_desc_norm", "_company_norm", "_title_hits", "_desc_hits")
+
+
+def _norm_fields(offer):
+    """
+    Return the normalized (title, description, company) of an offer dict.
+
+    Computed on first use and cached on the dict, so the keyword, target
+    company and scoring steps share one normalization per field.
+    """
+    if "_title_norm" not in offer:
+        offer["_title_norm"] = normalize_text(offer.get("title") or "")
+        offer["_desc_norm"] = normalize_text(offer.get("description") or "")
+        offer["_company_norm"] = normalize_text(offer.get("company") or "")
+    return offer["_title_norm"], offer["_desc_norm"], offer["_company_norm"]
+
+
+def _drop_cached_fields(offer):
+    """Remove the cached normalized fields and hit counts from an offer dict."""
+    for key in _CACHE_KEYS:
+        offer.pop(key, None)
 
 
 class FilterEngine:
@@ -43,35 +100,31 @@ class FilterEngine:
     def __init__(self):
         self.keywords = [kw.lower() for kw in KEYWORDS]
         self.filters = FILTERS
-        self.target_companies = [normalize_text(c) for c in TARGET_COMPANIES]
+        self.target_companies = _TARGETS_NORM
+        self.target_regex = _TARGET_RE
 
         # Departments that are part of Ile-de-France
-        self.idf_departments = set(FILTERS.get("departments", []))
+        self.idf_departments = frozenset(FILTERS.get("departments", []))
 
-        # Pre-compile keyword patterns WITH accent-normalized versions
-        # This matches both "systèmes" and "systemes"
-        self.keyword_patterns = []
-        for kw in KEYWORDS:
-            # Original pattern (with accents)
-            self.keyword_patterns.append(re.compile(re.escape(kw), re.IGNORECASE))
-            # Normalized pattern (without accents)
-            normalized = normalize_text(kw)
-            if normalized != kw.lower():
-                self.keyword_patterns.append(
-                    re.compile(re.escape(normalized), re.IGNORECASE)
-                )
+        # (lower-cased, accent-normalized) form of each keyword. Keywords
+        # are literals, and str.__contains__ beats a regex scan for them.
+        self.keyword_forms = [(kw.lower(), normalize_text(kw)) for kw in KEYWORDS]
 
-    def filter_offers(self, offers):
+    def filter_offers(self, offers, top_k=None):
         """
-        Apply all filters to a list of raw offers.
+        Apply all filters to raw offers.
 
         Args:
-            offers: list[dict] - Raw offers from scrapers
+            offers: iterable of dict - Raw offers from scrapers; consumed
+                    once, so a generator lets filtering start while later
+                    scrapers are still running
+            top_k: int or None - If set, only the top_k offers by relevance
+                   are returned (partial heap selection instead of a full sort)
 
         Returns:
             list[dict]: Filtered and scored offers, sorted by relevance
         """
-        logger.info(f"[filter] Processing {len(offers)} raw offers...")
+        logger.info("[filter] Processing raw offers...")
 
         filtered = []
         rejected_count = 0
@@ -82,29 +135,35 @@ class FilterEngine:
                 rejected_count += 1
                 continue
 
-            # Apply filters
-            if not self._passes_filters(offer):
+            # Apply filters, then calculate relevance score
+            if self._passes_filters(offer):
+                offer["relevance_score"] = self._calculate_score(offer)
+                filtered.append(offer)
+            else:
                 rejected_count += 1
-                continue
-
-            # Calculate relevance score
-            offer["relevance_score"] = self._calculate_score(offer)
-            filtered.append(offer)
-
-        # Sort by relevance score (highest first)
-        filtered.sort(key=lambda o: o.get("relevance_score", 0), reverse=True)
+            _drop_cached_fields(offer)
 
         logger.info(
-            f"[filter] Results: {len(filtered)} accepted, "
-            f"{rejected_count} rejected"
+            "[filter] Results: %d accepted, %d rejected",
+            len(filtered), rejected_count,
         )
 
+        # Sort by relevance score (highest first); a heap selection is
+        # enough when only the top_k offers are wanted
+        if top_k is not None:
+            return heapq.nlargest(
+                top_k, filtered, key=lambda o: o.get("relevance_score", 0)
+            )
+        filtered.sort(key=lambda o: o.get("relevance_score", 0), reverse=True)
+
         return filtered
 
     def _is_target_company(self, offer):
         """Check if the offer is from a target company."""
-        company_norm = normalize_text(offer.get("company") or "")
-        return any(target in company_norm for target in self.target_companies)
+        if self.target_regex is None:
+            return False
+        _, _, company_norm = _norm_fields(offer)
+        return bool(self.target_regex.search(company_norm))
 
     def _passes_filters(self, offer):
         """
@@ -133,22 +192,29 @@ class FilterEngine:
     def _matches_keywords(self, offer):
         """
         Check if at least one keyword matches the offer title or description.
-        Searches both original text and accent-normalized text.
+        Matching is case and accent insensitive.
 
         Returns True if any keyword is found.
         """
-        title = offer.get("title") or ""
-        description = offer.get("description") or ""
-
-        # Search both original and accent-normalized text
-        text = f"{title} {description}".lower()
-        text_normalized = normalize_text(f"{title} {description}")
+        title_hits, desc_hits = self._keyword_hits(offer)
+        return bool(title_hits or desc_hits)
 
-        for pattern in self.keyword_patterns:
-            if pattern.search(text) or pattern.search(text_normalized):
-                return True
+    def _keyword_hits(self, offer):
+        """
+        Return the distinct keyword counts of (title, description).
 
-        return False
+        Computed on first use and cached on the offer dict, so the keyword
+        filter and the relevance score share one counting pass.
+        """
+        if "_title_hits" not in offer:
+            title_norm, desc_norm, _ = _norm_fields(offer)
+            offer["_title_hits"] = self._count_keywords(
+                (offer.get("title") or "").lower(), title_norm
+            )
+            offer["_desc_hits"] = self._count_keywords(
+                (offer.get("description") or "").lower(), desc_norm
+            )
+        return offer["_title_hits"], offer["_desc_hits"]
 
     def _matches_location(self, offer):
         """
@@ -163,32 +229,15 @@ class FilterEngine:
             return True  # No location data, keep the offer
 
         # Try to extract department number from postal code
-        # Match 5-digit French postal code (e.g., 75001, 92100)
-        postal_match = re.search(r'\b(\d{5})\b', location)
+        postal_match = _POSTAL_CODE_RE.search(location)
         if postal_match:
-            postal_code = postal_match.group(1)
-            department = postal_code[:2]
-
-            # Handle Corsica (2A, 2B)
-            if department == "20":
-                return False  # Corsica is not IDF
-
-            if department in self.idf_departments:
-                return True
-            else:
-                return False
+            department = postal_match.group(1)[:2]
+            # Corsica (2A, 2B) postal codes start with 20 and are never IDF
+            return department not in REJECTED_DEPARTMENTS and department in self.idf_departments
 
         # Check for IDF department names or common identifiers
-        idf_indicators = [
-            "paris", "ile-de-france", "ile de france", "idf",
-            "hauts-de-seine", "seine-saint-denis", "val-de-marne",
-            "val-d'oise", "yvelines", "essonne", "seine-et-marne",
-        ]
-
-        location_lower = location.lower()
-        for indicator in idf_indicators:
-            if indicator in location_lower:
-                return True
+        if _IDF_RE.search(location):
+            return True
 
         # If we can't determine the location, keep the offer
         return True
@@ -205,47 +254,51 @@ class FilterEngine:
             - Has posted date: +5
         """
         score = 0.0
-        title = (offer.get("title") or "").lower()
-        title_norm = normalize_text(offer.get("title") or "")
-        description = (offer.get("description") or "").lower()
-        desc_norm = normalize_text(offer.get("description") or "")
-        company = (offer.get("company") or "").lower()
+        title_hits, desc_hits = self._keyword_hits(offer)
 
         # Keyword matches in title (high value)
-        title_matches = 0
-        for pattern in self.keyword_patterns:
-            if pattern.search(title) or pattern.search(title_norm):
-                title_matches += 1
         # Divide by 2 to avoid double-counting accented + non-accented patterns
-        title_matches = (title_matches + 1) // 2
+        title_matches = (title_hits + 1) // 2
         score += min(title_matches * 15, 45)
 
         # Keyword matches in description (lower value)
-        desc_matches = 0
-        for pattern in self.keyword_patterns:
-            if pattern.search(description) or pattern.search(desc_norm):
-                desc_matches += 1
-        desc_matches = (desc_matches + 1) // 2
+        desc_matches = (desc_hits + 1) // 2
         score += min(desc_matches * 5, 20)
 
         # Target company bonus (partial, accent-insensitive)
-        company_norm = normalize_text(offer.get("company") or "")
-        for target in self.target_companies:
-            if target in company_norm:
-                score += 30
-                break
+        if self._is_target_company(offer):
+            score += 30
 
         # Completeness bonuses
-        if description:
+        if offer.get("description"):
             score += 5
         if offer.get("posted_date"):
             score += 5
 
         return min(score, 100.0)
 
+    def _count_keywords(self, text, text_norm):
+        """
+        Count keyword pattern hits in a lower-cased text.
+
+        An accented keyword stands for two patterns, as written and without
+        accents: it counts twice when the text carries the accents and once
+        when it does not. Other keywords count once.
+        """
+        hits = 0
+        for kw, kw_norm in self.keyword_forms:
+            if kw_norm != kw and kw in text:
+                hits += 1
+            if kw_norm in text_norm:
+                hits += 1
+        return hits
+
     def score_offer(self, offer):
         """
         Calculate and return the relevance score for a single offer.
         Useful for rescoring offers without re-filtering.
         """
-        return self._calculate_score(offer)
+        try:
+            return self._calculate_score(offer)
+        finally:
+            _drop_cached_fields(offer)
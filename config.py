@@ -124,8 +124,8 @@ class ScrapingConfig:
     SELENIUM_TIMEOUT = int(os.getenv("SELENIUM_TIMEOUT", "30"))
 
 
-# Job Search Criteria
-KEYWORDS = [
+# Job Search Criteria (tuples: read-only, iterated on every filtered offer)
+KEYWORDS = (
     "administrateur systèmes et réseaux",
     "administrateur systèmes",
     "administrateur réseaux",
@@ -139,12 +139,12 @@ KEYWORDS = [
     "administrateur infrastructure",
     "ingénieur réseaux",
     "sysadmin",
-]
+)
 
 FILTERS = {
     "contract_type": "alternance",
     "location": "France",
-    "departments": [],  # Empty = nationwide (no department filter)
+    "departments": (),  # Empty = nationwide (no department filter)
     "min_level": "bac+3",
     "max_level": "bac+5",
     "duration": "24 months",
@@ -152,7 +152,7 @@ FILTERS = {
 
 # Target companies receive bonus relevance score (+30)
 # Matching is case-insensitive and partial (e.g. "Orange" matches "ORANGE BUSINESS SERVICES")
-TARGET_COMPANIES = [
+TARGET_COMPANIES = (
     # ESN & Intégrateurs (Infra/Cloud/Réseau)
     "Claranet", "Linkbynet", "Cheops Technology", "Oxalide", "Saitis",
     "Axians", "Spie Infoservices", "I-Tracing",
@@ -174,7 +174,7 @@ TARGET_COMPANIES = [
     # Secteur public & organismes gouvernementaux
     "ANSSI", "DINUM", "DGSI", "Ministère des Armées", "Ministère de l'Intérieur",
     "CNES", "CEA", "CNRS", "AP-HP",
-]
+)
 
 # Company Career Sites
 CAREER_SITES = {
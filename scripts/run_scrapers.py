@@ -12,6 +12,7 @@ import hashlib
 import hmac
 import html as _html
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
 
@@ -36,6 +37,9 @@ import app.scrapers.safran as _safran_mod
 import app.scrapers.bpce as _bpce_mod
 import app.services.filter_engine as _fe_mod
 
+from sqlalchemy import insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
 from app.database import SessionLocal, init_db
 from app.models import Offer, Tracking, Domain, User, UserOffer
 from config import Config, LOG_LEVEL
@@ -368,6 +372,24 @@ def load_domains() -> list[tuple[int, str]]:
         db.close()
 
 
+# Max bound parameters per IN (...) lookup, well under SQLite's limit
+_IN_CHUNK = 500
+
+# Scrapers run at the same time per domain. Several scrapers run their own
+# thread pools, so this caps the total number of requests in flight.
+SCRAPER_WORKERS = 4
+
+
+def _existing_values(db, column, values) -> set:
+    """Return the subset of values already stored in the given Offer column."""
+    values = list(values)
+    found = set()
+    for i in range(0, len(values), _IN_CHUNK):
+        chunk = values[i:i + _IN_CHUNK]
+        found.update(v for (v,) in db.query(column).filter(column.in_(chunk)))
+    return found
+
+
 def save_offers_to_db(
     offers: list[dict],
     domain_id: int,
@@ -393,6 +415,14 @@ def save_offers_to_db(
     duplicate_count = 0
 
     try:
+        # external_id has no unique constraint (older rows may share one), so
+        # stored ids are looked up up front, through its index
+        seen_ext_ids.update(_existing_values(
+            db, Offer.external_id,
+            {o["external_id"] for o in offers if o.get("external_id") and o["url"] not in seen_urls},
+        ))
+
+        rows = []
         for offer_data in offers:
             url = offer_data["url"]
             ext_id = offer_data.get("external_id")
@@ -405,54 +435,51 @@ def save_offers_to_db(
                 duplicate_count += 1
                 continue
 
-            # Check DB for existing URL
-            if db.query(Offer.id).filter(Offer.url == url).first():
-                seen_urls.add(url)
-                duplicate_count += 1
-                continue
-
-            # Check DB for existing external_id
-            if ext_id and db.query(Offer.id).filter(Offer.external_id == ext_id).first():
-                seen_ext_ids.add(ext_id)
-                duplicate_count += 1
-                continue
-
-            # Create new offer
-            new_offer = Offer(
-                title=offer_data["title"],
-                company=offer_data["company"],
-                location=offer_data.get("location"),
-                contract_type=offer_data.get("contract_type"),
-                description=offer_data.get("description"),
-                url=url,
-                source=offer_data["source"],
-                external_id=ext_id,
-                posted_date=offer_data.get("posted_date"),
-                relevance_score=offer_data.get("relevance_score", 0.0),
-                offer_type=offer_data.get("offer_type", "job"),
-                found_date=datetime.utcnow(),
-                domain_id=domain_id,
-            )
-            db.add(new_offer)
-            db.flush()  # get offer.id before creating tracking entry
-
-            tracking = Tracking(offer_id=new_offer.id, status="New")
-            db.add(tracking)
+            rows.append({
+                "title": offer_data["title"],
+                "company": offer_data["company"],
+                "location": offer_data.get("location"),
+                "contract_type": offer_data.get("contract_type"),
+                "description": offer_data.get("description"),
+                "url": url,
+                "source": offer_data["source"],
+                "external_id": ext_id,
+                "posted_date": offer_data.get("posted_date"),
+                "relevance_score": offer_data.get("relevance_score", 0.0),
+                "offer_type": offer_data.get("offer_type", "job"),
+                "found_date": datetime.utcnow(),
+                "domain_id": domain_id,
+            })
 
             seen_urls.add(url)
             if ext_id:
                 seen_ext_ids.add(ext_id)
-            new_count += 1
 
-            if new_offer_ids is not None:
-                new_offer_ids.append(new_offer.id)
+        new_ids = []
+        if rows:
+            # offers.url is UNIQUE: SQLite skips URLs already stored
+            # (INSERT ... ON CONFLICT DO NOTHING) and only returns the ids of
+            # the rows it inserted, all in batched multi-row statements
+            stmt = sqlite_insert(Offer).on_conflict_do_nothing(index_elements=["url"])
+            new_ids = list(db.scalars(stmt.returning(Offer.id), rows))
+            if new_ids:
+                db.execute(
+                    insert(Tracking),
+                    [{"offer_id": offer_id, "status": "New"} for offer_id in new_ids],
+                )
+
+        new_count = len(new_ids)
+        duplicate_count += len(rows) - new_count
+
+        if new_offer_ids is not None:
+            new_offer_ids.extend(new_ids)
 
         db.commit()
-        logger.info(f"[db] Saved {new_count} new offers, {duplicate_count} duplicates skipped")
+        logger.info("[db] Saved %d new offers, %d duplicates skipped", new_count, duplicate_count)
 
     except Exception as e:
         db.rollback()
-        logger.error(f"[db] Error saving offers: {e}", exc_info=True)
+        logger.error("[db] Error saving offers: %s", e, exc_info=True)
     finally:
         db.close()
 
@@ -477,7 +504,8 @@ def run_domain(
     cfg = DOMAIN_SCRAPER_CONFIG.get(domain_name)
     if cfg is None:
         logger.warning(
-            f"[domain] No scraper config for domain '{domain_name}' (id={domain_id}) — skipping"
+            "[domain] No scraper config for domain '%s' (id=%s) — skipping",
+            domain_name, domain_id,
         )
         return 0, 0
 
@@ -504,26 +532,42 @@ def run_domain(
         _bpce_mod.BpceScraper(),
     ]
 
-    # Collect raw offers from all scrapers
-    all_raw = []
-    for scraper in scrapers:
-        logger.info(f"  [{domain_name}] Running {scraper.source_name}")
-        try:
-            offers = scraper.run()
-            all_raw.extend(offers)
-            logger.info(f"  [{domain_name}]   → {len(offers)} raw offers")
-        except Exception as e:
-            logger.error(f"  [{domain_name}] Scraper {scraper.source_name} failed: {e}", exc_info=True)
+    # Collect raw offers from all scrapers. They are I/O-bound and hit
+    # different sites, so up to SCRAPER_WORKERS of them run concurrently
+    # (submitted in list order). Their results are streamed
+    # into the filter in scraper order (cross-source dedup stays
+    # deterministic), so filtering overlaps with scrapers still running.
+    raw_count = 0
+    with ThreadPoolExecutor(max_workers=SCRAPER_WORKERS) as pool:
+        futures = {}
+        for scraper in scrapers:
+            logger.info("  [%s] Running %s", domain_name, scraper.source_name)
+            futures[scraper] = pool.submit(scraper.run)
+
+        def raw_offers():
+            nonlocal raw_count
+            for scraper in scrapers:
+                # Popped so each scraper's raw list is freed once filtered
+                future = futures.pop(scraper)
+                try:
+                    offers = future.result()
+                except Exception as e:
+                    logger.error("  [%s] Scraper %s failed: %s", domain_name, scraper.source_name, e, exc_info=True)
+                    continue
+                logger.info("  [%s]   → %s: %d raw offers", domain_name, scraper.source_name, len(offers))
+                raw_count += len(offers)
+                yield from offers
+
+        # Filter — FilterEngine reads KEYWORDS from _fe_mod (already patched)
+        filter_engine = _fe_mod.FilterEngine()
+        filtered = filter_engine.filter_offers(raw_offers())
 
-    print(f"  Raw offers collected: {len(all_raw)}")
+    print(f"  Raw offers collected: {raw_count}")
 
-    if not all_raw:
+    if not raw_count:
         print(f"  [!] No raw offers for '{domain_name}'")
         return 0, 0
 
-    # Filter — FilterEngine reads KEYWORDS from _fe_mod (already patched)
-    filter_engine = _fe_mod.FilterEngine()
-    filtered = filter_engine.filter_offers(all_raw)
     print(f"  After filtering: {len(filtered)} offers")
 
     if not filtered:
@@ -574,11 +618,11 @@ def main():
 
     # ── Instant email alerts for high-match offers ───────────────────
     if new_offer_ids:
-        logger.info(f"[alert] Checking {len(new_offer_ids)} new offer(s) for instant alerts...")
+        logger.info("[alert] Checking %d new offer(s) for instant alerts...", len(new_offer_ids))
         try:
             send_instant_alerts(new_offer_ids)
         except Exception as exc:
-            logger.error(f"[alert] Instant alerts failed: {exc}", exc_info=True)
+            logger.error("[alert] Instant alerts failed: %s", exc, exc_info=True)
 
     print(f"\n{'=' * 60}")
     print(f"[OK] All domains processed.")
@@ -635,7 +679,7 @@ def _find_cv_text_for_user(user_id: int) -> str | None:
         elif ext in (".txt", ".rtf"):
             return target.read_text(encoding="utf-8", errors="replace")
     except Exception as exc:
-        logger.warning(f"[alert] Cannot extract CV text for user {user_id}: {exc}")
+        logger.warning("[alert] Cannot extract CV text for user %s: %s", user_id, exc)
     return None
 
 
@@ -804,7 +848,7 @@ def send_instant_alerts(new_offer_ids: list[int]):
                 matcher = CVMatcher(cv_text)
                 scores = matcher.score_offers(domain_offers)
             except Exception as exc:
-                logger.warning(f"[alert] CV matching failed for user {user.username}: {exc}")
+                logger.warning("[alert] CV matching failed for user %s: %s", user.username, exc)
                 continue
 
             # Find offers above threshold, sorted by score desc
@@ -841,11 +885,11 @@ def send_instant_alerts(new_offer_ids: list[int]):
                         user.daily_alert_count += 1
                         total_sent += 1
                         logger.info(
-                            f"[alert] Sent alert to {user.username} ({user.email}): "
-                            f"offer #{offer_id} '{offer.title}' at {score:.0f}%"
+                            "[alert] Sent alert to %s (%s): offer #%s '%s' at %.0f%%",
+                            user.username, user.email, offer_id, offer.title, score,
                         )
                     except Exception as exc:
-                        logger.error(f"[alert] Failed to send alert to {user.email}: {exc}")
+                        logger.error("[alert] Failed to send alert to %s: %s", user.email, exc)
 
             # Also store match scores in user_offers for these offers
             for offer_id, score in high_matches:
@@ -863,7 +907,7 @@ def send_instant_alerts(new_offer_ids: list[int]):
                     ))
 
         db.commit()
-        logger.info(f"[alert] Instant alerts done: {total_sent} email(s) sent.")
+        logger.info("[alert] Instant alerts done: %d email(s) sent.", total_sent)
 
     except Exception:
         db.rollback()
@@ -28,6 +28,10 @@ LOG_FILE      = LOGS_DIR / "scheduler.log"
 SCRAPER_SCRIPT = PROJECT_ROOT / "scripts" / "run_scrapers.py"
 PYTHON        = sys.executable
 
+# Longest single sleep between schedule checks (seconds), so clock changes
+# (DST, system suspend) are picked up within the hour
+MAX_SLEEP = 3600
+
 # ── Logging ─────────────────────────────────────────────────────────────────
 LOGS_DIR.mkdir(exist_ok=True)
 
@@ -157,7 +161,12 @@ def main():
     try:
         while True:
             schedule.run_pending()
-            time.sleep(30)          # check every 30 seconds
+            # Sleep until the next scheduled run instead of polling
+            idle = schedule.idle_seconds()
+            if idle is None:
+                time.sleep(MAX_SLEEP)
+            else:
+                time.sleep(min(max(idle, 1), MAX_SLEEP))
     except KeyboardInterrupt:
         logger.info("Scheduler stopped by user (KeyboardInterrupt)")
 
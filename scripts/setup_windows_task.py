@@ -14,31 +14,51 @@ Requirements:
     - No administrator rights required for user-level tasks
 """
 
-import argparse
+import os
 import subprocess
 import sys
-from datetime import datetime
-from pathlib import Path
 
 TASK_NAME      = "JobHunterScraper"
-PROJECT_ROOT   = Path(__file__).resolve().parent.parent
-SCRAPER_SCRIPT = PROJECT_ROOT / "scripts" / "run_scrapers.py"
+# Plain os.path strings: abspath needs no filesystem calls, unlike
+# Path.resolve(), and the paths are only formatted into the task command
+PROJECT_ROOT   = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRAPER_SCRIPT = os.path.join(PROJECT_ROOT, "scripts", "run_scrapers.py")
 PYTHON         = sys.executable
-
-
-def _schtasks(*args, check=False):
-    """Run schtasks with the given arguments; return CompletedProcess."""
+# Absolute path: no %PATH% search per spawn, and no PATH shadowing
+SCHTASKS       = os.path.join(os.environ.get("SystemRoot", r"C:\Windows"), "System32", "schtasks.exe")
+
+# schtasks is a console program: don't attach or flash a console window for
+# it (e.g. when run from pythonw). The flag only exists on Windows.
+_NO_WINDOW = {"creationflags": subprocess.CREATE_NO_WINDOW} if sys.platform == "win32" else {}
+
+
+def _schtasks(*args, check=False, capture=True):
+    """
+    Run schtasks with the given arguments; return CompletedProcess.
+
+    With capture=False the output is discarded instead of being piped and
+    decoded, for calls that only need the exit code.
+    """
+    if not capture:
+        return subprocess.run(
+            [SCHTASKS, *args],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=check,
+            **_NO_WINDOW,
+        )
     return subprocess.run(
-        ["schtasks", *args],
+        [SCHTASKS, *args],
         capture_output=True,
         text=True,
         check=check,
+        **_NO_WINDOW,
     )
 
 
 def task_exists() -> bool:
     """Return True if the scheduled task already exists."""
-    r = _schtasks("/Query", "/TN", TASK_NAME)
+    r = _schtasks("/Query", "/TN", TASK_NAME, capture=False)
     return r.returncode == 0
 
 
@@ -57,7 +77,7 @@ def create_task(run_time: str) -> None:
     print()
 
     # Verify the scraper script exists before registering
-    if not SCRAPER_SCRIPT.exists():
+    if not os.path.isfile(SCRAPER_SCRIPT):
         print(f"[ERROR] Scraper script not found: {SCRAPER_SCRIPT}")
         sys.exit(1)
 
@@ -71,7 +91,7 @@ def create_task(run_time: str) -> None:
     )
 
     if r.returncode == 0:
-        print(f"[OK] Task '{TASK_NAME}' created successfully.")
+        print(f"[OK] Task '{TASK_NAME}' created (or updated) successfully.")
         print()
         print("Verify with:")
         print(f"    schtasks /Query /TN {TASK_NAME} /FO LIST /V")
@@ -93,16 +113,29 @@ def create_task(run_time: str) -> None:
 
 def delete_task() -> None:
     """Remove the scheduled task."""
+    r = _schtasks("/Delete", "/TN", TASK_NAME, "/F")
+    if r.returncode == 0:
+        print(f"[OK] Task '{TASK_NAME}' deleted.")
+        return
+
+    # schtasks messages are localized, so only probe for the task (a second
+    # spawn) when the delete failed
     if not task_exists():
         print(f"[INFO] Task '{TASK_NAME}' does not exist — nothing to delete.")
         return
 
-    r = _schtasks("/Delete", "/TN", TASK_NAME, "/F")
-    if r.returncode == 0:
-        print(f"[OK] Task '{TASK_NAME}' deleted.")
-    else:
-        print(f"[ERROR] Could not delete task: {r.stderr.strip()}")
-        sys.exit(1)
+    print(f"[ERROR] Could not delete task: {r.stderr.strip()}")
+    sys.exit(1)
+
+
+def _is_valid_time(value: str) -> bool:
+    """Return True for a 24-hour HH:MM time, the format schtasks /ST expects."""
+    if len(value) != 5 or value[2] != ":" or not value.isascii():
+        return False
+    hours, minutes = value[:2], value[3:]
+    if not (hours.isdigit() and minutes.isdigit()):
+        return False
+    return int(hours) <= 23 and int(minutes) <= 59
 
 
 def main() -> None:
@@ -111,6 +144,9 @@ def main() -> None:
         print("        Use cron (crontab -e) on Linux/macOS instead.")
         sys.exit(1)
 
+    # Imported here: not needed before the platform check
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Set up a Windows Scheduled Task for the JobHunter scraper",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -134,15 +170,11 @@ def main() -> None:
         return
 
     # Validate time format
-    try:
-        datetime.strptime(args.time, "%H:%M")
-    except ValueError:
+    if not _is_valid_time(args.time):
         print(f"[ERROR] Invalid --time value '{args.time}'. Use HH:MM (e.g. 08:00).")
         sys.exit(1)
 
-    if task_exists():
-        print(f"[INFO] Task '{TASK_NAME}' already exists — will overwrite.")
-
+    # /Create /F overwrites an existing task, so no existence probe is needed
     create_task(args.time)
 
 